@@ -0,0 +1,26 @@
+"""Shared configuration of the benchmarks.
+
+Saved benchmark runs - see the "Running the benchmarks" section of the README
+- record the commit they were run at; the versions of utilitime and of its
+optional dependencies, and the timezone backend used, are recorded as part
+of the machine info, so that runs are only compared with comparable ones.
+"""
+
+import utilitime
+from utilitime.timezone import get_timezone_backend
+
+
+def _version(module_name):
+    try:
+        return __import__(module_name).__version__
+    except ImportError:
+        return None
+
+
+def pytest_benchmark_update_machine_info(config, machine_info):
+    machine_info['utilitime'] = {
+        'version': utilitime.__version__,
+        'timezone_backend': get_timezone_backend().name,
+        'numpy': _version('numpy'),
+        'pytz': _version('pytz'),
+    }
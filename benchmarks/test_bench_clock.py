@@ -0,0 +1,65 @@
+"""Benchmarks of the clock subpackage, and of functions using the clock.
+
+Run with ``python -m pytest benchmarks`` (requires pytest-benchmark).
+"""
+
+from datetime import datetime
+
+import pytest
+
+from utilitime.clock import (
+    Clock,
+    SystemClock,
+    ManualClock,
+    get_clock,
+    set_clock,
+)
+from utilitime.datetime import (
+    datetime_to_dateint,
+    utc_time,
+)
+from utilitime.dateint import today_int
+
+CALLS = range(10000)
+
+
+@pytest.fixture(params=['system', 'manual'])
+def clock(request):
+    previous = get_clock()
+    set_clock(ManualClock(1506984924) if request.param == 'manual' else (
+        request.param))
+    yield get_clock()
+    set_clock(previous)
+
+
+@pytest.mark.benchmark(group='clock_time')
+def test_clock_time(benchmark, clock):
+    benchmark(lambda: [clock.time() for _ in CALLS])
+
+
+@pytest.mark.benchmark(group='clock_utc_time')
+def test_utc_time(benchmark, clock):
+    assert isinstance(clock, Clock)
+    benchmark(lambda: [utc_time() for _ in CALLS])
+
+
+@pytest.mark.benchmark(group='clock_utc_time')
+def test_utcnow_baseline(benchmark):
+    benchmark(lambda: [datetime.utcnow() for _ in CALLS])
+
+
+@pytest.mark.benchmark(group='clock_today_int')
+def test_today_int(benchmark, clock):
+    benchmark(lambda: [today_int() for _ in CALLS])
+
+
+@pytest.mark.benchmark(group='clock_today_int')
+def test_today_int_utcnow_baseline(benchmark):
+    """The way today_int used to compute the dateint of the current day."""
+    benchmark(lambda: [
+        datetime_to_dateint(datetime.utcnow()) for _ in CALLS])
+
+
+@pytest.mark.benchmark(group='clock_construction')
+def test_clock_construction(benchmark):
+    benchmark(lambda: (SystemClock(), ManualClock()))
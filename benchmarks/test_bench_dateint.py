@@ -0,0 +1,283 @@
+"""Benchmarks of the dateint subpackage.
+
+Run with ``python -m pytest benchmarks`` (requires pytest-benchmark).
+"""
+
+from datetime import datetime, timedelta
+import random
+
+import pytest
+
+from utilitime.datetime import datetime_to_dateint
+from utilitime.dateint import (
+    is_valid_dateint,
+    decompose_dateint,
+    dateint_to_date,
+    dateint_to_timestamp,
+    dateint_to_utc_timestamp,
+    dateint_to_datetime,
+    dateint_to_weekday,
+    dateint_to_weekday_name,
+    shift_dateint,
+    dateint_difference,
+    dateint_range,
+    DateintRange,
+    today_int,
+    dateint_week_by_dateint,
+    use_calendar_table,
+    tz_aware_dateint_to_timestamp,
+    tz_aware_dateint_range_bounds,
+    validate_dateints,
+    decompose_dateints,
+    dateints_to_dates,
+    dateints_to_datetimes,
+    dateints_to_utc_timestamps,
+    dateints_to_weekdays,
+    dateints_to_weekday_names,
+    CalendarTable,
+    get_calendar_table,
+)
+from utilitime.dateint.dateint import _day_bounds
+
+
+def _random_dateints(count, seed=0):
+    rand = random.Random(seed)
+    first = datetime(1990, 1, 1)
+    return [
+        datetime_to_dateint(first + timedelta(days=rand.randrange(15000)))
+        for _ in range(count)
+    ]
+
+
+DATEINTS = _random_dateints(1000)
+_SHIFT_RAND = random.Random(1)
+SHIFTS = [_SHIFT_RAND.randrange(-400, 400) for _ in DATEINTS]
+LOOKBACKS = [-(i % 7) - 1 for i, _ in enumerate(DATEINTS)]
+
+
+def _datetime_shift_dateint(dateint, day_shift):
+    """The datetime-based implementation shift_dateint used to have."""
+    if len(str(dateint)) != 8:
+        raise ValueError('Bad dateint')
+    year = int(dateint / 10000)
+    leftover = dateint - year * 10000
+    month = int(leftover / 100)
+    dtime = datetime(year=year, month=month, day=leftover - month * 100)
+    delta = timedelta(days=abs(day_shift))
+    if day_shift > 0:
+        dtime = dtime + delta
+    else:
+        dtime = dtime - delta
+    return datetime_to_dateint(dtime)
+
+
+def _shift_all(func, shifts):
+    for dateint, day_shift in zip(DATEINTS, shifts):
+        func(dateint, day_shift)
+
+
+@pytest.mark.benchmark(group='shift_dateint')
+def test_shift_dateint(benchmark):
+    benchmark(_shift_all, shift_dateint, SHIFTS)
+
+
+@pytest.mark.benchmark(group='shift_dateint')
+def test_shift_dateint_datetime_baseline(benchmark):
+    benchmark(_shift_all, _datetime_shift_dateint, SHIFTS)
+
+
+@pytest.mark.benchmark(group='shift_dateint_lookback')
+def test_shift_dateint_lookback(benchmark):
+    benchmark(_shift_all, shift_dateint, LOOKBACKS)
+
+
+@pytest.mark.benchmark(group='shift_dateint_lookback')
+def test_shift_dateint_lookback_datetime_baseline(benchmark):
+    benchmark(_shift_all, _datetime_shift_dateint, LOOKBACKS)
+
+
+@pytest.mark.benchmark(group='dateint_difference')
+def test_dateint_difference(benchmark):
+    benchmark(lambda: [
+        dateint_difference(dateint, 20170101) for dateint in DATEINTS])
+
+
+@pytest.mark.benchmark(group='dateint_range')
+def test_dateint_range_30_years(benchmark):
+    benchmark(dateint_range, 19900101, 20191231)
+
+
+@pytest.mark.benchmark(group='dateint_range')
+def test_dateint_range_object_30_years(benchmark):
+    benchmark(lambda: len(DateintRange(19900101, 20191231)))
+
+
+@pytest.fixture
+def calendar_table_enabled():
+    use_calendar_table()
+    yield
+    use_calendar_table(False)
+
+
+@pytest.mark.benchmark(group='shift_dateint')
+@pytest.mark.usefixtures('calendar_table_enabled')
+def test_shift_dateint_calendar_table(benchmark):
+    benchmark(_shift_all, shift_dateint, SHIFTS)
+
+
+@pytest.mark.benchmark(group='dateint_range_bounds')
+def test_tz_aware_dateint_range_bounds_uncached(benchmark):
+    pytest.importorskip('numpy')
+
+    def bounds():
+        _day_bounds.cache_clear()
+        return tz_aware_dateint_range_bounds(
+            20100101, 20191231, 'America/New_York')
+    benchmark(bounds)
+
+
+@pytest.mark.benchmark(group='dateint_range_bounds')
+def test_tz_aware_dateint_range_bounds_one_by_one(benchmark):
+    benchmark(lambda: [
+        tz_aware_dateint_to_timestamp(dateint, 'America/New_York')
+        for dateint in dateint_range(20100101, 20200101)])
+
+
+# === per-dateint functions ===
+
+# about one in ten dateints is invalid, as in unvalidated user input
+MIXED_DATEINTS = [
+    dateint + 30 if ix % 10 == 0 else dateint
+    for ix, dateint in enumerate(DATEINTS)]
+
+
+@pytest.mark.benchmark(group='is_valid_dateint')
+def test_is_valid_dateint(benchmark):
+    benchmark(lambda: [
+        is_valid_dateint(dateint) for dateint in MIXED_DATEINTS])
+
+
+@pytest.mark.benchmark(group='decompose_dateint')
+def test_decompose_dateint(benchmark):
+    benchmark(lambda: [decompose_dateint(dateint) for dateint in DATEINTS])
+
+
+@pytest.mark.benchmark(group='dateint_to_date')
+def test_dateint_to_date(benchmark):
+    benchmark(lambda: [dateint_to_date(dateint) for dateint in DATEINTS])
+
+
+@pytest.mark.benchmark(group='dateint_to_datetime')
+def test_dateint_to_datetime(benchmark):
+    benchmark(lambda: [dateint_to_datetime(dateint) for dateint in DATEINTS])
+
+
+@pytest.mark.benchmark(group='dateint_to_timestamp')
+def test_dateint_to_timestamp(benchmark):
+    benchmark(lambda: [
+        dateint_to_timestamp(dateint) for dateint in DATEINTS])
+
+
+@pytest.mark.benchmark(group='dateint_to_timestamp')
+def test_dateint_to_utc_timestamp(benchmark):
+    benchmark(lambda: [
+        dateint_to_utc_timestamp(dateint) for dateint in DATEINTS])
+
+
+@pytest.mark.benchmark(group='dateint_to_timestamp')
+def test_tz_aware_dateint_to_timestamp(benchmark):
+    benchmark(lambda: [
+        tz_aware_dateint_to_timestamp(dateint, 'America/New_York')
+        for dateint in DATEINTS])
+
+
+@pytest.mark.benchmark(group='dateint_to_weekday')
+def test_dateint_to_weekday(benchmark):
+    benchmark(lambda: [dateint_to_weekday(dateint) for dateint in DATEINTS])
+
+
+@pytest.mark.benchmark(group='dateint_to_weekday')
+def test_dateint_to_weekday_sunday_first(benchmark):
+    benchmark(lambda: [
+        dateint_to_weekday(dateint, 'Sunday') for dateint in DATEINTS])
+
+
+@pytest.mark.benchmark(group='dateint_to_weekday')
+def test_dateint_to_weekday_name(benchmark):
+    benchmark(lambda: [
+        dateint_to_weekday_name(dateint) for dateint in DATEINTS])
+
+
+@pytest.mark.benchmark(group='dateint_week_by_dateint')
+def test_dateint_week_by_dateint(benchmark):
+    benchmark(lambda: [
+        dateint_week_by_dateint(dateint) for dateint in DATEINTS[:100]])
+
+
+@pytest.mark.benchmark(group='today_int')
+def test_today_int(benchmark):
+    benchmark(today_int)
+
+
+@pytest.mark.benchmark(group='dateint_range')
+def test_dateint_range_object_lookups(benchmark):
+    days = DateintRange(19900101, 20311231)
+    benchmark(lambda: [days.index(dateint) for dateint in DATEINTS])
+
+
+# === calendar tables ===
+
+@pytest.mark.benchmark(group='calendar_table')
+def test_calendar_table_construction(benchmark):
+    benchmark(CalendarTable)
+
+
+@pytest.mark.benchmark(group='calendar_table')
+def test_calendar_table_lookups(benchmark):
+    table = get_calendar_table()
+    benchmark(lambda: [
+        (table.weekday(dateint), table.day_of_year(dateint),
+         table.iso_week(dateint)) for dateint in DATEINTS])
+
+
+# === array-aware functions ===
+
+@pytest.fixture(scope='module')
+def dateint_array():
+    np = pytest.importorskip('numpy')
+    return np.array(_random_dateints(100000, seed=2), dtype=np.int32)
+
+
+@pytest.mark.benchmark(group='validate_dateints')
+def test_validate_dateints(benchmark, dateint_array):
+    benchmark(validate_dateints, dateint_array)
+
+
+@pytest.mark.benchmark(group='decompose_dateints')
+def test_decompose_dateints(benchmark, dateint_array):
+    benchmark(decompose_dateints, dateint_array)
+
+
+@pytest.mark.benchmark(group='dateints_to_dates')
+def test_dateints_to_dates(benchmark, dateint_array):
+    benchmark(dateints_to_dates, dateint_array)
+
+
+@pytest.mark.benchmark(group='dateints_to_dates')
+def test_dateints_to_datetimes(benchmark, dateint_array):
+    benchmark(dateints_to_datetimes, dateint_array)
+
+
+@pytest.mark.benchmark(group='dateints_to_utc_timestamps')
+def test_dateints_to_utc_timestamps(benchmark, dateint_array):
+    benchmark(dateints_to_utc_timestamps, dateint_array)
+
+
+@pytest.mark.benchmark(group='dateints_to_weekdays')
+def test_dateints_to_weekdays(benchmark, dateint_array):
+    benchmark(dateints_to_weekdays, dateint_array)
+
+
+@pytest.mark.benchmark(group='dateints_to_weekdays')
+def test_dateints_to_weekday_names(benchmark, dateint_array):
+    benchmark(dateints_to_weekday_names, dateint_array)
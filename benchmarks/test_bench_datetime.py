@@ -0,0 +1,84 @@
+"""Benchmarks of the datetime subpackage.
+
+Run with ``python -m pytest benchmarks`` (requires pytest-benchmark).
+"""
+
+from datetime import datetime, timedelta
+import random
+
+import pytest
+import pytz
+
+from utilitime.datetime import (
+    epoch_datetime,
+    utc_time,
+    utc_offset_by_timezone,
+    get_utc_offset,
+    get_utc_offsets,
+    localize_datetime,
+    datetime_to_dateint,
+    local_datetime_to_timestamp,
+    utc_datetime_to_timestamp,
+)
+
+# a month of log events, as naive UTC datetime objects
+_RAND = random.Random(0)
+TIMESTAMPS = sorted(
+    _RAND.randrange(1506816000, 1509494400) for _ in range(10000))
+UTC_DATETIMES = [
+    datetime(1970, 1, 1) + timedelta(seconds=timestamp)
+    for timestamp in TIMESTAMPS]
+TIMEZONES = pytz.common_timezones[:300]
+
+
+@pytest.mark.benchmark(group='epoch_datetime')
+def test_epoch_datetime(benchmark):
+    benchmark(epoch_datetime)
+
+
+@pytest.mark.benchmark(group='utc_time')
+def test_utc_time(benchmark):
+    benchmark(utc_time)
+
+
+@pytest.mark.benchmark(group='utc_offset')
+def test_utc_offset_by_timezone(benchmark):
+    benchmark(lambda: [
+        utc_offset_by_timezone(timezone_name)
+        for timezone_name in TIMEZONES])
+
+
+@pytest.mark.benchmark(group='utc_offset')
+def test_get_utc_offset_at_timestamps(benchmark):
+    benchmark(lambda: [
+        get_utc_offset('Asia/Jerusalem', timestamp)
+        for timestamp in TIMESTAMPS])
+
+
+@pytest.mark.benchmark(group='utc_offset')
+def test_get_utc_offsets(benchmark):
+    benchmark(get_utc_offsets, TIMEZONES, 1508000000, 'minutes')
+
+
+@pytest.mark.benchmark(group='localize_datetime')
+def test_localize_datetime(benchmark):
+    benchmark(lambda: [
+        localize_datetime(dtime, 'Asia/Jerusalem') for dtime in UTC_DATETIMES])
+
+
+@pytest.mark.benchmark(group='datetime_to_dateint')
+def test_datetime_to_dateint(benchmark):
+    benchmark(lambda: [
+        datetime_to_dateint(dtime) for dtime in UTC_DATETIMES])
+
+
+@pytest.mark.benchmark(group='datetime_to_timestamp')
+def test_local_datetime_to_timestamp(benchmark):
+    benchmark(lambda: [
+        local_datetime_to_timestamp(dtime) for dtime in UTC_DATETIMES])
+
+
+@pytest.mark.benchmark(group='datetime_to_timestamp')
+def test_utc_datetime_to_timestamp(benchmark):
+    benchmark(lambda: [
+        utc_datetime_to_timestamp(dtime) for dtime in UTC_DATETIMES])
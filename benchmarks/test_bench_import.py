@@ -0,0 +1,39 @@
+"""Benchmarks of the import time of utilitime.
+
+Run with ``python -m pytest benchmarks`` (requires pytest-benchmark). Each
+round starts a fresh interpreter, so the interpreter startup benchmark is the
+baseline to subtract from the others; tests/test_import_time.py guards which
+modules each import pulls in.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import utilitime
+
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(utilitime.__file__))
+
+
+def _run_python(statement):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [
+        _PACKAGE_ROOT, env.get('PYTHONPATH')]))
+    subprocess.run([sys.executable, '-c', statement], env=env, check=True)
+
+
+@pytest.mark.parametrize('statement', [
+    'pass',
+    'import utilitime',
+    'from utilitime import TimeInterval, constants',
+    'import utilitime.timestamp',
+    'import utilitime.dateint',
+    # everything utilitime used to import eagerly
+    'import utilitime.dateint, utilitime.datetime, utilitime.time, '
+    'utilitime.timestamp, utilitime.weekday; utilitime.__version__',
+])
+@pytest.mark.benchmark(group='import')
+def test_import(benchmark, statement):
+    benchmark.pedantic(_run_python, args=(statement,), rounds=20)
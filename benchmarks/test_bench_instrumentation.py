@@ -0,0 +1,54 @@
+"""Benchmarks of the overhead of instrumenting utilitime functions.
+
+Run with ``python -m pytest benchmarks`` (requires pytest-benchmark).
+"""
+
+import pytest
+
+import utilitime
+from utilitime.instrumentation import (
+    use_instrumentation,
+    reset_instrumentation,
+    instrumentation_snapshot,
+    instrumentation_to_prometheus,
+)
+
+DATEINTS = [20170101 + ix for ix in range(28)] * 100
+
+
+def _shift_all():
+    shift_dateint = utilitime.dateint.shift_dateint
+    return [shift_dateint(dateint, 1) for dateint in DATEINTS]
+
+
+@pytest.fixture
+def instrumentation():
+    use_instrumentation()
+    yield
+    use_instrumentation(False)
+    reset_instrumentation()
+
+
+@pytest.mark.benchmark(group='instrumentation_overhead')
+def test_uninstrumented(benchmark):
+    benchmark(_shift_all)
+
+
+@pytest.mark.benchmark(group='instrumentation_overhead')
+@pytest.mark.usefixtures('instrumentation')
+def test_instrumented(benchmark):
+    benchmark(_shift_all)
+
+
+@pytest.mark.benchmark(group='instrumentation_export')
+@pytest.mark.usefixtures('instrumentation')
+def test_instrumentation_snapshot(benchmark):
+    _shift_all()
+    benchmark(instrumentation_snapshot)
+
+
+@pytest.mark.benchmark(group='instrumentation_export')
+@pytest.mark.usefixtures('instrumentation')
+def test_instrumentation_to_prometheus(benchmark):
+    _shift_all()
+    benchmark(instrumentation_to_prometheus)
@@ -0,0 +1,55 @@
+"""Benchmarks of memoized conversion functions.
+
+Run with ``python -m pytest benchmarks`` (requires pytest-benchmark).
+"""
+
+import random
+
+import pytest
+
+from utilitime.dateint import (
+    dateint_range,
+    dateint_to_timestamp,
+    tz_aware_dateint_to_timestamp,
+    dateint_to_weekday,
+)
+from utilitime.memoization import (
+    use_memoization,
+    memoization_info,
+)
+
+# a workload converting the same few thousand (timezone, dateint) pairs
+_RAND = random.Random(0)
+_DATEINTS = list(dateint_range(20150101, 20191231))
+_TIMEZONES = ['America/New_York', 'Europe/London', 'Asia/Jerusalem']
+PAIRS = [
+    (_RAND.choice(_DATEINTS), _RAND.choice(_TIMEZONES))
+    for _ in range(10000)]
+
+
+@pytest.fixture(params=[False, True], ids=['plain', 'memoized'])
+def memoization(request):
+    use_memoization(request.param)
+    yield request.param
+    use_memoization(False)
+
+
+@pytest.mark.benchmark(group='memoized_tz_aware_dateint_to_timestamp')
+def test_tz_aware_dateint_to_timestamp(benchmark, memoization):
+    benchmark(lambda: [
+        tz_aware_dateint_to_timestamp(dateint, timezone_name)
+        for dateint, timezone_name in PAIRS])
+
+
+@pytest.mark.benchmark(group='memoized_dateint_to_timestamp')
+def test_dateint_to_timestamp(benchmark, memoization):
+    benchmark(lambda: [
+        dateint_to_timestamp(dateint) for dateint, _ in PAIRS])
+
+
+@pytest.mark.benchmark(group='memoized_dateint_to_weekday')
+def test_dateint_to_weekday(benchmark, memoization):
+    benchmark(lambda: [
+        dateint_to_weekday(dateint, 'Sunday') for dateint, _ in PAIRS])
+    if memoization:
+        assert memoization_info()['dateint_to_weekday'].hits
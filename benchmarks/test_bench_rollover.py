@@ -0,0 +1,65 @@
+"""Benchmarks of the rollover subpackage.
+
+Run with ``python -m pytest benchmarks`` (requires pytest-benchmark).
+"""
+
+import pytest
+import pytz
+
+from utilitime.clock import ManualClock
+from utilitime.constants import SECONDS_IN_DAY
+from utilitime.rollover import (
+    day_start,
+    RolloverSchedule,
+    RolloverNotifier,
+    AsyncRolloverNotifier,
+)
+
+TIMEZONES = pytz.common_timezones
+START = 1488294000
+
+
+def _full_schedule(clock):
+    schedule = RolloverSchedule(clock)
+    for timezone_name in TIMEZONES:
+        schedule.add(timezone_name)
+    return schedule
+
+
+@pytest.mark.benchmark(group='rollover_day_start')
+def test_day_start(benchmark):
+    benchmark(lambda: [
+        day_start(20170301, timezone_name) for timezone_name in TIMEZONES])
+
+
+@pytest.mark.benchmark(group='rollover_schedule')
+def test_schedule_all_timezones(benchmark):
+    benchmark(_full_schedule, ManualClock(START))
+
+
+@pytest.mark.benchmark(group='rollover_schedule')
+def test_pop_due_day_of_all_timezones(benchmark):
+    def setup():
+        clock = ManualClock(START)
+        return (_full_schedule(clock), START + SECONDS_IN_DAY), {}
+
+    benchmark.pedantic(
+        lambda schedule, now: schedule.pop_due(now), setup=setup, rounds=20)
+
+
+@pytest.mark.benchmark(group='rollover_schedule')
+def test_next_rollover(benchmark):
+    schedule = _full_schedule(ManualClock(START))
+    benchmark(lambda: [schedule.next_rollover() for _ in range(10000)])
+
+
+@pytest.mark.benchmark(group='rollover_notifier')
+def test_notifier_subscribe_all_timezones(benchmark):
+    def subscribe_all(notifier_class):
+        notifier = notifier_class(ManualClock(START))
+        for timezone_name in TIMEZONES:
+            notifier.subscribe(timezone_name, print)
+        return notifier
+
+    benchmark(lambda: (
+        subscribe_all(RolloverNotifier), subscribe_all(AsyncRolloverNotifier)))
@@ -0,0 +1,52 @@
+"""Benchmarks of the time subpackage.
+
+Run with ``python -m pytest benchmarks`` (requires pytest-benchmark).
+"""
+
+import random
+
+import pytest
+
+from utilitime.time import (
+    decompose_seconds_in_day,
+    decompose_seconds_in_days,
+    seconds_in_day_to_time,
+    minutes_in_day_to_time,
+)
+
+# times of day of events, uniformly spread over the day
+_RAND = random.Random(0)
+SECONDS = [_RAND.randrange(86400) for _ in range(10000)]
+MINUTES = [second // 60 for second in SECONDS]
+# a schedule's few hundred slot times, converted over and over
+SLOTS = [_RAND.choice(range(0, 86400, 300)) for _ in range(10000)]
+
+
+@pytest.mark.benchmark(group='decompose_seconds_in_day')
+def test_decompose_seconds_in_day(benchmark):
+    benchmark(lambda: [
+        decompose_seconds_in_day(seconds) for seconds in SECONDS])
+
+
+@pytest.mark.benchmark(group='in_day_to_time')
+def test_seconds_in_day_to_time(benchmark):
+    benchmark(lambda: [
+        seconds_in_day_to_time(seconds) for seconds in SECONDS])
+
+
+@pytest.mark.benchmark(group='in_day_to_time')
+def test_minutes_in_day_to_time(benchmark):
+    benchmark(lambda: [
+        minutes_in_day_to_time(minutes) for minutes in MINUTES])
+
+
+@pytest.mark.benchmark(group='in_day_to_time')
+def test_seconds_in_day_to_time_slots(benchmark):
+    benchmark(lambda: [seconds_in_day_to_time(seconds) for seconds in SLOTS])
+
+
+@pytest.mark.benchmark(group='decompose_seconds_in_days')
+def test_decompose_seconds_in_days(benchmark):
+    np = pytest.importorskip('numpy')
+    seconds = np.array(SECONDS * 10)
+    benchmark(decompose_seconds_in_days, seconds)
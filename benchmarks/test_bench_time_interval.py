@@ -0,0 +1,40 @@
+"""Benchmarks of the TimeInterval class.
+
+Run with ``python -m pytest benchmarks`` (requires pytest-benchmark).
+"""
+
+from datetime import datetime, timedelta
+import random
+
+import pytest
+
+from utilitime import TimeInterval
+
+_RAND = random.Random(0)
+_FIRST = datetime(2017, 10, 1)
+DATETIMES = [
+    _FIRST + timedelta(seconds=_RAND.randrange(2678400))
+    for _ in range(10000)]
+# session lengths of up to a day, some of them given backwards
+DURATIONS = [
+    timedelta(seconds=_RAND.randrange(-3600, 86400)) for _ in DATETIMES]
+
+
+@pytest.mark.benchmark(group='time_interval_construction')
+def test_time_interval(benchmark):
+    benchmark(lambda: [
+        TimeInterval(dtime, dtime + timedelta(hours=1))
+        for dtime in DATETIMES])
+
+
+@pytest.mark.benchmark(group='time_interval_construction')
+def test_time_interval_from_timedelta(benchmark):
+    benchmark(lambda: [
+        TimeInterval.from_timedelta(dtime, duration)
+        for dtime, duration in zip(DATETIMES, DURATIONS)])
+
+
+@pytest.mark.benchmark(group='time_interval_contains')
+def test_time_interval_contains(benchmark):
+    interval = TimeInterval(datetime(2017, 10, 8), datetime(2017, 10, 15))
+    benchmark(lambda: [dtime in interval for dtime in DATETIMES])
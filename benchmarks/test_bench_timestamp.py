@@ -0,0 +1,220 @@
+"""Benchmarks of the timestamp subpackage.
+
+Run with ``python -m pytest benchmarks`` (requires pytest-benchmark).
+"""
+
+from datetime import datetime, timedelta
+import calendar
+import random
+
+import pytest
+import pytz
+
+from utilitime.timestamp import (
+    timestamp_to_local_time,
+    timestamp_to_local_time_str,
+    timestamps_to_local_time_strs,
+    use_local_time_str_cache,
+    local_time_str_cache_info,
+    timestamp_to_dateint,
+    timestamps_to_dateints,
+    get_timestamp,
+    timestamp_to_datetime,
+    tz_aware_dt_from_timestamp_and_tz,
+    timestamp_to_local_datetime,
+    timestamps_to_local_times,
+    timestamps_to_local_dateints,
+    tz_aware_timestamps_to_dateints,
+)
+
+# a month of log events, about one every 2.6 seconds
+_RAND = random.Random(0)
+TIMESTAMPS = sorted(
+    _RAND.randrange(1506816000, 1509494400) for _ in range(1000000))
+# bursts of access log events, about 20 per second
+BURSTY_TIMESTAMPS = sorted(
+    1506984924 + _RAND.random() * 50 for _ in range(1000))
+
+
+def _utcfromtimestamp_to_dateint(timestamp):
+    """The datetime-based implementation timestamp_to_dateint used to have."""
+    dtime = datetime.utcfromtimestamp(timestamp)
+    return dtime.year * 10000 + dtime.month * 100 + dtime.day
+
+
+@pytest.mark.benchmark(group='timestamp_to_dateint')
+def test_timestamp_to_dateint(benchmark):
+    benchmark(lambda: [
+        timestamp_to_dateint(timestamp) for timestamp in TIMESTAMPS[:10000]])
+
+
+@pytest.mark.benchmark(group='timestamp_to_dateint')
+def test_timestamp_to_dateint_datetime_baseline(benchmark):
+    benchmark(lambda: [
+        _utcfromtimestamp_to_dateint(timestamp)
+        for timestamp in TIMESTAMPS[:10000]])
+
+
+@pytest.mark.benchmark(group='timestamps_to_dateints')
+def test_timestamps_to_dateints(benchmark):
+    np = pytest.importorskip('numpy')
+    timestamps = np.array(TIMESTAMPS, dtype=np.int64)
+    benchmark(timestamps_to_dateints, timestamps)
+
+
+@pytest.mark.benchmark(group='timestamps_to_dateints')
+def test_timestamps_to_dateints_ms(benchmark):
+    np = pytest.importorskip('numpy')
+    timestamps = np.array(TIMESTAMPS, dtype=np.int64) * 1000
+    benchmark(timestamps_to_dateints, timestamps, 'ms')
+
+
+@pytest.mark.benchmark(group='timestamps_to_dateints')
+def test_timestamps_to_dateints_datetime64(benchmark):
+    np = pytest.importorskip('numpy')
+    timestamps = np.array(TIMESTAMPS, dtype='datetime64[s]').astype(
+        'datetime64[ns]')
+    benchmark(timestamps_to_dateints, timestamps)
+
+
+@pytest.mark.benchmark(group='timestamp_to_local_time_str')
+def test_timestamp_to_local_time_str(benchmark):
+    benchmark(lambda: [
+        timestamp_to_local_time_str(timestamp, 'Asia/Jerusalem')
+        for timestamp in TIMESTAMPS[:1000]])
+
+
+@pytest.mark.benchmark(group='timestamp_to_local_time_str')
+def test_timestamp_to_local_time_str_delorean_baseline(benchmark):
+    benchmark(lambda: [
+        timestamp_to_local_time(timestamp, 'Asia/Jerusalem').format_datetime(
+            'yyyy-MM-dd HH:mm:ss') for timestamp in TIMESTAMPS[:1000]])
+
+
+@pytest.mark.benchmark(group='timestamp_to_local_time_str')
+def test_timestamps_to_local_time_strs(benchmark):
+    benchmark(
+        timestamps_to_local_time_strs, TIMESTAMPS[:1000], 'Asia/Jerusalem')
+
+
+@pytest.fixture
+def local_time_str_cache():
+    use_local_time_str_cache()
+    yield
+    use_local_time_str_cache(False)
+
+
+def _format_bursty():
+    return [
+        timestamp_to_local_time_str(
+            timestamp, 'Asia/Jerusalem', 'yyyy-MM-dd HH:mm:ss.SSS')
+        for timestamp in BURSTY_TIMESTAMPS]
+
+
+@pytest.mark.benchmark(group='timestamp_to_local_time_str_bursty')
+def test_timestamp_to_local_time_str_bursty(benchmark):
+    benchmark(_format_bursty)
+
+
+@pytest.mark.benchmark(group='timestamp_to_local_time_str_bursty')
+@pytest.mark.usefixtures('local_time_str_cache')
+def test_timestamp_to_local_time_str_bursty_second_cache(benchmark):
+    benchmark(_format_bursty)
+    assert local_time_str_cache_info().hits
+
+
+# local times of every hour in a year, in a timezone observing DST
+LOCAL_TIMES = [
+    datetime(2017, 1, 1) + timedelta(hours=hours) for hours in range(8760)]
+
+
+def _pytz_get_timestamp(timezone_name, year, month, day, hour=0, minute=0):
+    """The pytz-based implementation get_timestamp used to have."""
+    tz = pytz.timezone(timezone_name)
+    tz_datetime = tz.localize(datetime(year, month, day, hour, minute))
+    return calendar.timegm(tz_datetime.utctimetuple())
+
+
+@pytest.mark.benchmark(group='get_timestamp')
+def test_get_timestamp(benchmark):
+    benchmark(lambda: [
+        get_timestamp(
+            'America/New_York', dtime.year, dtime.month, dtime.day,
+            dtime.hour)
+        for dtime in LOCAL_TIMES])
+
+
+@pytest.mark.benchmark(group='get_timestamp')
+def test_get_timestamp_pytz_baseline(benchmark):
+    benchmark(lambda: [
+        _pytz_get_timestamp(
+            'America/New_York', dtime.year, dtime.month, dtime.day,
+            dtime.hour)
+        for dtime in LOCAL_TIMES])
+
+
+@pytest.mark.benchmark(group='timestamps_to_local_dateints')
+def test_timestamps_to_local_dateints(benchmark):
+    np = pytest.importorskip('numpy')
+    timestamps = np.array(TIMESTAMPS, dtype=np.int64)
+    benchmark(timestamps_to_local_dateints, timestamps, 'America/New_York')
+
+
+@pytest.mark.benchmark(group='timestamps_to_local_dateints')
+def test_timestamps_to_local_dateints_datetime_baseline(benchmark):
+    # on a tenth of the timestamps, to keep the benchmark short
+    def localize_one_by_one():
+        dateints = []
+        for timestamp in TIMESTAMPS[:100000]:
+            local = timestamp_to_local_datetime(timestamp, 'America/New_York')
+            dateints.append(
+                local.year * 10000 + local.month * 100 + local.day)
+        return dateints
+    benchmark(localize_one_by_one)
+
+
+@pytest.mark.benchmark(group='tz_aware_timestamps_to_dateints')
+def test_tz_aware_timestamps_to_dateints(benchmark):
+    np = pytest.importorskip('numpy')
+    categories = pytz.common_timezones[:300]
+    timestamps = np.array(TIMESTAMPS, dtype=np.int64)
+    codes = np.random.RandomState(0).randint(
+        len(categories), size=timestamps.size)
+    benchmark(
+        tz_aware_timestamps_to_dateints, timestamps, codes,
+        categories=categories)
+
+
+@pytest.mark.benchmark(group='timestamps_to_local_times')
+def test_timestamps_to_local_times(benchmark):
+    np = pytest.importorskip('numpy')
+    timestamps = np.array(TIMESTAMPS, dtype=np.int64)
+    benchmark(timestamps_to_local_times, timestamps, 'America/New_York')
+
+
+@pytest.mark.benchmark(group='timestamp_to_datetime')
+def test_timestamp_to_datetime(benchmark):
+    benchmark(lambda: [
+        timestamp_to_datetime(timestamp) for timestamp in TIMESTAMPS[:10000]])
+
+
+@pytest.mark.benchmark(group='timestamp_to_local_datetime')
+def test_timestamp_to_local_datetime(benchmark):
+    benchmark(lambda: [
+        timestamp_to_local_datetime(timestamp, 'Asia/Jerusalem')
+        for timestamp in TIMESTAMPS[:10000]])
+
+
+@pytest.mark.benchmark(group='timestamp_to_local_datetime')
+def test_tz_aware_dt_from_timestamp_and_tz(benchmark):
+    benchmark(lambda: [
+        tz_aware_dt_from_timestamp_and_tz(timestamp, 'Asia/Jerusalem')
+        for timestamp in TIMESTAMPS[:10000]])
+
+
+@pytest.mark.benchmark(group='timestamp_to_local_time')
+def test_timestamp_to_local_time(benchmark):
+    pytest.importorskip('delorean')
+    benchmark(lambda: [
+        timestamp_to_local_time(timestamp, 'Asia/Jerusalem')
+        for timestamp in TIMESTAMPS[:1000]])
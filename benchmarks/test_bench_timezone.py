@@ -0,0 +1,106 @@
+"""Benchmarks comparing the timezone backends on timezone-aware functions.
+
+Run with ``python -m pytest benchmarks`` (requires pytest-benchmark).
+"""
+
+from datetime import datetime, timedelta
+import random
+
+import pytest
+
+from utilitime.timezone import (
+    get_timezone,
+    get_timezone_backend,
+    set_timezone_backend,
+    TransitionTable,
+)
+from utilitime.timestamp import (
+    get_timestamp,
+    timestamp_to_local_datetime,
+    timestamp_to_local_time_str,
+)
+from utilitime.datetime import (
+    localize_datetime,
+    utc_offset_by_timezone,
+)
+from utilitime.dateint import tz_aware_dateint_to_timestamp
+
+TIMEZONE = 'America/New_York'
+_RAND = random.Random(0)
+TIMESTAMPS = [_RAND.randrange(1483228800, 1514764800) for _ in range(10000)]
+UTC_DATETIMES = [
+    datetime(1970, 1, 1) + timedelta(seconds=timestamp)
+    for timestamp in TIMESTAMPS]
+LOCAL_TIMES = [
+    datetime(2017, 1, 1) + timedelta(hours=hours) for hours in range(8760)]
+DATEINTS = sorted(set(
+    dtime.year * 10000 + dtime.month * 100 + dtime.day
+    for dtime in UTC_DATETIMES))
+
+BACKENDS = ['pytz', 'zoneinfo']
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    if request.param == 'zoneinfo':
+        pytest.importorskip('zoneinfo')
+    previous = get_timezone_backend()
+    set_timezone_backend(request.param)
+    # compile the transition table outside of the measured calls
+    get_timestamp(TIMEZONE, 2017, 1, 1)
+    yield request.param
+    set_timezone_backend(previous)
+
+
+@pytest.mark.benchmark(group='backend_tzinfo_fromtimestamp')
+def test_tzinfo_fromtimestamp(benchmark, backend):
+    tz = get_timezone(TIMEZONE)
+    fromtimestamp = datetime.fromtimestamp
+    benchmark(lambda: [
+        fromtimestamp(timestamp, tz) for timestamp in TIMESTAMPS])
+
+
+@pytest.mark.benchmark(group='backend_compile_transitions')
+def test_compile_transition_table(benchmark, backend):
+    benchmark(TransitionTable.from_tzinfo, get_timezone(TIMEZONE))
+
+
+@pytest.mark.benchmark(group='backend_get_timestamp')
+def test_get_timestamp(benchmark, backend):
+    benchmark(lambda: [
+        get_timestamp(
+            TIMEZONE, dtime.year, dtime.month, dtime.day, dtime.hour)
+        for dtime in LOCAL_TIMES])
+
+
+@pytest.mark.benchmark(group='backend_tz_aware_dateint_to_timestamp')
+def test_tz_aware_dateint_to_timestamp(benchmark, backend):
+    benchmark(lambda: [
+        tz_aware_dateint_to_timestamp(dateint, TIMEZONE)
+        for dateint in DATEINTS])
+
+
+@pytest.mark.benchmark(group='backend_timestamp_to_local_datetime')
+def test_timestamp_to_local_datetime(benchmark, backend):
+    benchmark(lambda: [
+        timestamp_to_local_datetime(timestamp, TIMEZONE)
+        for timestamp in TIMESTAMPS])
+
+
+@pytest.mark.benchmark(group='backend_timestamp_to_local_time_str')
+def test_timestamp_to_local_time_str(benchmark, backend):
+    benchmark(lambda: [
+        timestamp_to_local_time_str(timestamp, TIMEZONE)
+        for timestamp in TIMESTAMPS])
+
+
+@pytest.mark.benchmark(group='backend_localize_datetime')
+def test_localize_datetime(benchmark, backend):
+    benchmark(lambda: [
+        localize_datetime(dtime, TIMEZONE) for dtime in UTC_DATETIMES])
+
+
+@pytest.mark.benchmark(group='backend_utc_offset_by_timezone')
+def test_utc_offset_by_timezone(benchmark, backend):
+    benchmark(lambda: [
+        utc_offset_by_timezone(TIMEZONE) for _ in range(10000)])
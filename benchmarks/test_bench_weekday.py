@@ -0,0 +1,43 @@
+"""Benchmarks of the weekday subpackage.
+
+Run with ``python -m pytest benchmarks`` (requires pytest-benchmark).
+"""
+
+import random
+
+import pytest
+
+from utilitime.constants import WEEKDAYS
+from utilitime.weekday import (
+    next_weekday,
+    prev_weekday,
+    workdays,
+    weekdays,
+)
+
+_RAND = random.Random(0)
+DAY_NAMES = [_RAND.choice(WEEKDAYS) for _ in range(10000)]
+# first days of the week, as configured by users in different locales
+FIRST_DAYS = [
+    _RAND.choice(['Monday', 'Sunday', 'sunday', 'Saturday'])
+    for _ in range(10000)]
+
+
+@pytest.mark.benchmark(group='next_prev_weekday')
+def test_next_weekday(benchmark):
+    benchmark(lambda: [next_weekday(day) for day in DAY_NAMES])
+
+
+@pytest.mark.benchmark(group='next_prev_weekday')
+def test_prev_weekday(benchmark):
+    benchmark(lambda: [prev_weekday(day) for day in DAY_NAMES])
+
+
+@pytest.mark.benchmark(group='week_names')
+def test_workdays(benchmark):
+    benchmark(lambda: [workdays(day) for day in FIRST_DAYS])
+
+
+@pytest.mark.benchmark(group='week_names')
+def test_weekdays(benchmark):
+    benchmark(lambda: [weekdays(day) for day in FIRST_DAYS])
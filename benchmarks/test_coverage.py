@@ -0,0 +1,48 @@
+"""Checks that every public utilitime function has a benchmark.
+
+A public function counts as covered if its name appears in any of the
+benchmark modules, so new functions fail this check until benchmarked.
+"""
+
+import importlib
+import inspect
+import os
+import re
+
+import pytest
+
+_BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+_SUBPACKAGES = [
+    'clock', 'dateint', 'datetime', 'rollover', 'time', 'timestamp',
+    'weekday']
+
+
+def _benchmark_sources():
+    sources = []
+    for file_name in sorted(os.listdir(_BENCHMARKS_DIR)):
+        if file_name.startswith('test_bench_') and file_name.endswith('.py'):
+            with open(os.path.join(_BENCHMARKS_DIR, file_name)) as bench_file:
+                sources.append(bench_file.read())
+    return '\n'.join(sources)
+
+
+def _public_names(subpackage_name):
+    subpackage = importlib.import_module('utilitime.' + subpackage_name)
+    return sorted(
+        name for name, obj in vars(subpackage).items()
+        if not name.startswith('_') and callable(obj)
+        and not inspect.ismodule(obj))
+
+
+@pytest.mark.parametrize('subpackage_name', _SUBPACKAGES)
+def test_every_public_function_is_benchmarked(subpackage_name):
+    sources = _benchmark_sources()
+    missing = [
+        name for name in _public_names(subpackage_name)
+        if not re.search(r'\b{}\b'.format(name), sources)]
+    assert not missing, 'No benchmarks of utilitime.{}: {}'.format(
+        subpackage_name, ', '.join(missing))
+
+
+def test_time_interval_is_benchmarked():
+    assert re.search(r'\bTimeInterval\b', _benchmark_sources())
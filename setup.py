@@ -16,10 +16,19 @@ with open('README.rst') as f:
     README_RST = f.read()
 
 INSTALL_REQUIRES = [
-    'pytz', 'delorean', 'decore'
+    'pytz',
+]
+NUMPY_REQUIRES = [
+    'numpy',
+]
+DELOREAN_REQUIRES = [
+    'delorean',
 ]
 TEST_REQUIRES = [
     'pytest>=4.6', 'coverage', 'pytest-cov==2.5.1',
+] + NUMPY_REQUIRES + DELOREAN_REQUIRES
+BENCH_REQUIRES = TEST_REQUIRES + [
+    'pytest-benchmark',
 ]
 
 
@@ -35,9 +44,13 @@ setup(
     url='https://github.com/shaypal5/utilitime',
     license="MIT",
     packages=find_packages(exclude=['dist', 'docs', 'tests']),
+    python_requires='>=3.7',
     install_requires=INSTALL_REQUIRES,
     extras_require={
-        'test': TEST_REQUIRES
+        'numpy': NUMPY_REQUIRES,
+        'delorean': DELOREAN_REQUIRES,
+        'test': TEST_REQUIRES,
+        'bench': BENCH_REQUIRES,
     },
     setup_requires=INSTALL_REQUIRES,
     platforms=['any'],
@@ -48,7 +61,6 @@ setup(
         'Development Status :: 4 - Beta',
         'License :: OSI Approved :: MIT License',
         'Programming Language :: Python',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8',
         'Programming Language :: Python :: 3.9',
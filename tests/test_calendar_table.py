@@ -0,0 +1,97 @@
+"""Testing the precomputed calendar lookup table."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from utilitime.dateint import (
+    CalendarTable,
+    get_calendar_table,
+    use_calendar_table,
+    shift_dateint,
+    dateint_difference,
+    dateint_to_weekday,
+    dateint_to_weekday_name,
+    dateint_week_by_dateint,
+    DateintRange,
+)
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _to_dateint(day):
+    return day.year * 10000 + day.month * 100 + day.day
+
+
+@pytest.mark.parametrize('first_year, last_year', [
+    (1900, 2199), (1601, 1605), (2024, 2024)])
+def test_calendar_table(first_year, last_year):
+    table = CalendarTable(first_year, last_year)
+    first = date(first_year, 1, 1)
+    assert table.first_ordinal == first.toordinal() - EPOCH_ORDINAL
+    assert len(table) == (date(last_year + 1, 1, 1) - first).days
+    for ix in range(0, len(table), 5):
+        day = first + timedelta(days=ix)
+        dateint = _to_dateint(day)
+        ordinal = day.toordinal() - EPOCH_ORDINAL
+        assert dateint in table
+        assert table.to_ordinal(dateint) == ordinal
+        assert table.to_dateint(ordinal) == dateint
+        assert table.weekday(dateint) == day.weekday()
+        assert table.day_of_year(dateint) == day.timetuple().tm_yday
+        assert table.iso_week(dateint) == day.isocalendar()[1]
+    assert table.month_length(first_year, 2) == (
+        date(first_year, 3, 1) - date(first_year, 2, 1)).days
+
+
+def test_calendar_table_out_of_range():
+    table = CalendarTable(2000, 2009)
+    for dateint in (19991231, 20100101, 20050229, 20051301, 20050000):
+        assert dateint not in table
+        with pytest.raises(KeyError):
+            table.to_ordinal(dateint)
+    with pytest.raises(KeyError):
+        table.to_dateint(table.last_ordinal + 1)
+    with pytest.raises(KeyError):
+        table.month_length(2010, 1)
+    with pytest.raises(ValueError):
+        CalendarTable(2010, 2009)
+
+
+def test_default_calendar_table():
+    table = get_calendar_table()
+    assert table is get_calendar_table()
+    assert (table.first_year, table.last_year) == (1900, 2199)
+    assert table.nbytes < 1024 * 1024
+
+
+@pytest.fixture
+def calendar_table_enabled():
+    use_calendar_table()
+    yield
+    use_calendar_table(False)
+
+
+@pytest.mark.usefixtures('calendar_table_enabled')
+def test_dateint_functions_with_calendar_table():
+    first = date(1890, 1, 1)
+    for delta in range(0, 120000, 23):
+        day = first + timedelta(days=delta)
+        dateint = _to_dateint(day)
+        for day_shift in (-400, -31, -1, 1, 29, 366):
+            assert shift_dateint(dateint, day_shift) == _to_dateint(
+                day + timedelta(days=day_shift))
+        assert dateint_difference(dateint, 20000101) == abs(
+            (day - date(2000, 1, 1)).days)
+        assert dateint_to_weekday(dateint) == day.weekday()
+        assert dateint_to_weekday_name(dateint) == day.strftime('%A')
+    with pytest.raises(OverflowError):
+        shift_dateint(99991231, 1)
+    assert dateint_week_by_dateint(20170215) == [
+        20170213, 20170214, 20170215, 20170216, 20170217, 20170218, 20170219]
+    assert list(DateintRange(20170225, 20170301)) == [
+        20170225, 20170226, 20170227, 20170228, 20170301]
+    with pytest.raises(ValueError):
+        shift_dateint(20170231, 1)
+    with pytest.raises(ValueError):
+        dateint_difference('20170101', 20170101)
@@ -0,0 +1,52 @@
+"""Testing the integer-only civil calendar arithmetic."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from utilitime._civil import (
+    days_from_civil,
+    civil_from_days,
+    dateint_to_ordinal,
+    ordinal_to_dateint,
+    dateints_to_ordinals,
+    ordinals_to_dateints,
+)
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _all_days(first=date(1599, 12, 1), count=160000):
+    for delta in range(0, count, 2):
+        day = first + timedelta(days=delta)
+        yield day, day.toordinal() - EPOCH_ORDINAL
+
+
+def test_days_from_civil():
+    """days_from_civil agrees with datetime.date.toordinal."""
+    for day, ordinal in _all_days():
+        assert days_from_civil(day.year, day.month, day.day) == ordinal
+
+
+def test_civil_from_days():
+    """civil_from_days agrees with datetime.date.fromordinal."""
+    for day, ordinal in _all_days():
+        assert civil_from_days(ordinal) == (day.year, day.month, day.day)
+
+
+def test_scalar_dateint_ordinals():
+    """The scalar specializations agree with datetime.date."""
+    for day, ordinal in _all_days():
+        dateint = day.year * 10000 + day.month * 100 + day.day
+        assert dateint_to_ordinal(dateint) == ordinal
+        assert ordinal_to_dateint(ordinal) == dateint
+
+
+def test_array_dateint_ordinals():
+    """The array versions agree with the scalar ones."""
+    np = pytest.importorskip('numpy')
+    ordinals = np.arange(-200000, 200000, 3, dtype=np.int64)
+    dateints = ordinals_to_dateints(ordinals)
+    assert dateints.tolist() == [
+        ordinal_to_dateint(ordinal) for ordinal in ordinals.tolist()]
+    assert (dateints_to_ordinals(dateints) == ordinals).all()
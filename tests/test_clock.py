@@ -0,0 +1,83 @@
+"""Testing the clock subpackage."""
+
+from datetime import datetime
+
+import pytest
+
+from utilitime.clock import (
+    Clock,
+    SystemClock,
+    ManualClock,
+    get_clock,
+    set_clock,
+)
+from utilitime.datetime import (
+    utc_time,
+    get_utc_offset,
+)
+from utilitime.dateint import today_int
+
+
+@pytest.fixture
+def restore_clock():
+    previous = get_clock()
+    yield
+    set_clock(previous)
+
+
+def test_system_clock_by_default():
+    assert isinstance(get_clock(), SystemClock)
+    before = datetime.utcnow()
+    assert before <= utc_time() <= datetime.utcnow()
+    assert today_int() == int(datetime.utcnow().strftime('%Y%m%d'))
+
+
+@pytest.mark.usefixtures('restore_clock')
+def test_set_clock():
+    set_clock('system')
+    assert isinstance(get_clock(), SystemClock)
+    clock = ManualClock()
+    set_clock(clock)
+    assert get_clock() is clock
+    assert repr(clock) == '<manual clock>'
+    with pytest.raises(ValueError):
+        set_clock('atomic')
+
+
+@pytest.mark.usefixtures('restore_clock')
+def test_manual_clock():
+    clock = ManualClock(1506984924)
+    set_clock(clock)
+    assert utc_time() == datetime(2017, 10, 2, 22, 55, 24)
+    assert today_int() == 20171002
+    # Kolkata observes no DST, so its offset is that of any time
+    assert get_utc_offset('Asia/Kolkata') == 19800
+    clock.advance(3875)
+    assert today_int() == 20171002
+    clock.advance(1)
+    assert today_int() == 20171003
+    clock.set(-1)
+    assert today_int() == 19691231
+    assert utc_time() == datetime(1969, 12, 31, 23, 59, 59)
+
+
+def test_today_int_is_cached_until_midnight():
+    clock = ManualClock(1506988799)
+    assert clock.today_int() == 20171002
+    cached = clock._today  # pylint: disable=W0212
+    assert clock.today_int() == 20171002
+    assert clock._today is cached  # pylint: disable=W0212
+    clock.advance(1)
+    assert clock.today_int() == 20171003
+    assert clock._today is not cached  # pylint: disable=W0212
+
+
+def test_clock_base_class():
+    with pytest.raises(TypeError):
+        Clock()
+
+    class IncompleteClock(Clock):
+        name = 'incomplete'
+
+    with pytest.raises(TypeError):
+        IncompleteClock()
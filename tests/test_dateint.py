@@ -0,0 +1,222 @@
+"""Testing the dateint subpackage."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+import pytz
+
+from utilitime.dateint import (
+    is_valid_dateint,
+    dateint_to_datetime,
+    shift_dateint,
+    dateint_difference,
+    dateint_week_by_dateint,
+    dateint_range,
+    DateintRange,
+    dateint_to_weekday,
+    dateint_to_weekday_name,
+    tz_aware_dateint_to_timestamp,
+    dateint_to_utc_timestamp,
+)
+
+
+def _to_dateint(day):
+    return day.year * 10000 + day.month * 100 + day.day
+
+
+def test_shift_dateint():
+    """shift_dateint agrees with datetime.date arithmetic."""
+    first = date(1999, 12, 1)
+    for delta in range(0, 2000, 3):
+        day = first + timedelta(days=delta)
+        for day_shift in (-400, -31, -29, -28, -1, 0, 1, 27, 28, 29, 366):
+            assert shift_dateint(_to_dateint(day), day_shift) == _to_dateint(
+                day + timedelta(days=day_shift))
+
+
+def test_shift_dateint_examples():
+    assert shift_dateint(20170228, 1) == 20170301
+    assert shift_dateint(20170301, -1) == 20170228
+    assert shift_dateint(20170220, 5) == 20170225
+    assert shift_dateint(20161231, 1) == 20170101
+    assert shift_dateint(20160301, -1) == 20160229
+
+
+def test_shift_dateint_bad_dateint():
+    with pytest.raises(ValueError):
+        shift_dateint(2017011, 1)
+
+
+def test_shift_dateint_non_integral_shift():
+    with pytest.raises(TypeError):
+        shift_dateint(20170220, 1.5)
+    with pytest.raises(TypeError):
+        shift_dateint(20170220, 10.0)
+    assert shift_dateint(20170220, True) == 20170221
+
+
+def test_shift_dateint_out_of_range():
+    """Shifting past the range of dateints raises instead of returning a
+    dateint of more or fewer than 8 digits."""
+    assert shift_dateint(99991230, 1) == 99991231
+    assert shift_dateint(10000102, -1) == 10000101
+    with pytest.raises(OverflowError):
+        shift_dateint(99991231, 1)
+    with pytest.raises(OverflowError):
+        shift_dateint(10000101, -1)
+    with pytest.raises(OverflowError):
+        dateint_week_by_dateint(99991231)
+    assert dateint_difference(10000101, 99991231) == 3287181
+
+
+def test_dateint_difference():
+    assert dateint_difference(20170301, 20170228) == 1
+    assert dateint_difference(20170228, 20170301) == 1
+    assert dateint_difference(20160101, 20170101) == 366
+    assert dateint_difference(20170101, 20170101) == 0
+
+
+def test_dateint_week_by_dateint():
+    assert dateint_week_by_dateint(20170215) == [
+        20170213, 20170214, 20170215, 20170216, 20170217, 20170218, 20170219]
+    assert dateint_week_by_dateint(20170213) == dateint_week_by_dateint(
+        20170219)
+    assert dateint_week_by_dateint(20170301, 'Sunday') == [
+        20170226, 20170227, 20170228, 20170301, 20170302, 20170303, 20170304]
+
+
+def test_dateint_range():
+    assert dateint_range(20170228, 20170301) == [20170228, 20170301]
+    assert dateint_range(20170225, 20170301) == [
+        20170225, 20170226, 20170227, 20170228, 20170301]
+    assert dateint_range(20170301, 20170301) == [20170301]
+    assert dateint_range(20170302, 20170301) == []
+
+
+def test_dateint_range_object():
+    first = date(1990, 1, 1)
+    days = [_to_dateint(first + timedelta(days=i)) for i in range(11000)]
+    drange = DateintRange(days[0], days[-1])
+    assert len(drange) == len(days)
+    assert list(drange) == days
+    assert list(reversed(drange)) == days[::-1]
+    assert drange[0] == days[0]
+    assert drange[-1] == days[-1]
+    assert drange[1234] == days[1234]
+    assert list(drange[10:400:7]) == days[10:400:7]
+    assert list(drange[::-30]) == days[::-30]
+    assert drange.index(days[567]) == 567
+    assert drange.count(days[567]) == 1
+    assert days[42] in drange
+    assert 19891231 not in drange
+    assert 20000230 not in drange
+    assert 'a string' not in drange
+    with pytest.raises(IndexError):
+        drange[len(days)]  # pylint: disable=W0104
+    with pytest.raises(ValueError):
+        drange.index(19891231)
+    with pytest.raises(ValueError):
+        drange.index(days[567], 600)
+
+
+def test_dateint_range_step():
+    weekly = DateintRange(20170101, 20170131, 7)
+    assert list(weekly) == [20170101, 20170108, 20170115, 20170122, 20170129]
+    assert len(weekly) == 5
+    assert 20170115 in weekly
+    assert 20170116 not in weekly
+    assert weekly.step == 7
+    descending = DateintRange(20170301, 20170226, -1)
+    assert list(descending) == [20170301, 20170228, 20170227, 20170226]
+    with pytest.raises(ValueError):
+        DateintRange(20170101, 20170131, 0)
+
+
+def test_dateint_range_equality_and_repr():
+    assert DateintRange(20170101, 20170110) == DateintRange(20170101, 20170110)
+    assert DateintRange(20170101, 20170131)[:10] == DateintRange(
+        20170101, 20170110)
+    assert DateintRange(20170101, 20170110) != DateintRange(
+        20170101, 20170111)
+    assert len({DateintRange(20170101, 20170110),
+                DateintRange(20170101, 20170110)}) == 1
+    assert repr(DateintRange(20170101, 20170110)) == (
+        'DateintRange(20170101, 20170110)')
+    assert repr(DateintRange(20170101, 20170131, 7)) == (
+        'DateintRange(20170101, 20170129, 7)')
+    assert repr(DateintRange(20170102, 20170101)) == 'DateintRange([])'
+
+
+def test_dateint_to_weekday():
+    assert dateint_to_weekday(20170213) == 0
+    assert dateint_to_weekday(20170212) == 6
+    assert dateint_to_weekday(20170214) == 1
+    assert dateint_to_weekday(20170212, 'Sunday') == 0
+    assert dateint_to_weekday(20170214, 'Sunday') == 2
+    first = date(1899, 12, 1)
+    for delta in range(0, 80000, 13):
+        day = first + timedelta(days=delta)
+        assert dateint_to_weekday(_to_dateint(day)) == day.weekday()
+        assert dateint_to_weekday(_to_dateint(day), 'Saturday') == (
+            day.weekday() + 2) % 7
+    with pytest.raises(ValueError):
+        dateint_to_weekday(20170213, 'Funday')
+
+
+def test_dateint_to_weekday_name():
+    assert dateint_to_weekday_name(20170213) == 'Monday'
+    assert dateint_to_weekday_name(20170212) == 'Sunday'
+    assert dateint_to_weekday_name(20170214) == 'Tuesday'
+    assert dateint_to_weekday_name(19700101) == 'Thursday'
+
+
+def test_is_valid_dateint():
+    first = date(1000, 1, 1)
+    for delta in range(0, (date(9999, 12, 31) - first).days, 97):
+        day = first + timedelta(days=delta)
+        assert is_valid_dateint(_to_dateint(day))
+    assert is_valid_dateint(20000229)
+    assert is_valid_dateint(20160229)
+    assert is_valid_dateint(99991231)
+    assert is_valid_dateint(10000101)
+    for dateint in (20170229, 19000229, 20170231, 20170431, 20171301,
+                    20170001, 20170100, 20170132, 2017011, 100000101,
+                    -20170101, 9991231):
+        assert not is_valid_dateint(dateint)
+    assert not is_valid_dateint(20170101.0)
+    assert not is_valid_dateint('20170101')
+    assert not is_valid_dateint(None)
+
+
+def test_functions_reject_impossible_dateints():
+    with pytest.raises(ValueError):
+        dateint_to_datetime(20170231)
+    with pytest.raises(ValueError):
+        shift_dateint(20170231, 1)
+    with pytest.raises(ValueError):
+        dateint_difference(20170101, 20171301)
+    with pytest.raises(ValueError):
+        dateint_to_weekday(20190229)
+    with pytest.raises(ValueError):
+        tz_aware_dateint_to_timestamp(20170230, 'UTC')
+
+
+@pytest.mark.parametrize('timezone_name', [
+    'UTC', 'Asia/Jerusalem', 'America/Sao_Paulo', 'Asia/Kolkata'])
+def test_tz_aware_dateint_to_timestamp(timezone_name):
+    tz = pytz.timezone(timezone_name)
+    day = date(2014, 1, 1)
+    for _ in range(3 * 366):
+        expected = tz.localize(datetime(day.year, day.month, day.day))
+        assert tz_aware_dateint_to_timestamp(
+            _to_dateint(day), timezone_name) == expected.timestamp()
+        day += timedelta(days=1)
+
+
+def test_tz_aware_dateint_to_timestamp_dst_policy():
+    # Sao Paulo used to skip midnight when DST started
+    assert tz_aware_dateint_to_timestamp(
+        20171015, 'America/Sao_Paulo') == 1508036400
+    assert tz_aware_dateint_to_timestamp(
+        20171015, 'America/Sao_Paulo', 'dst') == 1508032800
+    assert dateint_to_utc_timestamp(20171015) == 1508025600
@@ -0,0 +1,147 @@
+"""Testing the array-aware dateint functions."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from utilitime.dateint import (
+    decompose_dateint,
+    dateint_to_date,
+    dateint_to_datetime,
+    dateint_to_utc_timestamp,
+    dateint_to_weekday,
+    dateint_to_weekday_name,
+    is_valid_dateint,
+    validate_dateints,
+    decompose_dateints,
+    dateints_to_dates,
+    dateints_to_datetimes,
+    dateints_to_utc_timestamps,
+    dateints_to_weekdays,
+    dateints_to_weekday_names,
+    tz_aware_dateint_to_timestamp,
+    tz_aware_dateint_range_bounds,
+    dateint_range,
+)
+from utilitime.timezone import NonExistentTimeError
+
+np = pytest.importorskip('numpy')
+
+
+def _sample_dateints():
+    first = date(1899, 12, 25)
+    return [
+        int((first + timedelta(days=i)).strftime('%Y%m%d'))
+        for i in range(0, 60000, 7)
+    ]
+
+
+@pytest.mark.parametrize('dtype', [np.int32, np.int64])
+def test_decompose_dateints(dtype):
+    """Array decomposition matches the scalar decompose_dateint."""
+    dateints = _sample_dateints()
+    years, months, days = decompose_dateints(np.array(dateints, dtype=dtype))
+    assert years.dtype == dtype
+    expected = [decompose_dateint(dateint) for dateint in dateints]
+    assert list(zip(years, months, days)) == expected
+
+
+@pytest.mark.parametrize('dtype', [np.int32, np.int64])
+def test_dateints_to_dates(dtype):
+    """Array conversions match the scalar dateint conversions."""
+    dateints = _sample_dateints()
+    arr = np.array(dateints, dtype=dtype)
+    dates = dateints_to_dates(arr)
+    assert dates.dtype == np.dtype('datetime64[D]')
+    assert list(dates.tolist()) == [dateint_to_date(d) for d in dateints]
+    datetimes = dateints_to_datetimes(arr)
+    assert list(datetimes.tolist()) == [
+        dateint_to_datetime(d) for d in dateints]
+    timestamps = dateints_to_utc_timestamps(arr)
+    assert timestamps.dtype == np.int64
+    assert timestamps.tolist() == [
+        dateint_to_utc_timestamp(d) for d in dateints]
+
+
+@pytest.mark.parametrize('dateint', [20170231, 20171301, 20170100, 20190229])
+def test_dateints_to_dates_invalid(dateint):
+    """Impossible dates raise, just like with the scalar functions."""
+    with pytest.raises(ValueError):
+        dateints_to_dates(np.array([20170101, dateint]))
+
+
+def test_decompose_dateints_bad_dtype():
+    """Non-integer arrays are rejected."""
+    with pytest.raises(TypeError):
+        decompose_dateints(np.array([20170101.0]))
+
+
+@pytest.mark.parametrize('first_day', ['Monday', 'Sunday', 'Friday'])
+def test_dateints_to_weekdays(first_day):
+    """Array weekdays match the scalar dateint_to_weekday."""
+    dateints = _sample_dateints()
+    weekdays = dateints_to_weekdays(np.array(dateints), first_day)
+    assert weekdays.tolist() == [
+        dateint_to_weekday(dateint, first_day) for dateint in dateints]
+
+
+def test_dateints_to_weekday_names():
+    """Array weekday names match the scalar dateint_to_weekday_name."""
+    dateints = _sample_dateints()
+    names = dateints_to_weekday_names(np.array(dateints, dtype=np.int32))
+    assert names.tolist() == [
+        dateint_to_weekday_name(dateint) for dateint in dateints]
+
+
+@pytest.mark.parametrize('dtype', [np.int32, np.int64])
+def test_validate_dateints(dtype):
+    """The validity mask matches the scalar is_valid_dateint."""
+    candidates = np.concatenate([
+        np.array(_sample_dateints()),
+        np.arange(20151200, 20170400),
+        np.array([19000229, 20000229, 10000101, 99991231, 9991231,
+                  100000101, -20170101, 0]),
+    ]).astype(dtype)
+    mask = validate_dateints(candidates)
+    assert mask.dtype == np.bool_
+    assert mask.tolist() == [
+        is_valid_dateint(dateint) for dateint in candidates.tolist()]
+
+
+def test_weekdays_invalid():
+    """Impossible dates raise in the weekday array functions."""
+    with pytest.raises(ValueError):
+        dateints_to_weekdays(np.array([20170101, 20170229]))
+
+
+@pytest.mark.parametrize('timezone_name', [
+    'UTC', 'Asia/Jerusalem', 'America/Sao_Paulo', 'America/Havana',
+    'Australia/Lord_Howe'])
+@pytest.mark.parametrize('dst_policy', ['standard', 'dst', 'later'])
+def test_tz_aware_dateint_range_bounds(timezone_name, dst_policy):
+    starts, ends = tz_aware_dateint_range_bounds(
+        20100101, 20191231, timezone_name, dst_policy)
+    dateints = dateint_range(20100101, 20200101)
+    expected = [
+        tz_aware_dateint_to_timestamp(dateint, timezone_name, dst_policy)
+        for dateint in dateints]
+    assert starts.dtype == ends.dtype == np.int64
+    assert starts.tolist() == expected[:-1]
+    assert ends.tolist() == expected[1:]
+
+
+def test_tz_aware_dateint_range_bounds_memoized():
+    starts, ends = tz_aware_dateint_range_bounds(
+        20170323, 20170325, 'Asia/Jerusalem')
+    assert (ends - starts).tolist() == [86400, 82800, 86400]
+    assert tz_aware_dateint_range_bounds(
+        20170323, 20170325, 'Asia/Jerusalem')[0] is starts
+    with pytest.raises(ValueError):
+        starts[0] = 0
+    starts, ends = tz_aware_dateint_range_bounds(20170325, 20170323, 'UTC')
+    assert starts.size == ends.size == 0
+    with pytest.raises(NonExistentTimeError):
+        tz_aware_dateint_range_bounds(
+            20171001, 20171031, 'America/Sao_Paulo', 'raise')
+    with pytest.raises(ValueError):
+        tz_aware_dateint_range_bounds(20170101, 20170231, 'UTC')
@@ -0,0 +1,64 @@
+"""Testing the datetime subpackage."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from utilitime.datetime import (
+    utc_offset_by_timezone,
+    get_utc_offset,
+    get_utc_offsets,
+)
+from utilitime.timezone import (
+    get_timezone,
+    get_transition_table,
+)
+
+
+@pytest.mark.parametrize('timezone_name', [
+    'UTC', 'Asia/Jerusalem', 'America/New_York', 'Asia/Kolkata',
+    'Asia/Kathmandu', 'America/St_Johns', 'Australia/Lord_Howe'])
+def test_get_utc_offset(timezone_name):
+    tz = get_timezone(timezone_name)
+    # hourly, through two years, so that the cached offset interval keeps
+    # expiring at transitions
+    for hours in range(0, 2 * 8760, 7):
+        timestamp = 1483228800 + hours * 3600
+        expected = datetime.fromtimestamp(
+            timestamp, timezone.utc).astimezone(tz).utcoffset()
+        assert get_utc_offset(timezone_name, timestamp) == (
+            expected.total_seconds())
+        assert get_utc_offset(timezone_name, timestamp, unit='minutes') == (
+            expected.total_seconds() / 60)
+    now = datetime.now(timezone.utc)
+    assert get_utc_offset(timezone_name) == (
+        now.astimezone(tz).utcoffset().total_seconds())
+    assert utc_offset_by_timezone(timezone_name) == int(
+        now.astimezone(tz).utcoffset() / timedelta(hours=1))
+
+
+def test_utc_offset_cache_expires_at_transitions():
+    table = get_transition_table('America/New_York')
+    # DST started at 2017-03-12 07:00 UTC
+    assert get_utc_offset('America/New_York', 1489301999) == -18000
+    assert table.offset_interval(1489301999)[1] == 1489302000
+    assert get_utc_offset('America/New_York', 1489302000) == -14400
+    assert get_utc_offset('America/New_York', 1489301999) == -18000
+
+
+def test_utc_offset_units():
+    assert get_utc_offset('Asia/Kolkata', 1506984924) == 19800
+    assert get_utc_offset('Asia/Kolkata', 1506984924, unit='minutes') == 330
+    assert utc_offset_by_timezone('Asia/Kolkata') == 5
+    with pytest.raises(ValueError):
+        get_utc_offset('Asia/Kolkata', unit='hours')
+
+
+def test_get_utc_offsets():
+    assert get_utc_offsets(
+        ['UTC', 'Asia/Kolkata', 'America/New_York'], 1506984924,
+        unit='minutes') == {
+            'UTC': 0, 'Asia/Kolkata': 330, 'America/New_York': -240}
+    offsets = get_utc_offsets(['UTC', 'Asia/Kathmandu'])
+    assert offsets == {'UTC': 0, 'Asia/Kathmandu': 20700}
+    assert get_utc_offsets([]) == {}
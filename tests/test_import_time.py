@@ -0,0 +1,63 @@
+"""Testing that importing utilitime does not import unneeded modules."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import utilitime
+
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(utilitime.__file__))
+
+# dependencies which should only be imported by the functions needing them
+_HEAVY_MODULES = [
+    'pytz', 'delorean', 'babel', 'decore', 'numpy', 'zoneinfo']
+
+
+def _imported_modules(statement):
+    """Returns the names of the modules imported by the given statement, as
+    reported by python -X importtime."""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [
+        _PACKAGE_ROOT, env.get('PYTHONPATH')]))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True, env=env, check=True)
+    return {
+        line.rsplit('|', 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith('import time:') and '|' in line
+    }
+
+
+def test_import_utilitime_is_lazy():
+    modules = _imported_modules('import utilitime')
+    assert 'utilitime' in modules
+    for module in _HEAVY_MODULES + [
+            'utilitime._version', 'utilitime.dateint', 'utilitime.datetime',
+            'utilitime.timestamp', 'utilitime.timezone']:
+        assert module not in modules
+    modules = _imported_modules(
+        'from utilitime import TimeInterval; import utilitime.constants')
+    assert 'utilitime.dateint' not in modules
+
+
+@pytest.mark.parametrize('subpackage', [
+    'clock', 'constants', 'dateint', 'datetime', 'rollover', 'time',
+    'timestamp', 'timezone', 'weekday'])
+def test_import_subpackage_is_lazy(subpackage):
+    modules = _imported_modules('import utilitime.' + subpackage)
+    assert 'utilitime.' + subpackage in modules
+    for module in _HEAVY_MODULES:
+        assert module not in modules
+
+
+def test_lazy_attributes():
+    assert utilitime.dateint.shift_dateint(20170228, 1) == 20170301
+    assert utilitime.constants.SECONDS_IN_DAY == 86400
+    assert 'timestamp' in dir(utilitime)
+    assert isinstance(utilitime.__version__, str)
+    with pytest.raises(AttributeError):
+        utilitime.not_a_subpackage  # pylint: disable=W0104
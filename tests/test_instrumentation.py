@@ -0,0 +1,174 @@
+"""Testing the instrumentation subpackage."""
+
+from datetime import datetime, timedelta
+import os
+import subprocess
+import sys
+
+import pytest
+
+import utilitime
+from utilitime.dateint.dateint import shift_dateint as original_shift_dateint
+from utilitime.instrumentation import (
+    use_instrumentation,
+    instrumentation_enabled,
+    reset_instrumentation,
+    instrumentation_snapshot,
+    instrumentation_to_prometheus,
+    write_prometheus_file,
+)
+from utilitime.memoization import use_memoization
+from utilitime.instrumentation.instrumentation import (
+    _BUCKET_BOUNDS,
+    _FunctionStats,
+)
+
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(utilitime.__file__))
+
+
+@pytest.fixture
+def instrumentation():
+    use_instrumentation()
+    reset_instrumentation()
+    yield
+    use_instrumentation(False)
+    reset_instrumentation()
+
+
+def test_disabled_by_default():
+    assert not instrumentation_enabled()
+    assert utilitime.dateint.shift_dateint is original_shift_dateint
+
+
+@pytest.mark.usefixtures('instrumentation')
+def test_call_counts_and_latencies():
+    assert instrumentation_enabled()
+    for _ in range(10):
+        assert utilitime.dateint.shift_dateint(20170228, 1) == 20170301
+    utilitime.weekday.weekdays('Sunday')
+    functions = instrumentation_snapshot()['functions']
+    assert set(functions) == {'dateint.shift_dateint', 'weekday.weekdays'}
+    stats = functions['dateint.shift_dateint']
+    assert stats['calls'] == 10
+    assert stats['total_seconds'] > 0
+    assert stats['mean_seconds'] == pytest.approx(stats['total_seconds'] / 10)
+    assert 0 < stats['p50_seconds'] <= stats['p90_seconds'] <= stats[
+        'p99_seconds']
+    reset_instrumentation()
+    assert not instrumentation_snapshot()['functions']
+
+
+@pytest.mark.usefixtures('instrumentation')
+def test_failing_calls_are_recorded():
+    with pytest.raises(ValueError):
+        utilitime.dateint.shift_dateint(2017, 1)
+    assert instrumentation_snapshot()['functions'][
+        'dateint.shift_dateint']['calls'] == 1
+
+
+@pytest.mark.usefixtures('instrumentation')
+def test_time_interval_methods():
+    start = datetime(2017, 10, 2)
+    interval = utilitime.TimeInterval.from_timedelta(start, timedelta(days=-1))
+    assert interval.end == start
+    assert start in interval
+    assert start + timedelta(seconds=1) not in interval
+    functions = instrumentation_snapshot()['functions']
+    assert functions['TimeInterval.from_timedelta']['calls'] == 1
+    assert functions['TimeInterval.__init__']['calls'] == 1
+    assert functions['TimeInterval.__contains__']['calls'] == 2
+
+
+def test_disabling_restores_functions():
+    use_instrumentation()
+    use_instrumentation()
+    assert utilitime.dateint.shift_dateint is not original_shift_dateint
+    assert utilitime.dateint.shift_dateint.__wrapped__ is (
+        original_shift_dateint)
+    use_instrumentation(False)
+    assert utilitime.dateint.shift_dateint is original_shift_dateint
+    assert not hasattr(utilitime.TimeInterval.__init__, '__wrapped__')
+    assert isinstance(
+        vars(utilitime.TimeInterval)['from_timedelta'], classmethod)
+    reset_instrumentation()
+
+
+@pytest.mark.usefixtures('instrumentation')
+def test_cache_hit_rates():
+    get_timezone = utilitime.timezone.get_timezone
+    get_timezone.cache_clear()
+    reset_instrumentation()
+    for _ in range(3):
+        get_timezone('Asia/Jerusalem')
+    stats = instrumentation_snapshot()['caches']['timezone.get_timezone']
+    assert stats['hits'] == 2
+    assert stats['misses'] == 1
+    assert stats['hit_rate'] == pytest.approx(2 / 3)
+    assert stats['currsize'] == 1
+
+
+def test_quantiles():
+    stats = _FunctionStats()
+    for elapsed in [150] * 50 + [1500] * 49 + [10 ** 11]:
+        stats.record(elapsed)
+    assert 100 <= stats.quantile(0.5) <= 200
+    assert 1000 <= stats.quantile(0.9) <= 2000
+    assert stats.quantile(1) == _BUCKET_BOUNDS[-1]
+    assert _FunctionStats().quantile(0.5) == 0
+
+
+@pytest.mark.usefixtures('instrumentation')
+def test_prometheus_export(tmpdir):
+    utilitime.dateint.shift_dateint(20170228, 1)
+    text = instrumentation_to_prometheus()
+    assert '# TYPE utilitime_call_duration_seconds histogram' in text
+    assert 'utilitime_call_duration_seconds_count{' \
+        'function="dateint.shift_dateint"} 1\n' in text
+    assert 'utilitime_call_duration_seconds_bucket{' \
+        'function="dateint.shift_dateint",le="+Inf"} 1\n' in text
+    assert '# TYPE utilitime_cache_hits_total counter' in text
+    file_path = str(tmpdir.join('utilitime.prom'))
+    write_prometheus_file(file_path)
+    with open(file_path) as prom_file:
+        assert prom_file.read() == text
+    assert tmpdir.listdir() == [tmpdir.join('utilitime.prom')]
+
+
+def test_prometheus_file_is_readable_by_all(tmpdir):
+    file_path = str(tmpdir.join('utilitime.prom'))
+    umask = os.umask(0o022)
+    try:
+        write_prometheus_file(file_path)
+    finally:
+        os.umask(umask)
+    assert os.stat(file_path).st_mode & 0o777 == 0o644
+
+
+def test_enabled_by_environment_variable():
+    env = dict(os.environ, UTILITIME_INSTRUMENTATION='1')
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [
+        _PACKAGE_ROOT, env.get('PYTHONPATH')]))
+    result = subprocess.run(
+        [sys.executable, '-c',
+         'from utilitime.dateint import shift_dateint; '
+         'shift_dateint(20170228, 1); '
+         'from utilitime.instrumentation import instrumentation_snapshot; '
+         'print(instrumentation_snapshot()["functions"]'
+         '["dateint.shift_dateint"]["calls"])'],
+        stdout=subprocess.PIPE, universal_newlines=True, env=env, check=True)
+    assert result.stdout.strip() == '1'
+
+
+@pytest.mark.usefixtures('instrumentation')
+def test_memoization_hit_rates():
+    assert 'memoization.dateint_to_weekday' not in instrumentation_snapshot()[
+        'caches']
+    use_memoization()
+    try:
+        for _ in range(4):
+            utilitime.dateint.dateint_to_weekday(20170213)
+        stats = instrumentation_snapshot()['caches'][
+            'memoization.dateint_to_weekday']
+        assert stats['hit_rate'] == pytest.approx(0.75)
+    finally:
+        use_memoization(False)
@@ -0,0 +1,31 @@
+"""Testing the lazy_property decorator."""
+
+from utilitime._lazy import lazy_property
+
+
+def test_lazy_property():
+    calls = []
+
+    @lazy_property
+    def value():
+        """A lazily computed value."""
+        calls.append(None)
+        return [1, 2]
+
+    assert not calls
+    assert value() == [1, 2]
+    assert value() is value()
+    assert len(calls) == 1
+    assert value.__doc__ == 'A lazily computed value.'
+
+
+def test_lazy_property_caches_none():
+    calls = []
+
+    @lazy_property
+    def nothing():
+        calls.append(None)
+
+    assert nothing() is None
+    assert nothing() is None
+    assert len(calls) == 1
@@ -0,0 +1,165 @@
+"""Testing the memoization subpackage."""
+
+from datetime import timedelta, timezone
+
+import pytest
+
+from utilitime.dateint import (
+    dateint_to_timestamp,
+    tz_aware_dateint_to_timestamp,
+    dateint_to_weekday,
+    dateint_range,
+)
+from utilitime.timestamp import timestamp_to_local_time
+from utilitime.timezone import (
+    TimezoneBackend,
+    get_timezone_backend,
+    set_timezone_backend,
+)
+from utilitime.memoization import (
+    MEMOIZABLE_FUNCTIONS,
+    use_memoization,
+    memoized,
+    memoization_info,
+    clear_memoization,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_memoization():
+    yield
+    use_memoization(False)
+
+
+def test_disabled_by_default():
+    assert memoization_info() == {}
+
+
+def test_memoized_results():
+    expected = {
+        dateint: (
+            dateint_to_timestamp(dateint),
+            tz_aware_dateint_to_timestamp(dateint, 'America/Sao_Paulo'),
+            tz_aware_dateint_to_timestamp(
+                dateint, 'America/Sao_Paulo', 'dst'),
+            dateint_to_weekday(dateint, 'Sunday'))
+        for dateint in dateint_range(20171001, 20171031)}
+    use_memoization()
+    assert set(memoization_info()) == set(MEMOIZABLE_FUNCTIONS)
+    for _ in range(2):
+        for dateint, results in expected.items():
+            assert (
+                dateint_to_timestamp(dateint),
+                tz_aware_dateint_to_timestamp(dateint, 'America/Sao_Paulo'),
+                tz_aware_dateint_to_timestamp(
+                    dateint, 'America/Sao_Paulo', 'dst'),
+                dateint_to_weekday(dateint, 'Sunday')) == results
+    info = memoization_info()
+    assert info['dateint_to_weekday'].hits == 31
+    assert info['dateint_to_weekday'].misses == 31
+    assert info['tz_aware_dateint_to_timestamp'].currsize == 62
+    clear_memoization()
+    assert memoization_info()['dateint_to_weekday'].currsize == 0
+
+
+def test_errors_are_not_memoized():
+    use_memoization()
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            dateint_to_weekday(20170230)
+        with pytest.raises(ValueError):
+            dateint_to_weekday(20170213, 'Funday')
+    assert memoization_info()['dateint_to_weekday'].currsize == 0
+    dateint_to_weekday(20170213)
+    info = memoization_info()['dateint_to_weekday']
+    assert info.misses == 5
+    assert info.currsize == 1
+    assert info.evictions == 0
+
+
+def test_lru_eviction():
+    use_memoization(maxsizes={'dateint_to_weekday': 2})
+    for dateint in [20170213, 20170214, 20170213, 20170215]:
+        dateint_to_weekday(dateint)
+    assert memoization_info()['dateint_to_weekday'] == (1, 3, 1, 2, 2)
+    # 20170214 was the least recently used, so it was evicted
+    dateint_to_weekday(20170213)
+    dateint_to_weekday(20170214)
+    assert memoization_info()['dateint_to_weekday'] == (2, 4, 2, 2, 2)
+    with pytest.raises(ValueError):
+        use_memoization(maxsize=0)
+
+
+def test_per_function_sizes():
+    use_memoization(maxsize=100, maxsizes={
+        'dateint_to_weekday': 10, 'timestamp_to_local_time': None})
+    info = memoization_info()
+    assert 'timestamp_to_local_time' not in info
+    assert info['dateint_to_weekday'].maxsize == 10
+    assert info['dateint_to_timestamp'].maxsize == 100
+    for dateint in dateint_range(20170101, 20170131):
+        dateint_to_weekday(dateint)
+    info = memoization_info()['dateint_to_weekday']
+    assert info.currsize == 10
+    assert info.evictions == 21
+    clear_memoization()
+    assert memoization_info()['dateint_to_weekday'].evictions == 0
+    with pytest.raises(ValueError):
+        use_memoization(maxsizes={'shift_dateint': 10})
+
+
+def test_context_manager():
+    use_memoization(maxsize=100)
+    dateint_to_weekday(20170213)
+    with memoized(maxsizes={'dateint_to_weekday': 5}):
+        assert memoization_info()['dateint_to_weekday'].maxsize == 5
+        dateint_to_weekday(20170213)
+    info = memoization_info()['dateint_to_weekday']
+    # the memo in use before the context is restored, with its content
+    assert info == (0, 1, 0, 100, 1)
+    with memoized(False):
+        assert memoization_info() == {}
+    assert memoization_info()['dateint_to_weekday'].maxsize == 100
+    use_memoization(False)
+    with memoized():
+        assert set(memoization_info()) == set(MEMOIZABLE_FUNCTIONS)
+    assert memoization_info() == {}
+
+
+def test_mutable_results_are_copied():
+    pytest.importorskip('delorean')
+    use_memoization()
+    local_time = timestamp_to_local_time(1506984924, 'Asia/Jerusalem')
+    local_time.shift('UTC')
+    local_time = timestamp_to_local_time(1506984924, 'Asia/Jerusalem')
+    assert local_time.datetime.hour == 1
+    assert memoization_info()['timestamp_to_local_time'].hits == 1
+
+
+class _FixedOffsetBackend(TimezoneBackend):
+    """A backend giving every timezone the same, fixed UTC offset."""
+
+    def __init__(self, hours):
+        self.name = 'UTC{:+d}'.format(hours)
+        self._tzinfo = timezone(timedelta(hours=hours))
+
+    def timezone(self, timezone_name):
+        return self._tzinfo
+
+
+def test_timezone_backend_switch():
+    """Memoized results are keyed by transition table, so that results of a
+    backend no longer in use are never returned."""
+    use_memoization()
+    previous = get_timezone_backend()
+    try:
+        set_timezone_backend(_FixedOffsetBackend(5))
+        assert tz_aware_dateint_to_timestamp(
+            19700102, 'Asia/Jerusalem') == 86400 - 5 * 3600
+        set_timezone_backend(_FixedOffsetBackend(-5))
+        assert tz_aware_dateint_to_timestamp(
+            19700102, 'Asia/Jerusalem') == 86400 + 5 * 3600
+    finally:
+        set_timezone_backend(previous)
+    info = memoization_info()['tz_aware_dateint_to_timestamp']
+    assert (info.hits, info.misses) == (0, 2)
@@ -0,0 +1,149 @@
+"""Testing the rollover subpackage."""
+
+import asyncio
+import logging
+import threading
+
+import pytest
+
+from utilitime.clock import ManualClock
+from utilitime.constants import SECONDS_IN_DAY
+from utilitime.rollover import (
+    day_start,
+    RolloverSchedule,
+    RolloverNotifier,
+    AsyncRolloverNotifier,
+)
+
+# the start of 20170301 in Tokyo, London and New York
+TOKYO = 1488294000
+LONDON = 1488326400
+NEW_YORK = 1488344400
+
+
+def test_day_start():
+    assert day_start(20170301, 'Asia/Tokyo') == TOKYO
+    assert day_start(20170301, 'America/New_York') == NEW_YORK
+    # midnight was skipped by a forward transition
+    assert day_start(20171015, 'America/Sao_Paulo') == 1508036400
+    # midnight was repeated by a backward transition
+    assert day_start(20171105, 'America/Havana') == 1509854400
+
+
+def test_schedule_order():
+    schedule = RolloverSchedule(ManualClock(TOKYO - 1))
+    for timezone_name in ['America/New_York', 'Asia/Tokyo', 'Europe/London']:
+        schedule.add(timezone_name)
+    schedule.add('Asia/Tokyo')
+    assert len(schedule) == 3
+    assert 'Asia/Tokyo' in schedule
+    assert schedule.next_rollover() == TOKYO
+    assert schedule.pop_due(TOKYO - 1) == []
+    assert schedule.pop_due(NEW_YORK) == [
+        ('Asia/Tokyo', 20170301), ('Europe/London', 20170301),
+        ('America/New_York', 20170301)]
+    assert schedule.next_rollover() == TOKYO + SECONDS_IN_DAY
+
+
+def test_schedule_missed_days():
+    clock = ManualClock(TOKYO - 1)
+    schedule = RolloverSchedule(clock)
+    schedule.add('Asia/Tokyo')
+    clock.advance(2 * SECONDS_IN_DAY)
+    assert schedule.pop_due() == [
+        ('Asia/Tokyo', 20170301), ('Asia/Tokyo', 20170302)]
+    assert schedule.pop_due() == []
+
+
+def test_schedule_discard():
+    schedule = RolloverSchedule(ManualClock(TOKYO - 1))
+    schedule.add('Asia/Tokyo')
+    schedule.add('Europe/London')
+    schedule.discard('Asia/Tokyo')
+    schedule.discard('Asia/Tokyo')
+    assert 'Asia/Tokyo' not in schedule
+    assert schedule.next_rollover() == LONDON
+    assert schedule.pop_due(LONDON) == [('Europe/London', 20170301)]
+    schedule.discard('Europe/London')
+    assert schedule.next_rollover() is None
+    for _ in range(100):
+        schedule.add('Asia/Tokyo')
+        schedule.discard('Asia/Tokyo')
+    assert len(schedule._heap) <= 64
+
+
+def test_schedule_during_repeated_midnight():
+    # the second 00:30 of 20171105 in Havana
+    schedule = RolloverSchedule(ManualClock(1509854400 + 5400))
+    schedule.add('America/Havana')
+    assert schedule.next_rollover() == day_start(20171106, 'America/Havana')
+
+
+def test_notifier():
+    clock = ManualClock(TOKYO - 1)
+    notified = []
+    called = threading.Event()
+
+    def failing(timezone_name, dateint):
+        raise ValueError(timezone_name, dateint)
+
+    def callback(timezone_name, dateint):
+        notified.append((timezone_name, dateint))
+        called.set()
+
+    with RolloverNotifier(clock, max_wait=0.01) as notifier:
+        with pytest.raises(RuntimeError):
+            notifier.start()
+        notifier.subscribe('Asia/Tokyo', failing)
+        notifier.subscribe('Asia/Tokyo', callback)
+        notifier.unsubscribe('Asia/Tokyo', failing)
+        with pytest.raises(KeyError):
+            notifier.unsubscribe('Asia/Tokyo', failing)
+        clock.advance(1)
+        assert called.wait(5)
+    assert notified == [('Asia/Tokyo', 20170301)]
+
+
+def test_notifier_logs_failing_callbacks(caplog):
+    clock = ManualClock(TOKYO)
+    called = threading.Event()
+
+    def failing(timezone_name, dateint):
+        raise ValueError(timezone_name, dateint)
+
+    with caplog.at_level(logging.ERROR, logger='utilitime.rollover.rollover'):
+        with RolloverNotifier(clock, max_wait=0.01) as notifier:
+            notifier.subscribe('Asia/Tokyo', failing)
+            notifier.subscribe('Asia/Tokyo', lambda *args: called.set())
+            clock.advance(SECONDS_IN_DAY)
+            assert called.wait(5)
+    assert 'Rollover callback' in caplog.text
+
+
+def test_async_notifier():
+    clock = ManualClock(TOKYO - 1)
+    notified = []
+
+    async def main():
+        notifier = AsyncRolloverNotifier(clock, max_wait=0.01)
+        with pytest.raises(RuntimeError):
+            await notifier.wait('Asia/Tokyo')
+        async with notifier:
+            notifier.subscribe(
+                'Europe/London', lambda *args: notified.append(args))
+            waiter = asyncio.ensure_future(notifier.wait('Asia/Tokyo'))
+            await asyncio.sleep(0)
+            assert not waiter.done()
+            clock.set(LONDON)
+            assert await asyncio.wait_for(waiter, 5) == 20170301
+            for _ in range(100):
+                if notified:
+                    break
+                await asyncio.sleep(0.01)
+            pending = asyncio.ensure_future(notifier.wait('Asia/Tokyo'))
+            await asyncio.sleep(0)
+        with pytest.raises(asyncio.CancelledError):
+            await pending
+
+    asyncio.run(main())
+    assert notified == [('Europe/London', 20170301)]
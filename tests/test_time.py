@@ -0,0 +1,60 @@
+"""Testing the time subpackage."""
+
+from datetime import time
+
+import pytest
+
+from utilitime.time import (
+    decompose_seconds_in_day,
+    decompose_seconds_in_days,
+    seconds_in_day_to_time,
+    minutes_in_day_to_time,
+)
+
+
+def test_decompose_seconds_in_day():
+    assert decompose_seconds_in_day(0) == (0, 0, 0)
+    assert decompose_seconds_in_day(23430) == (6, 30, 30)
+    assert decompose_seconds_in_day(86399) == (23, 59, 59)
+    assert decompose_seconds_in_day(86400 + 23430) == (6, 30, 30)
+    assert decompose_seconds_in_day(86400) == (0, 0, 0)
+    with pytest.raises(ValueError):
+        decompose_seconds_in_day(-1)
+
+
+def test_seconds_in_day_to_time():
+    for seconds in range(0, 86400, 7):
+        assert seconds_in_day_to_time(seconds) == time(
+            seconds // 3600, seconds // 60 % 60, seconds % 60)
+    assert seconds_in_day_to_time(23430) is seconds_in_day_to_time(23430)
+    assert seconds_in_day_to_time(86400 + 23430) == time(6, 30, 30)
+    with pytest.raises(ValueError):
+        seconds_in_day_to_time(-1)
+    with pytest.raises(ValueError):
+        seconds_in_day_to_time(2 * 86400)
+    with pytest.raises(TypeError):
+        seconds_in_day_to_time(1.5)
+
+
+def test_minutes_in_day_to_time(capsys):
+    assert minutes_in_day_to_time(390) == time(6, 30)
+    assert minutes_in_day_to_time(1439) == time(23, 59)
+    assert minutes_in_day_to_time(390) is minutes_in_day_to_time(390)
+    assert minutes_in_day_to_time(1440 + 390) == time(6, 30)
+    with pytest.raises(ValueError):
+        minutes_in_day_to_time(-1)
+    with pytest.raises(ValueError):
+        minutes_in_day_to_time(2 * 1440)
+    assert capsys.readouterr().out == ''
+
+
+def test_decompose_seconds_in_days():
+    np = pytest.importorskip('numpy')
+    seconds = np.arange(0, 2 * 86400, 13)
+    hours, minutes, secs = decompose_seconds_in_days(seconds)
+    assert list(zip(hours, minutes, secs)) == [
+        decompose_seconds_in_day(int(second)) for second in seconds]
+    with pytest.raises(ValueError):
+        decompose_seconds_in_days(np.array([5, -1]))
+    with pytest.raises(TypeError):
+        decompose_seconds_in_days(np.array(['06:30']))
@@ -0,0 +1,295 @@
+"""Testing the timestamp subpackage."""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+import random
+
+import pytest
+
+from utilitime.timestamp import (
+    timestamp_to_local_time,
+    timestamp_to_local_datetime,
+    timestamp_to_local_time_str,
+    timestamps_to_local_time_strs,
+    use_local_time_str_cache,
+    local_time_str_cache_info,
+    tz_aware_dt_from_timestamp_and_tz,
+    timestamp_to_dateint,
+    timestamps_to_dateints,
+    get_timestamp,
+    timestamps_to_local_times,
+    timestamps_to_local_dateints,
+    tz_aware_timestamps_to_dateints,
+)
+
+
+def _utc_dateint(timestamp):
+    dtime = datetime(1970, 1, 1) + timedelta(seconds=timestamp)
+    return dtime.year * 10000 + dtime.month * 100 + dtime.day
+
+
+def _random_timestamps(count=20000, seed=0):
+    rand = random.Random(seed)
+    return [
+        rand.randrange(-5000000000, 5000000000) for _ in range(count)
+    ] + [0, -1, 1, 86399, 86400, -86400, -86401, 951782400, 951868799]
+
+
+def test_timestamp_to_dateint():
+    for timestamp in _random_timestamps():
+        assert timestamp_to_dateint(timestamp) == _utc_dateint(timestamp)
+    assert timestamp_to_dateint(1506984924) == 20171002
+    assert timestamp_to_dateint(1506984924.75) == 20171002
+    assert timestamp_to_dateint(-0.5) == 19691231
+
+
+def test_timestamp_to_dateint_out_of_range():
+    """Days without a valid, 8-digit dateint raise an OverflowError."""
+    assert timestamp_to_dateint(253402300799) == 99991231
+    assert timestamp_to_dateint(-30610224000) == 10000101
+    with pytest.raises(OverflowError):
+        timestamp_to_dateint(253402300800)
+    with pytest.raises(OverflowError):
+        timestamp_to_dateint(-30610224001)
+
+
+def test_timestamps_to_dateints():
+    np = pytest.importorskip('numpy')
+    timestamps = _random_timestamps()
+    dateints = timestamps_to_dateints(np.array(timestamps, dtype=np.int64))
+    assert dateints.tolist() == [_utc_dateint(ts) for ts in timestamps]
+    assert timestamps_to_dateints(
+        np.array([1506984924.75, -0.5])).tolist() == [20171002, 19691231]
+
+
+@pytest.mark.parametrize('unit, factor', [
+    ('s', 1), ('ms', 10 ** 3), ('us', 10 ** 6), ('ns', 10 ** 9)])
+def test_timestamps_to_dateints_units(unit, factor):
+    np = pytest.importorskip('numpy')
+    timestamps = [ts for ts in _random_timestamps() if abs(ts) < 9 * 10 ** 9]
+    expected = [_utc_dateint(ts) for ts in timestamps]
+    ticks = np.array(timestamps, dtype=np.int64) * factor
+    dateints = timestamps_to_dateints(ticks, unit=unit)
+    assert dateints.dtype == np.int32
+    assert dateints.tolist() == expected
+    # just before midnight, in ticks of the unit
+    assert timestamps_to_dateints(
+        np.array([86400 * factor - 1]), unit=unit).tolist() == [19700101]
+    assert timestamps_to_dateints(
+        np.array([-1]), unit=unit).tolist() == [19691231]
+    datetimes = ticks.astype('datetime64[{}]'.format(unit))
+    assert timestamps_to_dateints(datetimes).tolist() == expected
+
+
+def test_timestamps_to_dateints_errors():
+    np = pytest.importorskip('numpy')
+    with pytest.raises(ValueError):
+        timestamps_to_dateints(np.array([0]), unit='h')
+    with pytest.raises(ValueError):
+        timestamps_to_dateints(np.array(['NaT'], dtype='datetime64[s]'))
+    assert timestamps_to_dateints(
+        np.array([-30610224000, 253402300799])).tolist() == [
+            10000101, 99991231]
+    with pytest.raises(OverflowError):
+        timestamps_to_dateints(np.array([0, 253402300800]))
+    with pytest.raises(OverflowError):
+        timestamps_to_dateints(np.array([-30610224001, 0]))
+    # the dense lookup path is checked as well
+    with pytest.raises(OverflowError):
+        timestamps_to_dateints(np.full(100, 253402300800))
+
+
+def test_timestamps_to_dateints_dense():
+    """Arrays spanning few days go through the day lookup path."""
+    np = pytest.importorskip('numpy')
+    timestamps = np.arange(1506816000, 1509494400, 37, dtype=np.int64)
+    dateints = timestamps_to_dateints(timestamps)
+    assert dateints.dtype == np.int32
+    assert dateints[::1000].tolist() == [
+        _utc_dateint(ts) for ts in timestamps[::1000].tolist()]
+    assert timestamps_to_dateints(np.array([], dtype=np.int64)).size == 0
+
+
+@pytest.mark.parametrize('timezone_name', [
+    'UTC', 'Asia/Jerusalem', 'America/New_York', 'Asia/Kolkata',
+    'Australia/Lord_Howe'])
+def test_timestamp_to_local_datetime(timezone_name):
+    for timestamp in _random_timestamps(count=300)[:300]:
+        if not 0 <= timestamp < 2 ** 31:
+            continue
+        local = timestamp_to_local_datetime(timestamp, timezone_name)
+        delo = timestamp_to_local_time(timestamp, timezone_name)
+        assert local == delo.datetime
+        assert local.utcoffset() == delo.datetime.utcoffset()
+        assert local.replace(tzinfo=None) == delo.datetime.replace(
+            tzinfo=None)
+        assert int(local.timestamp()) == timestamp
+        assert tz_aware_dt_from_timestamp_and_tz(
+            timestamp, timezone_name) == local
+
+
+@pytest.mark.parametrize('fmt', [
+    'yyyy-MM-dd HH:mm:ss', 'y yy yyy yyyyy', 'M MM MMM MMMM MMMMM LLL',
+    'E EE EEE EEEE EEEEE', 'h hh K k a', 'SSS SSSSSSS', 'D DDD A',
+    "'o''clock' '' HH 'h' mm 100%", 'medium', 'yyyy-MM-dd HH:mm:ss zzzz'])
+def test_timestamp_to_local_time_str(fmt):
+    timestamps = [1506984924, 1506984924.25, 1488672429, 951868799, 0]
+    for timezone_name in ('UTC', 'Asia/Jerusalem', 'America/New_York'):
+        expected = [
+            timestamp_to_local_time(
+                timestamp, timezone_name).format_datetime(fmt)
+            for timestamp in timestamps
+        ]
+        assert [
+            timestamp_to_local_time_str(timestamp, timezone_name, fmt)
+            for timestamp in timestamps
+        ] == expected
+        assert timestamps_to_local_time_strs(
+            timestamps, timezone_name, fmt) == expected
+
+
+def test_timestamps_to_local_time_strs_array():
+    np = pytest.importorskip('numpy')
+    assert timestamps_to_local_time_strs(
+        np.array([1506984924, 0]), 'Asia/Jerusalem') == [
+            '2017-10-03 01:55:24', '1970-01-01 02:00:00']
+
+
+@pytest.fixture
+def local_time_str_cache():
+    use_local_time_str_cache()
+    yield
+    use_local_time_str_cache(False)
+
+
+@pytest.mark.usefixtures('local_time_str_cache')
+@pytest.mark.parametrize('fmt', [
+    'yyyy-MM-dd HH:mm:ss', 'yyyy-MM-dd HH:mm:ss.SSS', "HH:mm:ss,SSSSSS '%'",
+    'A S', 'medium'])
+def test_local_time_str_cache(fmt):
+    rand = random.Random(0)
+    timestamps = sorted(
+        1506984924 + rand.random() * 5 for _ in range(200)) + [
+            1506984930, 1506984930, -1e-07, -0.25, -0.75]
+    for timezone_name in ('UTC', 'Asia/Jerusalem'):
+        for timestamp in timestamps:
+            assert timestamp_to_local_time_str(
+                timestamp, timezone_name, fmt) == timestamp_to_local_time(
+                    timestamp, timezone_name).format_datetime(fmt)
+    info = local_time_str_cache_info()
+    if fmt == 'medium':
+        assert info == (0, 0, 0)
+    else:
+        assert info.currsize == 2
+        assert info.misses <= 2 * 10
+        assert info.hits + info.misses == 2 * len(timestamps) - 2
+
+
+def test_local_time_str_cache_switch():
+    assert local_time_str_cache_info() is None
+    use_local_time_str_cache()
+    timestamp_to_local_time_str(1506984924, 'UTC')
+    timestamp_to_local_time_str(1506984924, 'UTC')
+    assert local_time_str_cache_info() == (1, 1, 1)
+    use_local_time_str_cache(False)
+    assert local_time_str_cache_info() is None
+
+
+def test_get_timestamp():
+    assert get_timestamp('Asia/Jerusalem', 2017, 10, 3, 1, 55) == 1506984900
+    assert get_timestamp('UTC', 2016, 2, 29) == 1456704000
+    # 2017-03-24 02:30 does not exist in Jerusalem
+    assert get_timestamp('Asia/Jerusalem', 2017, 3, 24, 2, 30) == 1490315400
+    assert get_timestamp(
+        'Asia/Jerusalem', 2017, 3, 24, 2, 30, dst_policy='dst') == 1490311800
+    for args in ((2017, 2, 29), (2017, 13, 1), (2017, 1, 1, 24),
+                 (2017, 1, 1, 0, 60)):
+        with pytest.raises(ValueError):
+            get_timestamp('UTC', *args)
+
+
+@pytest.mark.parametrize('timezone_name', [
+    'UTC', 'Asia/Jerusalem', 'America/New_York', 'Australia/Lord_Howe'])
+@pytest.mark.parametrize('span', [3600, 40 * 86400, 4 * 10 ** 9])
+def test_timestamps_to_local_times(timezone_name, span):
+    np = pytest.importorskip('numpy')
+    rand = random.Random(span)
+    timestamps = [
+        1506816000 - span // 2 + rand.randrange(span) for _ in range(500)]
+    local_times = timestamps_to_local_times(
+        np.array(timestamps, dtype=np.int64), timezone_name)
+    dateints, seconds_in_day = timestamps_to_local_dateints(
+        np.array(timestamps, dtype=np.int64), timezone_name)
+    for ix, timestamp in enumerate(timestamps):
+        local = timestamp_to_local_datetime(timestamp, timezone_name)
+        assert local_times[ix] == timestamp + local.utcoffset().total_seconds()
+        assert dateints[ix] == local.year * 10000 + local.month * 100 \
+            + local.day
+        assert seconds_in_day[ix] == (
+            local.hour * 60 + local.minute) * 60 + local.second
+    ms_dateints, ms_seconds_in_day = timestamps_to_local_dateints(
+        np.array(timestamps, dtype=np.int64) * 1000 + 999, timezone_name,
+        unit='ms')
+    assert (ms_dateints == dateints).all()
+    assert (ms_seconds_in_day == seconds_in_day).all()
+
+
+def test_timestamps_to_local_times_edge_cases():
+    np = pytest.importorskip('numpy')
+    assert timestamps_to_local_times(
+        np.array([], dtype=np.int64), 'Asia/Jerusalem').size == 0
+    assert timestamps_to_local_times(
+        [0.5, 1.25], 'America/New_York').tolist() == [-17999.5, -17998.75]
+    with pytest.raises(ValueError):
+        timestamps_to_local_times(np.array([0]), 'UTC', unit='h')
+
+
+_TIMEZONES = [
+    'UTC', 'Asia/Jerusalem', 'America/New_York', 'Asia/Kolkata',
+    'Australia/Lord_Howe', 'Pacific/Kiritimati', 'America/Adak']
+
+
+def test_tz_aware_timestamps_to_dateints():
+    np = pytest.importorskip('numpy')
+    rand = random.Random(0)
+    timestamps = [rand.randrange(1483228800, 1514764800) for _ in range(3000)]
+    # leaving the last timezone unused, as categories often have
+    codes = [rand.randrange(len(_TIMEZONES) - 1) for _ in timestamps]
+    names = [_TIMEZONES[code] for code in codes]
+    expected = []
+    for timestamp, name in zip(timestamps, names):
+        local = timestamp_to_local_datetime(timestamp, name)
+        expected.append(local.year * 10000 + local.month * 100 + local.day)
+    timestamps = np.array(timestamps, dtype=np.int64)
+    dateints = tz_aware_timestamps_to_dateints(timestamps, names)
+    assert dateints.dtype == np.int32
+    assert dateints.tolist() == expected
+    assert tz_aware_timestamps_to_dateints(
+        timestamps, np.array(codes, dtype=np.int16),
+        categories=_TIMEZONES).tolist() == expected
+    categorical = SimpleNamespace(
+        codes=np.array(codes, dtype=np.int8), categories=_TIMEZONES)
+    assert tz_aware_timestamps_to_dateints(
+        timestamps, categorical).tolist() == expected
+    assert tz_aware_timestamps_to_dateints(
+        timestamps * 1000 + 999, names, unit='ms').tolist() == expected
+    assert tz_aware_timestamps_to_dateints(
+        np.array([], dtype=np.int64), []).size == 0
+
+
+def test_tz_aware_timestamps_to_dateints_errors():
+    np = pytest.importorskip('numpy')
+    timestamps = np.array([0, 1], dtype=np.int64)
+    with pytest.raises(ValueError):
+        tz_aware_timestamps_to_dateints(timestamps, ['UTC'])
+    with pytest.raises(ValueError):
+        tz_aware_timestamps_to_dateints(
+            timestamps, np.array([0, 2]), categories=['UTC', 'Asia/Tokyo'])
+    with pytest.raises(ValueError):
+        tz_aware_timestamps_to_dateints(
+            timestamps, np.array([-1, 0]), categories=['UTC'])
+    with pytest.raises(TypeError):
+        tz_aware_timestamps_to_dateints(
+            timestamps, np.array([0.0, 1.0]), categories=['UTC'])
+    with pytest.raises(KeyError):
+        tz_aware_timestamps_to_dateints(timestamps, ['UTC', 'Not/A_Timezone'])
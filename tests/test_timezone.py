@@ -0,0 +1,194 @@
+"""Testing the timezone subpackage."""
+
+from datetime import datetime, timedelta, timezone
+import random
+
+import pytest
+import pytz
+
+from utilitime.timezone import (
+    get_timezone,
+    get_timezone_backend,
+    set_timezone_backend,
+    TimezoneBackend,
+    PytzBackend,
+    ZoneInfoBackend,
+    get_transition_table,
+    TransitionTable,
+    NonExistentTimeError,
+    AmbiguousTimeError,
+)
+from utilitime.datetime import localize_datetime
+
+_EPOCH = datetime(1970, 1, 1)
+
+_TIMEZONES = [
+    'UTC', 'Asia/Jerusalem', 'America/New_York', 'Asia/Kolkata',
+    'Australia/Lord_Howe', 'Europe/Moscow', 'Pacific/Apia']
+
+
+@pytest.fixture
+def pytz_backend():
+    backend = get_timezone_backend()
+    set_timezone_backend('pytz')
+    yield
+    set_timezone_backend(backend)
+
+
+@pytest.fixture
+def zoneinfo_backend():
+    zoneinfo = pytest.importorskip('zoneinfo')
+    backend = get_timezone_backend()
+    set_timezone_backend('zoneinfo')
+    yield zoneinfo
+    set_timezone_backend(backend)
+
+
+def test_get_timezone():
+    tz = get_timezone('Asia/Jerusalem')
+    assert tz is get_timezone('Asia/Jerusalem')
+    assert tz.utcoffset(datetime(2017, 1, 1)).total_seconds() == 7200
+    with pytest.raises(KeyError):
+        get_timezone('Not/A_Timezone')
+
+
+def test_get_transition_table():
+    table = get_transition_table('Asia/Jerusalem')
+    assert table is get_transition_table('Asia/Jerusalem')
+    assert table.utc_offset(1506984924) == 10800
+    assert table.utc_offset(1483228800) == 7200
+    assert table.utc_to_local(1506984924) == 1506984924 + 10800
+    assert len(get_transition_table('UTC')) == 1
+    with pytest.raises(KeyError):
+        get_transition_table('Not/A_Timezone')
+
+
+def test_fixed_offset_transition_table():
+    table = TransitionTable.from_tzinfo(timezone(timedelta(hours=-3)))
+    assert len(table) == 1
+    assert table.utc_offset(-10 ** 12) == table.utc_offset(10 ** 12) == -10800
+    assert table.local_to_utc(0) == 10800
+    with pytest.raises(ValueError):
+        TransitionTable([], [], [], [])
+
+
+def _local_times_around_transitions(table, count=40):
+    rand = random.Random(0)
+    local_times = []
+    for instant in table.instants[1:]:
+        local_times.extend(
+            instant + table.offsets[0] + delta
+            for delta in (-7200, -3600, -1800, -60, 0, 60, 1800, 3600))
+    local_times.extend(
+        rand.randrange(-2 * 10 ** 9, 3 * 10 ** 9) for _ in range(count))
+    return [local_time - local_time % 60 for local_time in local_times]
+
+
+@pytest.mark.usefixtures('pytz_backend')
+@pytest.mark.parametrize('timezone_name', _TIMEZONES)
+def test_local_to_utc_matches_pytz(timezone_name):
+    tz = pytz.timezone(timezone_name)
+    table = get_transition_table(timezone_name)
+    for local_time in _local_times_around_transitions(table):
+        local = _EPOCH + timedelta(seconds=local_time)
+        for is_dst, dst_policy in ((False, 'standard'), (True, 'dst')):
+            expected = tz.localize(local, is_dst=is_dst)
+            assert table.local_to_utc(local_time, dst_policy) == (
+                expected.replace(tzinfo=None) - expected.utcoffset()
+                - _EPOCH).total_seconds()
+
+
+@pytest.mark.usefixtures('pytz_backend')
+@pytest.mark.parametrize('timezone_name', _TIMEZONES)
+def test_utc_to_local_matches_pytz(timezone_name):
+    tz = pytz.timezone(timezone_name)
+    table = get_transition_table(timezone_name)
+    rand = random.Random(1)
+    for local_time in _local_times_around_transitions(table):
+        timestamp = local_time - table.offsets[0] + rand.random()
+        expected = datetime.fromtimestamp(timestamp, tz)
+        local = table.local_datetime(timestamp)
+        assert local.isoformat() == expected.isoformat()
+        assert local.tzname() == expected.tzname()
+        assert table.utc_offset(timestamp) == (
+            expected.utcoffset().total_seconds())
+        assert table.utc_to_local(timestamp) == timestamp + table.utc_offset(
+            timestamp)
+        utc = _EPOCH + timedelta(seconds=timestamp)
+        localized = localize_datetime(utc, timezone_name)
+        assert localized.isoformat() == utc.replace(
+            tzinfo=pytz.utc).astimezone(tz).isoformat()
+        assert localize_datetime(
+            utc.replace(tzinfo=pytz.utc), timezone_name) == localized
+
+
+@pytest.mark.parametrize('timezone_name', _TIMEZONES + ['Europe/Dublin'])
+def test_conversions_match_zoneinfo(timezone_name, zoneinfo_backend):
+    tz = zoneinfo_backend.ZoneInfo(timezone_name)
+    assert get_timezone(timezone_name) is tz
+    table = get_transition_table(timezone_name)
+    for local_time in _local_times_around_transitions(table):
+        timestamp = local_time - table.offsets[0]
+        expected = datetime.fromtimestamp(timestamp, tz)
+        local = table.local_datetime(timestamp)
+        assert local.isoformat() == expected.isoformat()
+        assert local.fold == expected.fold
+        assert localize_datetime(
+            _EPOCH + timedelta(seconds=timestamp), timezone_name) == expected
+        local = _EPOCH + timedelta(seconds=local_time)
+        for fold in (0, 1):
+            assert local.replace(tzinfo=tz, fold=fold).timestamp() in (
+                table.local_to_utc(local_time, 'earlier'),
+                table.local_to_utc(local_time, 'later'))
+
+
+def test_timezone_backends(zoneinfo_backend):
+    assert isinstance(get_timezone_backend(), ZoneInfoBackend)
+    table = get_transition_table('America/New_York')
+    set_timezone_backend(PytzBackend())
+    assert get_timezone_backend().name == 'pytz'
+    assert get_timezone('America/New_York') is pytz.timezone(
+        'America/New_York')
+    assert get_transition_table('America/New_York') is not table
+    with pytest.raises(KeyError):
+        get_timezone('Not/A_Timezone')
+    set_timezone_backend('zoneinfo')
+    assert isinstance(
+        get_timezone('Asia/Jerusalem'), zoneinfo_backend.ZoneInfo)
+    with pytest.raises(KeyError):
+        get_timezone('Not/A_Timezone')
+    with pytest.raises(ValueError):
+        set_timezone_backend('dateutil')
+
+
+def test_incomplete_timezone_backend():
+    class IncompleteBackend(TimezoneBackend):
+        name = 'incomplete'
+
+    with pytest.raises(TypeError):
+        IncompleteBackend()
+
+
+def test_dst_policies():
+    table = get_transition_table('America/New_York')
+    # 2017-03-12 02:30 does not exist; 2017-11-05 01:30 happens twice
+    gap = 1489285800
+    overlap = 1509845400
+    edt, est = 4 * 3600, 5 * 3600
+    assert table.local_to_utc(gap) == gap + est
+    assert table.local_to_utc(gap, 'standard') == gap + est
+    assert table.local_to_utc(gap, 'dst') == gap + edt
+    assert table.local_to_utc(gap, 'earlier') == gap + edt
+    assert table.local_to_utc(gap, 'later') == gap + est
+    assert table.local_to_utc(overlap) == overlap + est
+    assert table.local_to_utc(overlap, 'dst') == overlap + edt
+    assert table.local_to_utc(overlap, 'earlier') == overlap + edt
+    assert table.local_to_utc(overlap, 'later') == overlap + est
+    with pytest.raises(NonExistentTimeError):
+        table.local_to_utc(gap, 'raise')
+    with pytest.raises(AmbiguousTimeError):
+        table.local_to_utc(overlap, 'raise')
+    assert table.local_to_utc(gap - 3600, 'raise') == gap - 3600 + est
+    for local_time in (gap, overlap, gap - 3600):
+        with pytest.raises(ValueError):
+            table.local_to_utc(local_time, 'nearest')
@@ -1,19 +1,51 @@
 """Utility pure-Python 3 decorators."""
 
-import utilitime.dateint
-import utilitime.datetime
-import utilitime.time
-import utilitime.timestamp
-import utilitime.weekday
+import importlib
+import os
 
 from .time_interval import TimeInterval
 try:
-    del utilitime
     del time_interval
 except NameError: # pragma: no cover
     pass
 
-# pylint: disable=C0413
-from ._version import get_versions
-__version__ = get_versions()['version']
-del get_versions
+# subpackages are only imported on first access, so that importing utilitime
+# does not pay for the dependencies of subpackages that are never used
+_SUBMODULES = frozenset([
+    'clock',
+    'constants',
+    'dateint',
+    'datetime',
+    'instrumentation',
+    'memoization',
+    'rollover',
+    'time',
+    'timestamp',
+    'timezone',
+    'weekday',
+])
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        # importing a submodule also binds it as an attribute of the package,
+        # so this is only called on first access
+        return importlib.import_module('.' + name, __name__)
+    if name == '__version__':
+        # versioneer may run git to determine the version, so this is lazy too
+        from ._version import get_versions
+        version = get_versions()['version']
+        globals()['__version__'] = version
+        return version
+    raise AttributeError('module {!r} has no attribute {!r}'.format(
+        __name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES | {'__version__'})
+
+
+if os.environ.get('UTILITIME_INSTRUMENTATION', '0') not in ('', '0'):
+    from .instrumentation import use_instrumentation
+    use_instrumentation()
+    del use_instrumentation
@@ -0,0 +1,256 @@
+"""Integer-only civil calendar arithmetic.
+
+Days are counted as ordinals relative to the epoch, so that day 0 is
+1970-01-01, in the proleptic Gregorian calendar. The conversions follow
+Howard Hinnant's days_from_civil and civil_from_days algorithms, using only
+floor division and modulo; they thus work unchanged both on Python ints and
+on numpy integer arrays, and do not allocate any date or datetime objects.
+"""
+
+from numbers import Integral
+
+# the ordinal of 0000-03-01, the start of the first 400-year era
+_ERA_START_OFFSET = 719468
+_DAYS_IN_ERA = 146097
+
+# the ordinals of 1000-01-01 and 9999-12-31, the first and last days with
+# valid, 8-digit dateints
+MIN_DATEINT_ORDINAL = -354285
+MAX_DATEINT_ORDINAL = 2932896
+
+
+def days_from_civil(year, month, day):
+    """Returns the day ordinal of the given year, month and day.
+
+    Arguments
+    ---------
+    year, month, day : int or numpy.ndarray
+        The components of a date in the proleptic Gregorian calendar.
+
+    Returns
+    -------
+    int or numpy.ndarray
+        The number of days since 1970-01-01 (negative for earlier dates).
+
+    Example
+    -------
+    >>> days_from_civil(1970, 1, 1)
+    0
+    >>> days_from_civil(2017, 2, 23)
+    17220
+    """
+    # years start on March 1st, so that the leap day is the last of the year
+    year = year - (month <= 2)
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 \
+        + day_of_year
+    return era * _DAYS_IN_ERA + day_of_era - _ERA_START_OFFSET
+
+
+def civil_from_days(days):
+    """Returns the year, month and day of the given day ordinal.
+
+    Arguments
+    ---------
+    days : int or numpy.ndarray
+        The number of days since 1970-01-01 (negative for earlier dates).
+
+    Returns
+    -------
+    year, month, day : int or numpy.ndarray
+        The components of the corresponding proleptic Gregorian date.
+
+    Example
+    -------
+    >>> civil_from_days(0)
+    (1970, 1, 1)
+    >>> civil_from_days(17220)
+    (2017, 2, 23)
+    """
+    days = days + _ERA_START_OFFSET
+    era = days // _DAYS_IN_ERA
+    day_of_era = days - era * _DAYS_IN_ERA
+    year_of_era = (
+        day_of_era - day_of_era // 1460 + day_of_era // 36524
+        - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (
+        365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    month = (shifted_month + 2) % 12 + 1
+    year = year_of_era + era * 400 + (month <= 2)
+    return year, month, day
+
+
+def invalid_dateint_error(dateint):
+    """Returns the ValueError raised for the given invalid dateint."""
+    return ValueError(
+        '{!r} is not a valid dateint. Dateints must depict an existing '
+        'calendaric day with exactly 8 digits; the first four '
+        'representing the year, the next two the months, and the last '
+        'two the days.'.format(dateint))
+
+
+def dateint_to_ordinal(dateint):
+    """Returns the day ordinal of the given dateint, after validating it.
+
+    This is a scalar specialization of days_from_civil, about twice as fast
+    on Python ints; use dateints_to_ordinals for arrays. The dateint is
+    validated while it is decomposed, so that validation costs just a few
+    comparisons.
+
+    Arguments
+    ---------
+    dateint : int
+        An integer object decipting a specific calendaric day; e.g. 20161225.
+
+    Returns
+    -------
+    int
+        The number of days since 1970-01-01.
+
+    Raises
+    ------
+    ValueError
+        If the given object is not a valid dateint; see
+        utilitime.dateint.is_valid_dateint.
+    """
+    # the exact type check is a fast path for the common case of plain ints
+    if (dateint.__class__ is int or isinstance(dateint, Integral)) and (
+            10000101 <= dateint <= 99991231):
+        year, month_day = divmod(dateint, 10000)
+        month, day = divmod(month_day, 100)
+        if 0 < day and 0 < month <= 12 and (
+                day <= 28 or day <= days_in_month(year, month)):
+            if month > 2:
+                month -= 3
+            else:
+                year -= 1
+                month += 9
+            era, year_of_era = divmod(year, 400)
+            return era * _DAYS_IN_ERA + year_of_era * 365 + year_of_era // 4 \
+                - year_of_era // 100 + (153 * month + 2) // 5 + day - 1 \
+                - _ERA_START_OFFSET
+    raise invalid_dateint_error(dateint)
+
+
+def ordinal_to_dateint(days):
+    """Returns the dateint of the given day ordinal.
+
+    This is a scalar specialization of civil_from_days, about twice as fast
+    on Python ints; use ordinals_to_dateints for arrays.
+
+    Arguments
+    ---------
+    days : int
+        The number of days since 1970-01-01 (negative for earlier dates).
+
+    Returns
+    -------
+    int
+        The corresponding dateint; e.g. 20161225.
+    """
+    era, day_of_era = divmod(days + _ERA_START_OFFSET, _DAYS_IN_ERA)
+    year_of_era = (
+        day_of_era - day_of_era // 1460 + day_of_era // 36524
+        - day_of_era // 146096) // 365
+    day_of_year = day_of_era - 365 * year_of_era - year_of_era // 4 \
+        + year_of_era // 100
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    if shifted_month < 10:
+        return (year_of_era + era * 400) * 10000 \
+            + (shifted_month + 3) * 100 + day
+    return (year_of_era + era * 400 + 1) * 10000 \
+        + (shifted_month - 9) * 100 + day
+
+
+def checked_ordinal_to_dateint(days):
+    """Returns the dateint of the given day ordinal, after checking that it
+    has a valid, 8-digit dateint.
+
+    Arguments
+    ---------
+    days : int
+        The number of days since 1970-01-01 (negative for earlier dates).
+
+    Returns
+    -------
+    int
+        The corresponding dateint; e.g. 20161225.
+
+    Raises
+    ------
+    OverflowError
+        If the day is before 1000-01-01 or after 9999-12-31.
+    """
+    if not MIN_DATEINT_ORDINAL <= days <= MAX_DATEINT_ORDINAL:
+        raise dateint_overflow_error(days)
+    return ordinal_to_dateint(days)
+
+
+def dateint_overflow_error(days):
+    """Returns the OverflowError raised for days without a valid dateint."""
+    return OverflowError(
+        'Day {} since 1970-01-01 is out of the range of dateints, from '
+        '10000101 to 99991231.'.format(days))
+
+
+def dateints_to_ordinals(dateints):
+    """Returns the day ordinals of the given array of dateints.
+
+    Arguments
+    ---------
+    dateints : numpy.ndarray
+        An integer array of dateints; e.g. numpy.array([20161225, 20170101]).
+
+    Returns
+    -------
+    numpy.ndarray
+        The number of days since 1970-01-01 of each given dateint.
+    """
+    return days_from_civil(
+        dateints // 10000, dateints // 100 % 100, dateints % 100)
+
+
+def ordinals_to_dateints(days):
+    """Returns the dateints of the given array of day ordinals.
+
+    Arguments
+    ---------
+    days : numpy.ndarray
+        An integer array of day ordinals, counted from 1970-01-01.
+
+    Returns
+    -------
+    numpy.ndarray
+        The corresponding dateints; e.g. numpy.array([20161225, 20170101]).
+    """
+    year, month, day = civil_from_days(days)
+    return year * 10000 + month * 100 + day
+
+
+# the number of days in each month of a common year, indexed by month
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def days_in_month(year, month):
+    """Returns the number of days in the given month.
+
+    Arguments
+    ---------
+    year : int
+        A year in the proleptic Gregorian calendar.
+    month : int
+        A month, between 1 and 12.
+
+    Returns
+    -------
+    int
+        The number of days in the given month of the given year.
+    """
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _DAYS_IN_MONTH[month]
@@ -0,0 +1,50 @@
+"""A zero-dependency decorator for lazily computed values."""
+
+from functools import wraps
+
+_UNSET = object()
+
+
+def lazy_property(function):
+    """Caches the first return value of a function for all subsequent calls.
+
+    This decorator is useful for argument-less functions that behave more like
+    a global or static property that should be calculated once, but lazily
+    (i.e. only if requested). Concurrent first calls may each compute the
+    value, but all calls return the value cached first.
+
+    Arguments
+    ---------
+    function : callable
+        The function computing the value.
+
+    Returns
+    -------
+    callable
+        A function returning the value computed by the first call of the
+        given function.
+
+    Example
+    -------
+    >>> @lazy_property
+    ... def answer():
+    ...     print('computing')
+    ...     return 42
+    >>> answer()
+    computing
+    42
+    >>> answer()
+    42
+    """
+    value = _UNSET
+
+    @wraps(function)
+    def _wrapper(*args):
+        nonlocal value
+        if value is _UNSET:
+            computed = function(*args)
+            if value is _UNSET:
+                value = computed
+        return value
+
+    return _wrapper
@@ -0,0 +1,35 @@
+"""Helpers for importing optional dependencies."""
+
+
+def import_numpy():
+    """Returns the numpy module, raising an informative error if missing.
+
+    Returns
+    -------
+    module
+        The numpy module.
+    """
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover
+        raise ImportError(
+            "Array-aware utilitime functions require numpy. Install it with "
+            "pip install utilitime[numpy]") from None
+    return numpy
+
+
+def import_delorean():
+    """Returns the delorean module, raising an informative error if missing.
+
+    Returns
+    -------
+    module
+        The delorean module.
+    """
+    try:
+        import delorean
+    except ImportError:  # pragma: no cover
+        raise ImportError(
+            "Delorean-based utilitime functions require delorean. Install it "
+            "with pip install utilitime[delorean]") from None
+    return delorean
@@ -0,0 +1,13 @@
+"""Clocks providing the current time to utilitime functions."""
+
+from .clock import (
+    Clock,
+    SystemClock,
+    ManualClock,
+    get_clock,
+    set_clock,
+)
+try:
+    del clock
+except NameError: # pragma: no cover
+    pass
@@ -0,0 +1,149 @@
+"""Clocks providing the current time to utilitime functions."""
+
+import abc
+from datetime import datetime
+import time
+
+from ..constants import SECONDS_IN_DAY
+from .._civil import ordinal_to_dateint
+
+
+class Clock(abc.ABC):
+    """The base class of clocks.
+
+    A clock provides the current time, as an epoch timestamp, to utc_time,
+    today_int and any other utilitime function using the current time.
+    Subclasses need only implement the time method; the current dateint is
+    then cached until the UTC day of the time the clock returns changes, so
+    that it is recomputed just once a day.
+    """
+
+    name = None
+
+    def __init__(self):
+        # the first and last timestamps of the current day, and its dateint
+        self._today = (0, -1, None)
+
+    @abc.abstractmethod
+    def time(self):
+        """Returns the current time, as an epoch timestamp.
+
+        Returns
+        -------
+        float
+            The number of seconds since the epoch.
+        """
+
+    def utc_datetime(self):
+        """Returns the current UTC time as a naive datetime object."""
+        return datetime.utcfromtimestamp(self.time())
+
+    def today_int(self):
+        """Returns the dateint of the current UTC day."""
+        now = self.time()
+        today = self._today
+        if today[0] <= now < today[1]:
+            return today[2]
+        ordinal = int(now // SECONDS_IN_DAY)
+        day_start = ordinal * SECONDS_IN_DAY
+        # a single tuple, so that threads never see parts of different days
+        today = (day_start, day_start + SECONDS_IN_DAY,
+                 ordinal_to_dateint(ordinal))
+        self._today = today
+        return today[2]
+
+    def __repr__(self):
+        return '<{} clock>'.format(self.name)
+
+
+class SystemClock(Clock):
+    """A clock reading the system's wall clock on every call."""
+
+    name = 'system'
+
+    def __init__(self):
+        super().__init__()
+        # bound directly, to save a Python-level call per reading
+        self.time = time.time
+        self.utc_datetime = datetime.utcnow
+
+    # implements the abstract method, though instances bind time.time itself
+    def time(self):  # pylint: disable=E0202
+        return time.time()
+
+
+class ManualClock(Clock):
+    """A deterministic clock, returning the time it was last set to.
+
+    Inject it with set_clock to test code using the current time, or to
+    replay recorded events at the times they were recorded.
+
+    Arguments
+    ---------
+    timestamp : int or float, default 0
+        The initial time of the clock, as an epoch timestamp.
+
+    Example
+    -------
+    >>> clock = ManualClock(1506984924)
+    >>> set_clock(clock)
+    >>> today_int()
+    20171002
+    >>> clock.advance(SECONDS_IN_DAY)
+    >>> today_int()
+    20171003
+    """
+
+    name = 'manual'
+
+    def __init__(self, timestamp=0):
+        super().__init__()
+        self.timestamp = timestamp
+
+    def time(self):
+        return self.timestamp
+
+    def set(self, timestamp):
+        """Sets the time of the clock to the given epoch timestamp."""
+        self.timestamp = timestamp
+
+    def advance(self, seconds):
+        """Advances the time of the clock by the given number of seconds."""
+        self.timestamp += seconds
+
+
+CLOCKS = {clock.name: clock for clock in (SystemClock,)}
+
+_CLOCK = SystemClock()
+
+
+def get_clock():
+    """Returns the clock in use.
+
+    Returns
+    -------
+    Clock
+        The clock providing the current time to utilitime functions.
+    """
+    return _CLOCK
+
+
+def set_clock(clock):
+    """Sets the clock used by all utilitime functions.
+
+    The system clock is used by default. Use a ManualClock in tests and
+    replays.
+
+    Arguments
+    ---------
+    clock : str or Clock
+        Either 'system' or a Clock object.
+    """
+    global _CLOCK  # pylint: disable=W0603
+    if not isinstance(clock, Clock):
+        try:
+            clock = CLOCKS[clock]()
+        except KeyError:
+            raise ValueError('Unknown clock {!r}; use one of {}.'.format(
+                clock, ', '.join(CLOCKS))) from None
+    _CLOCK = clock
@@ -20,6 +20,21 @@ WEEKDAYS = [
     'Sunday'
 ]
 
+MONTHS = [
+    'January',
+    'February',
+    'March',
+    'April',
+    'May',
+    'June',
+    'July',
+    'August',
+    'September',
+    'October',
+    'November',
+    'December'
+]
+
 WESTERN_WORKDAYS = [
     'Monday',
     'Tuesday',
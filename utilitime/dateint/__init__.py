@@ -1,6 +1,7 @@
 """Dateint-related utility functions."""
 
 from .dateint import (
+    is_valid_dateint,
     decompose_dateint,
     dateint_to_date,
     tz_aware_dateint_to_timestamp,
@@ -10,12 +11,27 @@ from .dateint import (
     dateint_to_weekday,
     dateint_to_weekday_name,
     shift_dateint,
+    DateintRange,
     dateint_range,
     today_int,
     dateint_week_by_dateint,
     dateint_difference,
+    validate_dateints,
+    decompose_dateints,
+    dateints_to_dates,
+    dateints_to_datetimes,
+    dateints_to_utc_timestamps,
+    tz_aware_dateint_range_bounds,
+    dateints_to_weekdays,
+    dateints_to_weekday_names,
+    use_calendar_table,
+)
+from .calendar_table import (
+    CalendarTable,
+    get_calendar_table,
 )
 try:
     del dateint
+    del calendar_table
 except NameError: # pragma: no cover
     pass
@@ -0,0 +1,177 @@
+"""A precomputed calendar lookup table for dateint operations."""
+
+from array import array
+
+from .._civil import (
+    days_from_civil,
+    civil_from_days,
+)
+
+DEFAULT_FIRST_YEAR = 1900
+DEFAULT_LAST_YEAR = 2199
+
+
+class CalendarTable:
+    """A precomputed table of calendar attributes for a range of years.
+
+    The table maps dateints to day ordinals (days since 1970-01-01) and back,
+    and holds the weekday, day of year and ISO week of every day, and the
+    length of every month, in the covered range of years. All lookups take
+    constant time.
+
+    Attributes are stored in compact stdlib arrays, which also expose the
+    buffer protocol, so they can be wrapped by numpy.frombuffer without
+    copying. Per covered day, the table keeps a 4-byte dateint, a 2-byte day
+    of year, a 1-byte weekday and a 1-byte ISO week; per covered month, a
+    4-byte month start ordinal and a 1-byte month length. The default range
+    of 1900-2199, spanning 109,573 days and 3,600 months, thus takes up about
+    0.9 MB; see the nbytes attribute.
+
+    Arguments
+    ---------
+    first_year : int, default 1900
+        The first year covered by the table.
+    last_year : int, default 2199
+        The last year covered by the table, inclusive.
+    """
+
+    def __init__(self, first_year=DEFAULT_FIRST_YEAR,
+                 last_year=DEFAULT_LAST_YEAR):
+        if first_year > last_year:
+            raise ValueError('first_year must not be greater than last_year.')
+        self.first_year = first_year
+        self.last_year = last_year
+        self.first_ordinal = days_from_civil(first_year, 1, 1)
+        self.last_ordinal = days_from_civil(last_year + 1, 1, 1) - 1
+        month_count = (last_year - first_year + 1) * 12
+        self.month_starts = array('i', (
+            days_from_civil(first_year + ix // 12, ix % 12 + 1, 1)
+            for ix in range(month_count + 1)))
+        self.month_lengths = array('b', (
+            self.month_starts[ix + 1] - self.month_starts[ix]
+            for ix in range(month_count)))
+        self.dateints = array('i')
+        self.days_of_year = array('h')
+        for ix, month_length in enumerate(self.month_lengths):
+            month_start = (first_year + ix // 12) * 10000 + (ix % 12 + 1) * 100
+            self.dateints.extend(range(
+                month_start + 1, month_start + month_length + 1))
+            day_of_year = self.month_starts[ix] - self.month_starts[
+                ix - ix % 12]
+            self.days_of_year.extend(range(
+                day_of_year + 1, day_of_year + month_length + 1))
+        # whole Monday-based weeks covering the table, trimmed at the ends
+        day_count = len(self.dateints)
+        # 1970-01-01, the day of ordinal 0, was a Thursday
+        lead = (self.first_ordinal + 3) % 7
+        week_count = (lead + day_count) // 7 + 1
+        self.weekdays = (array('b', range(7)) * week_count)[
+            lead:lead + day_count]
+        self.iso_weeks = array('b')
+        for week_ix in range(week_count):
+            self.iso_weeks.extend(array('b', [_iso_week(
+                self.first_ordinal - lead + week_ix * 7)]) * 7)
+        self.iso_weeks = self.iso_weeks[lead:lead + day_count]
+
+    @property
+    def nbytes(self):
+        """The memory footprint of the table's arrays, in bytes."""
+        return sum(
+            arr.itemsize * len(arr) for arr in (
+                self.month_starts, self.month_lengths, self.dateints,
+                self.weekdays, self.days_of_year, self.iso_weeks))
+
+    def __len__(self):
+        return len(self.dateints)
+
+    def __repr__(self):
+        return '{}({}, {})'.format(
+            type(self).__name__, self.first_year, self.last_year)
+
+    def _day_index(self, dateint):
+        """Returns the index of the given dateint in the day arrays, or None
+        if it is not a valid dateint covered by the table."""
+        year_month, day = divmod(dateint, 100)
+        year, month = divmod(year_month, 100)
+        month_ix = (year - self.first_year) * 12 + month - 1
+        if not 1 <= month <= 12 or not 0 <= month_ix < len(
+                self.month_lengths) or not 0 < day <= self.month_lengths[
+                    month_ix]:
+            return None
+        return self.month_starts[month_ix] + day - 1 - self.first_ordinal
+
+    def __contains__(self, dateint):
+        return self._day_index(dateint) is not None
+
+    def _checked_day_index(self, dateint):
+        day_ix = self._day_index(dateint)
+        if day_ix is None:
+            raise KeyError(
+                '{!r} is not a valid dateint in the {}-{} range.'.format(
+                    dateint, self.first_year, self.last_year))
+        return day_ix
+
+    def to_ordinal(self, dateint):
+        """Returns the day ordinal of the given dateint.
+
+        Raises a KeyError if the dateint is invalid or out of range.
+        """
+        return self._checked_day_index(dateint) + self.first_ordinal
+
+    def to_dateint(self, ordinal):
+        """Returns the dateint of the given day ordinal.
+
+        Raises a KeyError if the ordinal is out of range.
+        """
+        if not self.first_ordinal <= ordinal <= self.last_ordinal:
+            raise KeyError(
+                'Day ordinal {!r} is not in the {}-{} range.'.format(
+                    ordinal, self.first_year, self.last_year))
+        return self.dateints[ordinal - self.first_ordinal]
+
+    def weekday(self, dateint):
+        """Returns the weekday of the given dateint, with Monday = 0."""
+        return self.weekdays[self._checked_day_index(dateint)]
+
+    def day_of_year(self, dateint):
+        """Returns the day of year of the given dateint, starting from 1."""
+        return self.days_of_year[self._checked_day_index(dateint)]
+
+    def iso_week(self, dateint):
+        """Returns the ISO 8601 week number of the given dateint."""
+        return self.iso_weeks[self._checked_day_index(dateint)]
+
+    def month_length(self, year, month):
+        """Returns the number of days in the given month."""
+        month_ix = (year - self.first_year) * 12 + month - 1
+        if not 1 <= month <= 12 or not 0 <= month_ix < len(
+                self.month_lengths):
+            raise KeyError('{}-{} is not in the {}-{} range.'.format(
+                year, month, self.first_year, self.last_year))
+        return self.month_lengths[month_ix]
+
+
+def _iso_week(monday):
+    # the ISO week of a Monday-based week is that of its Thursday, counted
+    # from the first Thursday of that Thursday's year
+    thursday = monday + 3
+    year = civil_from_days(thursday)[0]
+    return (thursday - days_from_civil(year, 1, 1)) // 7 + 1
+
+
+_CALENDAR_TABLE = []
+
+
+def get_calendar_table():
+    """Returns the shared default calendar table, building it on first use.
+
+    Returns
+    -------
+    CalendarTable
+        A calendar table covering the years 1900-2199.
+    """
+    try:
+        return _CALENDAR_TABLE[0]
+    except IndexError:
+        _CALENDAR_TABLE.append(CalendarTable())
+        return _CALENDAR_TABLE[0]
@@ -1,16 +1,33 @@
 """Datetime-related utility functions."""
 
-from datetime import datetime, timedelta, date
-import math
+from datetime import datetime, date
+from collections.abc import Sequence
+from functools import lru_cache
+from numbers import Integral
 
-from ..timestamp import get_timestamp
-from ..datetime import (
-    utc_time,
-    datetime_to_dateint,
-)
+from ..timezone import get_transition_table
+from ..clock import get_clock
 from ..constants import (
     WEEKDAYS,
+    SECONDS_IN_DAY,
+)
+from .._optional import import_numpy
+from .._civil import (
+    _DAYS_IN_MONTH,
+    checked_ordinal_to_dateint,
+    dateint_to_ordinal,
+    invalid_dateint_error,
+    dateints_to_ordinals,
 )
+from .calendar_table import get_calendar_table
+
+# 1970-01-01, the day of ordinal 0, was a Thursday; adding the offset of a
+# weekday to a day ordinal thus makes that weekday congruent to 0 modulo 7
+_WEEKDAY_OFFSETS = {
+    weekday: WEEKDAYS.index('Thursday') - ix
+    for ix, weekday in enumerate(WEEKDAYS)
+}
+_MONDAY_OFFSET = _WEEKDAY_OFFSETS['Monday']
 
 
 def decompose_dateint(dateint):
@@ -30,10 +47,8 @@ def decompose_dateint(dateint):
     day : int
         The day component of the given dateint.
     """
-    year = int(dateint / 10000)
-    leftover = dateint - year * 10000
-    month = int(leftover / 100)
-    day = leftover - month * 100
+    year, month_day = divmod(dateint, 10000)
+    month, day = divmod(month_day, 100)
     return year, month, day
 
 
@@ -58,7 +73,117 @@ def dateint_to_date(dateint):
     return date(*decompose_dateint(dateint))
 
 
-def tz_aware_dateint_to_timestamp(dateint, timezone_name):
+def is_valid_dateint(dateint):
+    """Checks whether the given object is a valid dateint.
+
+    A dateint is valid if it is an integer with exactly 8 digits depicting an
+    existing calendaric day, taking month lengths and leap years into account.
+
+    Arguments
+    ---------
+    dateint : int
+        An integer object decipting a specific calendaric day; e.g. 20161225.
+
+    Returns
+    -------
+    bool
+        True if the given object is a valid dateint, False otherwise.
+
+    Example
+    -------
+    >>> is_valid_dateint(20170228)
+    True
+    >>> is_valid_dateint(20170231)
+    False
+    >>> is_valid_dateint(2017022)
+    False
+    """
+    # the exact type check is a fast path for the common case of plain ints
+    if dateint.__class__ is not int and not isinstance(dateint, Integral):
+        return False
+    if not 10000101 <= dateint <= 99991231:
+        return False
+    month_day = dateint % 10000
+    day = month_day % 100
+    if day < 1:
+        return False
+    if day <= 28:
+        return 100 < month_day < 1300
+    month = month_day // 100
+    if month == 2:
+        year = dateint // 10000
+        return day == 29 and year % 4 == 0 and (
+            year % 100 != 0 or year % 400 == 0)
+    return 1 <= month <= 12 and day <= _DAYS_IN_MONTH[month]
+
+
+def _check_dateint(dateint):
+    if not is_valid_dateint(dateint):
+        raise invalid_dateint_error(dateint)
+
+
+# dateint functions convert between dateints and day ordinals through these
+# two, which use_calendar_table rebinds to table-backed versions; both
+# validate their arguments
+_to_ordinal = dateint_to_ordinal
+_from_ordinal = checked_ordinal_to_dateint
+
+
+def use_calendar_table(enabled=True):
+    """Sets whether dateint functions use the precomputed calendar table.
+
+    When enabled, the shared calendar table - covering the years 1900-2199 -
+    is built on first use (taking up about 0.9 MB), and functions such as
+    shift_dateint, dateint_difference, dateint_to_weekday and DateintRange
+    answer with constant-time table lookups instead of calendar arithmetic.
+    Dateints outside the table's range fall back to calendar arithmetic.
+
+    Arguments
+    ---------
+    enabled : bool, default True
+        Whether to use the calendar table.
+    """
+    global _to_ordinal, _from_ordinal  # pylint: disable=W0603
+    if not enabled:
+        _to_ordinal = dateint_to_ordinal
+        _from_ordinal = checked_ordinal_to_dateint
+        return
+    table = get_calendar_table()
+    table_day_index = table._day_index  # pylint: disable=W0212
+    first_ordinal = table.first_ordinal
+    dateints = table.dateints
+    day_count = len(dateints)
+
+    def _table_to_ordinal(dateint):
+        try:
+            day_ix = table_day_index(dateint)
+        except TypeError:
+            day_ix = None
+        if day_ix is None:
+            return dateint_to_ordinal(dateint)
+        return day_ix + first_ordinal
+
+    def _table_from_ordinal(ordinal):
+        day_ix = ordinal - first_ordinal
+        if 0 <= day_ix < day_count:
+            return dateints[day_ix]
+        return checked_ordinal_to_dateint(ordinal)
+
+    _to_ordinal = _table_to_ordinal
+    _from_ordinal = _table_from_ordinal
+
+
+def _weekday_offset(first_day):
+    try:
+        return _WEEKDAY_OFFSETS[first_day]
+    except KeyError:
+        raise ValueError(
+            '{!r} is not a weekday name; use one of {}.'.format(
+                first_day, WEEKDAYS)) from None
+
+
+def tz_aware_dateint_to_timestamp(dateint, timezone_name,
+                                  dst_policy='standard'):
     """Returns the epoch timestamp for the given timezone and dateint.
 
     Arguments
@@ -67,6 +192,9 @@ def tz_aware_dateint_to_timestamp(dateint, timezone_name):
         An integer object decipting a specific calendaric day; e.g. 20161225.
     timezone_name : str
         The name of the timezone.
+    dst_policy : str, default 'standard'
+        How to resolve a midnight skipped or repeated by a DST transition. See
+        utilitime.timestamp.get_timestamp for details.
 
     Returns
     -------
@@ -74,7 +202,14 @@ def tz_aware_dateint_to_timestamp(dateint, timezone_name):
         The timestamp corresponding to the start of the given day (so at 0
         hours, 0 minutes, etc...) at the given timezone.
     """
-    return get_timestamp(timezone_name, *decompose_dateint(dateint))
+    return _tz_aware_dateint_to_timestamp(
+        dateint, get_transition_table(timezone_name), dst_policy)
+
+
+def _tz_aware_dateint_to_timestamp_by_table(dateint, transition_table,
+                                            dst_policy):
+    return transition_table.local_to_utc(
+        _to_ordinal(dateint) * SECONDS_IN_DAY, dst_policy)
 
 
 def dateint_to_timestamp(dateint):
@@ -91,6 +226,10 @@ def dateint_to_timestamp(dateint):
         The timestamp corresponding to the start of the given day (so at 0
         hours, 0 minutes, etc...) at the local timezone.
     """
+    return _dateint_to_timestamp(dateint)
+
+
+def _dateint_to_local_timestamp(dateint):
     return int(dateint_to_datetime(dateint).timestamp())
 
 
@@ -125,10 +264,7 @@ def dateint_to_datetime(dateint):
         A timezone-unaware datetime object representing the start of the given
         day (so at 0 hours, 0 minutes, etc...) in the local timezone.
     """
-    if len(str(dateint)) != 8:
-        raise ValueError(
-            'Dateints must have exactly 8 digits; the first four representing '
-            'the year, the next two the months, and the last two the days.')
+    _check_dateint(dateint)
     year, month, day = decompose_dateint(dateint)
     return datetime(year=year, month=month, day=day)
 
@@ -157,13 +293,25 @@ def dateint_to_weekday(dateint, first_day='Monday'):
     6
     >>> dateint_to_weekday(20170214)
     1
-    >>> dateint_to_weekday(20170212, 'Sunday)
+    >>> dateint_to_weekday(20170212, 'Sunday')
     0
     >>> dateint_to_weekday(20170214, 'Sunday')
     2
     """
-    weekday_ix = dateint_to_datetime(dateint).weekday()
-    return (weekday_ix - WEEKDAYS.index(first_day)) % 7
+    return _dateint_to_weekday(dateint, first_day)
+
+
+def _dateint_to_weekday_by_ordinal(dateint, first_day):
+    return (_to_ordinal(dateint) + _weekday_offset(first_day)) % 7
+
+
+# the functions above compute their results through these, which
+# utilitime.memoization.use_memoization rebinds to memoized versions; the
+# timezone-aware one is keyed by transition table, so that its memoized
+# results are never those of a timezone backend no longer in use
+_tz_aware_dateint_to_timestamp = _tz_aware_dateint_to_timestamp_by_table
+_dateint_to_timestamp = _dateint_to_local_timestamp
+_dateint_to_weekday = _dateint_to_weekday_by_ordinal
 
 
 def dateint_to_weekday_name(dateint):
@@ -188,7 +336,7 @@ def dateint_to_weekday_name(dateint):
     >>> dateint_to_weekday_name(20170214)
     'Tuesday'
     """
-    return dateint_to_datetime(dateint).strftime("%A")
+    return WEEKDAYS[(_to_ordinal(dateint) + _MONDAY_OFFSET) % 7]
 
 
 def shift_dateint(dateint, day_shift):
@@ -198,7 +346,7 @@ def shift_dateint(dateint, day_shift):
     ---------
     dateint : int
         An integer object decipting a specific calendaric day; e.g. 20161225.
-    days : int
+    day_shift : int
         The number of days to shift the given dateint by. A negative number
         shifts the dateint backwards.
 
@@ -217,13 +365,122 @@ def shift_dateint(dateint, day_shift):
     >>> shift_dateint(20170220, 5)
     20170225
     """
-    dtime = dateint_to_datetime(dateint)
-    delta = timedelta(days=abs(day_shift))
-    if day_shift > 0:
-        dtime = dtime + delta
-    else:
-        dtime = dtime - delta
-    return datetime_to_dateint(dtime)
+    if day_shift.__class__ is not int and not isinstance(day_shift, Integral):
+        raise TypeError(
+            'Day shifts must be integers; got {!r}.'.format(day_shift))
+    # shifts staying within the first 28 days of a month need no calendar
+    if 0 < dateint % 100 + day_shift < 29:
+        _check_dateint(dateint)
+        return dateint + day_shift
+    return _from_ordinal(_to_ordinal(dateint) + day_shift)
+
+
+class DateintRange(Sequence):
+    """An immutable sequence of all dateints in a given dateint range.
+
+    The range is backed by day ordinals, so its length, membership tests,
+    indexing and slicing all take constant time, and dateints are only
+    produced when accessed.
+
+    Arguments
+    ---------
+    first_dateint : int
+        The first dateint of the range; e.g. 20161225.
+    last_dateint : int
+        The last dateint of the range, inclusive; e.g. 20170108.
+    step : int, default 1
+        The number of days between consecutive dateints in the range. A
+        negative step yields a descending range.
+
+    Example
+    -------
+    >>> days = DateintRange(20170225, 20170301)
+    >>> len(days)
+    5
+    >>> list(days)
+    [20170225, 20170226, 20170227, 20170228, 20170301]
+    >>> days[-2]
+    20170228
+    >>> 20170229 in days
+    False
+    >>> list(DateintRange(20170101, 20170131, 7))
+    [20170101, 20170108, 20170115, 20170122, 20170129]
+    """
+
+    __slots__ = ('_ordinals',)
+
+    def __init__(self, first_dateint, last_dateint, step=1):
+        if step == 0:
+            raise ValueError('DateintRange step must not be zero.')
+        first = _to_ordinal(first_dateint)
+        last = _to_ordinal(last_dateint)
+        stop = last + 1 if step > 0 else last - 1
+        self._ordinals = range(first, stop, step)
+
+    @classmethod
+    def _from_ordinals(cls, ordinals):
+        dateint_range_obj = cls.__new__(cls)
+        dateint_range_obj._ordinals = ordinals
+        return dateint_range_obj
+
+    @property
+    def step(self):
+        """The number of days between consecutive dateints in the range."""
+        return self._ordinals.step
+
+    def __len__(self):
+        return len(self._ordinals)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._from_ordinals(self._ordinals[index])
+        return _from_ordinal(self._ordinals[index])
+
+    def __iter__(self):
+        return map(_from_ordinal, self._ordinals)
+
+    def __reversed__(self):
+        return map(_from_ordinal, reversed(self._ordinals))
+
+    def _ordinal_of(self, dateint):
+        """Returns the ordinal of the given dateint, or None if it is not a
+        valid dateint."""
+        if not is_valid_dateint(dateint):
+            return None
+        return _to_ordinal(int(dateint))
+
+    def __contains__(self, dateint):
+        ordinal = self._ordinal_of(dateint)
+        return ordinal is not None and ordinal in self._ordinals
+
+    def index(self, dateint, start=0, stop=None):
+        """Returns the position of the given dateint in the range."""
+        if dateint in self:
+            position = self._ordinals.index(self._ordinal_of(dateint))
+            if position in range(len(self))[start:stop]:
+                return position
+        raise ValueError('{} is not in range'.format(dateint))
+
+    def count(self, dateint):
+        """Returns the number of occurrences of the given dateint."""
+        return int(dateint in self)
+
+    def __eq__(self, other):
+        if isinstance(other, DateintRange):
+            return self._ordinals == other._ordinals
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._ordinals)
+
+    def __repr__(self):
+        if not self._ordinals:
+            return '{}([])'.format(type(self).__name__)
+        if self.step == 1:
+            return '{}({}, {})'.format(
+                type(self).__name__, self[0], self[-1])
+        return '{}({}, {}, {})'.format(
+            type(self).__name__, self[0], self[-1], self.step)
 
 
 def dateint_range(first_dateint, last_dateint):
@@ -248,23 +505,16 @@ def dateint_range(first_dateint, last_dateint):
     >>> dateint_range(20170225, 20170301)
     [20170225, 20170226, 20170227, 20170228, 20170301]
     """
-    first_datetime = dateint_to_datetime(first_dateint)
-    last_datetime = dateint_to_datetime(last_dateint)
-    delta = last_datetime - first_datetime
-    delta_in_hours = math.ceil(delta.total_seconds() / 3600)
-    delta_in_days = math.ceil(delta_in_hours / 24) + 1
-    dateint_set = set()
-    for delta_i in range(0, delta_in_days * 24, 24):
-        datetime_i = first_datetime + timedelta(hours=delta_i)
-        dateint_i = datetime_to_dateint(datetime_i)
-        if dateint_i <= last_dateint:
-            dateint_set.add(dateint_i)
-    return sorted(dateint_set)
+    return list(DateintRange(first_dateint, last_dateint))
 
 
 def today_int():
-    """Returns the dateint for today."""
-    return datetime_to_dateint(utc_time())
+    """Returns the dateint of the current UTC day.
+
+    The day is that of the clock in use, which computes it only once a day;
+    see utilitime.clock.set_clock.
+    """
+    return get_clock().today_int()
 
 
 def dateint_week_by_dateint(dateint, first_day='Monday'):
@@ -283,10 +533,12 @@ def dateint_week_by_dateint(dateint, first_day='Monday'):
         An iterable of dateint representing all days of the week the given
         dateint belongs to.
     """
-    weekday_ix = dateint_to_weekday(dateint, first_day)
-    first_day_dateint = shift_dateint(dateint, -weekday_ix)
-    last_day_dateint = shift_dateint(first_day_dateint, 6)
-    return dateint_range(first_day_dateint, last_day_dateint)
+    ordinal = _to_ordinal(dateint)
+    first_day_ordinal = ordinal - (ordinal + _weekday_offset(first_day)) % 7
+    return [
+        _from_ordinal(first_day_ordinal + delta)
+        for delta in range(7)
+    ]
 
 
 def dateint_difference(dateint1, dateint2):
@@ -304,7 +556,253 @@ def dateint_difference(dateint1, dateint2):
     int
         The difference between the two given dateints in days.
     """
-    dt1 = dateint_to_datetime(dateint1)
-    dt2 = dateint_to_datetime(dateint2)
-    delta = dt1 - dt2
-    return abs(delta.days)
+    return abs(_to_ordinal(dateint1) - _to_ordinal(dateint2))
+
+
+# === array-aware functions ===
+
+def _as_dateint_array(dateints):
+    np = import_numpy()
+    arr = np.asarray(dateints)
+    if arr.dtype.kind not in 'iu':
+        raise TypeError(
+            'Dateint arrays must be of an integer dtype; got {}.'.format(
+                arr.dtype))
+    return arr
+
+
+def validate_dateints(dateints):
+    """Returns a boolean mask of the valid dateints in the given array.
+
+    A dateint is valid if it has exactly 8 digits and depicts an existing
+    calendaric day, taking month lengths and leap years into account.
+
+    Arguments
+    ---------
+    dateints : array-like of int
+        An integer array of dateints; e.g. numpy.array([20161225, 20170101]).
+
+    Returns
+    -------
+    numpy.ndarray
+        A boolean array which is True exactly where the given array holds a
+        valid dateint.
+
+    Example
+    -------
+    >>> validate_dateints(np.array([20170228, 20170229, 20160229, 2017011]))
+    array([ True, False,  True, False])
+    """
+    np = import_numpy()
+    arr = _as_dateint_array(dateints).astype(np.int64, copy=False)
+    years = arr // 10000
+    months = arr // 100 % 100
+    days = arr % 100
+    month_lengths = np.array(_DAYS_IN_MONTH)[np.clip(months, 0, 12)]
+    month_lengths += (months == 2) & (years % 4 == 0) & (
+        (years % 100 != 0) | (years % 400 == 0))
+    return (arr >= 10000101) & (arr <= 99991231) & (months >= 1) & (
+        months <= 12) & (days >= 1) & (days <= month_lengths)
+
+
+def _to_ordinals(dateints):
+    """Returns the day ordinals of the given dateints, after validating them.
+    """
+    np = import_numpy()
+    arr = _as_dateint_array(dateints)
+    if not validate_dateints(arr).all():
+        raise ValueError('The given array contains invalid dateints.')
+    return dateints_to_ordinals(arr.astype(np.int64))
+
+
+def decompose_dateints(dateints):
+    """Decomposes the given dateints into year, month and day arrays.
+
+    Arguments
+    ---------
+    dateints : array-like of int
+        An integer array of dateints; e.g. numpy.array([20161225, 20170101]).
+
+    Returns
+    -------
+    years : numpy.ndarray
+        The year components of the given dateints.
+    months : numpy.ndarray
+        The month components of the given dateints.
+    days : numpy.ndarray
+        The day components of the given dateints.
+
+    Example
+    -------
+    >>> decompose_dateints(np.array([20161225, 20170223]))
+    (array([2016, 2017]), array([12,  2]), array([25, 23]))
+    """
+    arr = _as_dateint_array(dateints)
+    years = arr // 10000
+    months = arr // 100 % 100
+    days = arr % 100
+    return years, months, days
+
+
+def dateints_to_dates(dateints):
+    """Converts the given dateints to an array of numpy day-resolution dates.
+
+    Arguments
+    ---------
+    dateints : array-like of int
+        An integer array of dateints; e.g. numpy.array([20161225, 20170101]).
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of dtype datetime64[D] with the corresponding dates.
+
+    Example
+    -------
+    >>> dateints_to_dates(np.array([20170223, 20170301]))
+    array(['2017-02-23', '2017-03-01'], dtype='datetime64[D]')
+    """
+    return _to_ordinals(dateints).astype('datetime64[D]')
+
+
+def dateints_to_datetimes(dateints):
+    """Converts the given dateints to an array of second-resolution datetimes.
+
+    Arguments
+    ---------
+    dateints : array-like of int
+        An integer array of dateints; e.g. numpy.array([20161225, 20170101]).
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of dtype datetime64[s], each representing the start of the
+        corresponding day (so at 0 hours, 0 minutes, etc...).
+    """
+    return dateints_to_dates(dateints).astype('datetime64[s]')
+
+
+def dateints_to_utc_timestamps(dateints):
+    """Converts the given dateints to the corresponding UTC timestamps.
+
+    Arguments
+    ---------
+    dateints : array-like of int
+        An integer array of dateints; e.g. numpy.array([20161225, 20170101]).
+
+    Returns
+    -------
+    numpy.ndarray
+        An int64 array of the UTC timestamps corresponding to the start of
+        each of the given days (so at 0 hours, 0 minutes, etc...).
+
+    Example
+    -------
+    >>> dateints_to_utc_timestamps(np.array([19700101, 19700102]))
+    array([    0, 86400])
+    """
+    np = import_numpy()
+    return dateints_to_dates(dateints).astype(np.int64) * SECONDS_IN_DAY
+
+
+def tz_aware_dateint_range_bounds(first_dateint, last_dateint, timezone_name,
+                                  dst_policy='standard'):
+    """Returns the start and end timestamps of every day in a dateint range.
+
+    Day boundaries are local midnights, correct across DST transitions; the
+    end of each day is the start of the next one, so days spanning a
+    transition last 23 or 25 hours. Results are memoized per timezone, range
+    and DST policy, and are thus returned as read-only arrays.
+
+    Arguments
+    ---------
+    first_dateint : int
+        The first dateint of the range; e.g. 20161225.
+    last_dateint : int
+        The last dateint of the range, inclusive; e.g. 20170108.
+    timezone_name : str
+        The name of the timezone.
+    dst_policy : str, default 'standard'
+        How to resolve a midnight skipped or repeated by a DST transition. See
+        utilitime.timestamp.get_timestamp for details.
+
+    Returns
+    -------
+    starts : numpy.ndarray
+        An int64 array of the timestamps at which each day of the range
+        starts in the given timezone.
+    ends : numpy.ndarray
+        An int64 array of the timestamps at which each day of the range ends,
+        exclusive, in the given timezone.
+
+    Example
+    -------
+    >>> starts, ends = tz_aware_dateint_range_bounds(
+    ...     20170323, 20170325, 'Asia/Jerusalem')
+    >>> ends - starts
+    array([86400, 82800, 86400])
+    """
+    # keyed by the transition table, so that changing the timezone backend
+    # does not return bounds computed with the previous one
+    return _day_bounds(
+        _to_ordinal(first_dateint), _to_ordinal(last_dateint),
+        get_transition_table(timezone_name), dst_policy)
+
+
+@lru_cache(maxsize=256)
+def _day_bounds(first_ordinal, last_ordinal, transition_table, dst_policy):
+    np = import_numpy()
+    local_midnights = np.arange(
+        first_ordinal, max(first_ordinal, last_ordinal + 1) + 1,
+        dtype=np.int64) * SECONDS_IN_DAY
+    bounds = transition_table.local_to_utc_times(local_midnights, dst_policy)
+    bounds.setflags(write=False)
+    return bounds[:-1], bounds[1:]
+
+
+def dateints_to_weekdays(dateints, first_day='Monday'):
+    """Returns the weekdays of the given dateints.
+
+    Arguments
+    ---------
+    dateints : array-like of int
+        An integer array of dateints; e.g. numpy.array([20161225, 20170101]).
+    first_day : str, default 'Monday'
+        The first day of the week.
+
+    Returns
+    -------
+    numpy.ndarray
+        An int8 array of the weekdays of the given dateints, when first day
+        of the week = 0, last day of the week = 6.
+
+    Example
+    -------
+    >>> dateints_to_weekdays(np.array([20170212, 20170213, 20170214]))
+    array([6, 0, 1], dtype=int8)
+    """
+    np = import_numpy()
+    offset = _weekday_offset(first_day)
+    return ((_to_ordinals(dateints) + offset) % 7).astype(np.int8)
+
+
+def dateints_to_weekday_names(dateints):
+    """Returns the weekday names of the given dateints.
+
+    Arguments
+    ---------
+    dateints : array-like of int
+        An integer array of dateints; e.g. numpy.array([20161225, 20170101]).
+
+    Returns
+    -------
+    numpy.ndarray
+        A string array of the weekday names of the given dateints.
+
+    Example
+    -------
+    >>> dateints_to_weekday_names(np.array([20170212, 20170213]))
+    array(['Sunday', 'Monday'], dtype='<U9')
+    """
+    np = import_numpy()
+    return np.array(WEEKDAYS)[dateints_to_weekdays(dateints)]
@@ -4,6 +4,8 @@ from .datetime import (
     epoch_datetime,
     utc_time,
     utc_offset_by_timezone,
+    get_utc_offset,
+    get_utc_offsets,
     localize_datetime,
     datetime_to_dateint,
     local_datetime_to_timestamp,
@@ -2,12 +2,17 @@
 
 from datetime import datetime, timezone
 
-import pytz
-from decore import lazy_property
-
+from .._lazy import lazy_property
+from ..clock import get_clock
 from ..constants import (
+    SECONDS_IN_MINUTE,
     SECONDS_IN_HOUR,
 )
+from ..timezone import (
+    get_timezone,
+    get_timezone_backend,
+    get_transition_table,
+)
 
 
 # === datetime-related functions ===
@@ -19,11 +24,11 @@ def epoch_datetime():
 
 
 def utc_time():
-    """Returns the current server time as a datetime object.
+    """Returns the current UTC time as a naive datetime object.
 
-    This assumes all servers run in UTC time.
+    The time is that of the clock in use; see utilitime.clock.set_clock.
     """
-    return datetime.utcnow()
+    return get_clock().utc_datetime()
 
 
 def utc_offset_by_timezone(timezone_name):
@@ -39,8 +44,89 @@ def utc_offset_by_timezone(timezone_name):
     int
         The UTC offset of the given timezone, in hours.
     """
-    return int(pytz.timezone(timezone_name).utcoffset(
-        utc_time()).total_seconds()/SECONDS_IN_HOUR)
+    return int(get_utc_offset(timezone_name) / SECONDS_IN_HOUR)
+
+
+_OFFSET_UNITS = {
+    'seconds': 1,
+    'minutes': SECONDS_IN_MINUTE,
+}
+
+
+def get_utc_offset(timezone_name, timestamp=None, unit='seconds'):
+    """Returns the UTC offset of the given timezone at the given time.
+
+    The offset is looked up in the transition table of the timezone, which
+    keeps the last offset looked up until the next transition of the
+    timezone; repeated lookups of the current offset thus cost little more
+    than a dictionary lookup and two comparisons.
+
+    Arguments
+    ---------
+    timezone_name: str
+        A string with a name of a timezone.
+    timestamp : int or float, optional
+        The UTC timestamp of the time of the offset. Defaults to the
+        current time of the clock in use.
+    unit : str, default 'seconds'
+        Either 'seconds' or 'minutes'. Offsets of a fraction of a minute,
+        found only in historic local mean times, are truncated.
+
+    Returns
+    -------
+    int
+        The UTC offset of the given timezone, in the given unit.
+
+    Example
+    -------
+    >>> get_utc_offset('Asia/Kolkata', 1506984924)
+    19800
+    >>> get_utc_offset('Asia/Kolkata', 1506984924, unit='minutes')
+    330
+    """
+    try:
+        divisor = _OFFSET_UNITS[unit]
+    except KeyError:
+        raise ValueError('Unsupported offset unit {!r}; use one of {}.'.format(
+            unit, ', '.join(_OFFSET_UNITS))) from None
+    if timestamp is None:
+        timestamp = get_clock().time()
+    offset = get_transition_table(timezone_name).utc_offset(timestamp)
+    if divisor == 1:
+        return offset
+    return int(offset / divisor)
+
+
+def get_utc_offsets(timezone_names, timestamp=None, unit='seconds'):
+    """Returns the UTC offsets of the given timezones at the given time.
+
+    Arguments
+    ---------
+    timezone_names: iterable of str
+        Names of timezones.
+    timestamp : int or float, optional
+        The UTC timestamp of the time of the offsets. Defaults to the
+        current time of the clock in use.
+    unit : str, default 'seconds'
+        Either 'seconds' or 'minutes'.
+
+    Returns
+    -------
+    dict
+        A mapping of each given timezone name to its UTC offset at the given
+        time, in the given unit.
+
+    Example
+    -------
+    >>> get_utc_offsets(['UTC', 'Asia/Kolkata'], 1506984924, unit='minutes')
+    {'UTC': 0, 'Asia/Kolkata': 330}
+    """
+    if timestamp is None:
+        timestamp = get_clock().time()
+    return {
+        timezone_name: get_utc_offset(timezone_name, timestamp, unit)
+        for timezone_name in timezone_names
+    }
 
 
 def localize_datetime(datetime_obj, timezone_name):
@@ -58,8 +144,13 @@ def localize_datetime(datetime_obj, timezone_name):
     datetime.datetime
         An datetime object aligned by the given timezone.
     """
-    return datetime_obj.replace(tzinfo=pytz.utc).astimezone(
-        pytz.timezone(timezone_name))
+    if get_timezone_backend().native_fromutc:
+        return datetime_obj.replace(tzinfo=timezone.utc).astimezone(
+            get_timezone(timezone_name))
+    if datetime_obj.tzinfo is not None:
+        datetime_obj = datetime_obj.replace(tzinfo=None)
+    return get_transition_table(timezone_name).localize_utc_datetime(
+        datetime_obj)
 
 
 def datetime_to_dateint(datetime_obj):
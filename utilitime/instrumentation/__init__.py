@@ -0,0 +1,15 @@
+"""Opt-in instrumentation of utilitime functions."""
+
+from .instrumentation import (
+    ENV_VAR,
+    use_instrumentation,
+    instrumentation_enabled,
+    reset_instrumentation,
+    instrumentation_snapshot,
+    instrumentation_to_prometheus,
+    write_prometheus_file,
+)
+try:
+    del instrumentation
+except NameError: # pragma: no cover
+    pass
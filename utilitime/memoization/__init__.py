@@ -0,0 +1,14 @@
+"""Opt-in memoization of utilitime conversion functions."""
+
+from .memoization import (
+    DEFAULT_MAXSIZE,
+    MEMOIZABLE_FUNCTIONS,
+    use_memoization,
+    memoized,
+    memoization_info,
+    clear_memoization,
+)
+try:
+    del memoization
+except NameError: # pragma: no cover
+    pass
@@ -0,0 +1,201 @@
+"""Opt-in memoization of pure utilitime conversion functions."""
+
+from collections import (
+    OrderedDict,
+    namedtuple,
+)
+from contextlib import contextmanager
+from copy import copy
+from functools import (
+    lru_cache,
+    wraps,
+)
+import importlib
+
+DEFAULT_MAXSIZE = 4096
+
+# the memoizable functions, by the module and name of the private function
+# they compute their results through, and a function copying results before
+# they are returned, for functions returning mutable objects
+_MEMOIZABLE = OrderedDict([
+    ('dateint_to_timestamp', (
+        'utilitime.dateint.dateint', '_dateint_to_timestamp', None)),
+    ('tz_aware_dateint_to_timestamp', (
+        'utilitime.dateint.dateint', '_tz_aware_dateint_to_timestamp',
+        None)),
+    ('dateint_to_weekday', (
+        'utilitime.dateint.dateint', '_dateint_to_weekday', None)),
+    ('timestamp_to_local_time', (
+        'utilitime.timestamp.timestamp', '_timestamp_to_local_time', copy)),
+])
+
+MEMOIZABLE_FUNCTIONS = tuple(_MEMOIZABLE)
+
+CacheInfo = namedtuple(
+    'CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+# the original function of each memoized function, by name
+_ORIGINALS = {}
+
+
+def _memoize(func, maxsize, copy_result):
+    # the number of results stored since the memo was last cleared; lru_cache
+    # counts calls which raise as misses too, though it stores nothing for
+    # them, so evictions are the stored results no longer in the memo
+    stored = [0]
+
+    @wraps(func)
+    def storing(*args):
+        result = func(*args)
+        stored[0] += 1
+        return result
+
+    memo = lru_cache(maxsize=maxsize)(storing)
+    clear_memo = memo.cache_clear
+
+    def cache_clear():
+        clear_memo()
+        stored[0] = 0
+
+    memo.cache_clear = cache_clear
+    memo.evictions = lambda: stored[0] - memo.cache_info().currsize
+    if copy_result is None:
+        return memo
+
+    @wraps(func)
+    def copying_memo(*args):
+        return copy_result(memo(*args))
+
+    copying_memo.cache_info = memo.cache_info
+    copying_memo.cache_clear = memo.cache_clear
+    copying_memo.evictions = memo.evictions
+    return copying_memo
+
+
+def _configure(sizes):
+    """Memoizes each of the given functions in a memo of the given maxsize,
+    or stops memoizing it if its maxsize is None."""
+    for name, maxsize in sizes.items():
+        module_name, attribute, copy_result = _MEMOIZABLE[name]
+        module = importlib.import_module(module_name)
+        if name in _ORIGINALS:
+            if maxsize == getattr(module, attribute).cache_info().maxsize:
+                continue
+            func = _ORIGINALS.pop(name)
+            setattr(module, attribute, func)
+        else:
+            func = getattr(module, attribute)
+        if maxsize is not None:
+            setattr(module, attribute, _memoize(func, maxsize, copy_result))
+            _ORIGINALS[name] = func
+
+
+def _requested_sizes(enabled, maxsize, maxsizes):
+    maxsizes = dict(maxsizes or {})
+    unknown = set(maxsizes) - set(_MEMOIZABLE)
+    if unknown:
+        raise ValueError(
+            'Unknown memoizable functions {}; use some of {}.'.format(
+                sorted(unknown), ', '.join(_MEMOIZABLE)))
+    sizes = {
+        name: maxsizes.get(name, maxsize) if enabled else None
+        for name in _MEMOIZABLE
+    }
+    if any(size is not None and size < 1 for size in sizes.values()):
+        raise ValueError('Memo sizes must be positive.')
+    return sizes
+
+
+def use_memoization(enabled=True, maxsize=DEFAULT_MAXSIZE, maxsizes=None):
+    """Sets whether, and how many, results of conversion functions are
+    memoized.
+
+    When enabled, the results of dateint_to_timestamp,
+    tz_aware_dateint_to_timestamp and dateint_to_weekday of the dateint
+    subpackage, and of timestamp_to_local_time of the timestamp subpackage,
+    are memoized in bounded memos, evicting least recently used results
+    first; see memoization_info for their statistics. Memos are those of
+    functools.lru_cache, so memoized results are looked up about as fast as
+    in any other cache of utilitime. Calling this again while memoization is
+    enabled resizes the memos, discarding the content of resized ones.
+
+    Results of dateint_to_timestamp depend on the timezone of the local
+    machine; call clear_memoization after changing it. Results of
+    tz_aware_dateint_to_timestamp are memoized per timezone backend.
+
+    Arguments
+    ---------
+    enabled : bool, default True
+        Whether to memoize results. Disabling memoization discards all
+        memoized results.
+    maxsize : int, default 4096
+        The maximal number of results memoized per function.
+    maxsizes : dict, optional
+        Maximal numbers of memoized results of specific functions, by their
+        names, overriding maxsize; a maxsize of None disables memoization of
+        that function only.
+
+    Example
+    -------
+    >>> use_memoization(maxsize=10000, maxsizes={'dateint_to_weekday': 500})
+    """
+    _configure(_requested_sizes(enabled, maxsize, maxsizes))
+
+
+@contextmanager
+def memoized(enabled=True, maxsize=DEFAULT_MAXSIZE, maxsizes=None):
+    """A context manager memoizing conversion functions within its context.
+
+    Takes the same arguments as use_memoization. On exit, memoization is
+    restored to its state on entry, and memos enabled on entry are restored
+    with their content, even if disabled or resized within the context.
+
+    Example
+    -------
+    >>> with memoized(maxsizes={'tz_aware_dateint_to_timestamp': 100}):
+    ...     tz_aware_dateint_to_timestamp(20170301, 'Asia/Jerusalem')
+    1488319200
+    """
+    sizes = _requested_sizes(enabled, maxsize, maxsizes)
+    previous_functions = {
+        name: getattr(importlib.import_module(module_name), attribute)
+        for name, (module_name, attribute, _) in _MEMOIZABLE.items()}
+    previous_originals = dict(_ORIGINALS)
+    _configure(sizes)
+    try:
+        yield
+    finally:
+        for name, func in previous_functions.items():
+            module_name, attribute, _ = _MEMOIZABLE[name]
+            setattr(importlib.import_module(module_name), attribute, func)
+        _ORIGINALS.clear()
+        _ORIGINALS.update(previous_originals)
+
+
+def _memos():
+    for name in _ORIGINALS:
+        module_name, attribute, _ = _MEMOIZABLE[name]
+        yield name, getattr(importlib.import_module(module_name), attribute)
+
+
+def memoization_info():
+    """Returns the statistics of the memos of memoized functions.
+
+    Returns
+    -------
+    dict
+        Maps the name of each memoized function to a named tuple of the hits,
+        misses, evictions, maxsize and currsize of its memo.
+    """
+    info = {}
+    for name, memo in _memos():
+        hits, misses, maxsize, currsize = memo.cache_info()
+        info[name] = CacheInfo(
+            hits, misses, memo.evictions(), maxsize, currsize)
+    return info
+
+
+def clear_memoization():
+    """Discards all memoized results and the statistics of all memos."""
+    for _, memo in _memos():
+        memo.cache_clear()
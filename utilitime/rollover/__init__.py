@@ -0,0 +1,13 @@
+"""Notifications of local day rollovers in any number of timezones."""
+
+from .rollover import (
+    DEFAULT_MAX_WAIT,
+    day_start,
+    RolloverSchedule,
+    RolloverNotifier,
+    AsyncRolloverNotifier,
+)
+try:
+    del rollover
+except NameError: # pragma: no cover
+    pass
@@ -0,0 +1,416 @@
+"""Notifications of local day rollovers in any number of timezones."""
+
+import heapq
+import logging
+import threading
+
+from ..clock import get_clock
+from ..constants import SECONDS_IN_DAY
+from ..datetime import get_utc_offset
+from ..dateint import (
+    shift_dateint,
+    tz_aware_dateint_to_timestamp,
+)
+from .._civil import ordinal_to_dateint
+
+_LOGGER = logging.getLogger(__name__)
+
+# the longest notifiers sleep before rechecking the clock, so that they
+# notice jumps of the wall clock, e.g. after the machine was suspended
+DEFAULT_MAX_WAIT = 60.0
+
+
+def _local_dateint(timestamp, timezone_name):
+    local = timestamp + get_utc_offset(timezone_name, timestamp)
+    return ordinal_to_dateint(int(local // SECONDS_IN_DAY))
+
+
+def day_start(dateint, timezone_name):
+    """Returns the first instant of the given local day in the given timezone.
+
+    This is the timestamp of the local midnight starting the day, or - if a
+    forward DST transition skips that midnight - of the transition. If a
+    backward transition repeats that midnight, it is its first occurrence.
+
+    Arguments
+    ---------
+    dateint : int
+        An integer object decipting a specific calendaric day; e.g. 20161225.
+    timezone_name : str
+        The name of the timezone.
+
+    Returns
+    -------
+    int
+        The timestamp of the first instant of the given day in the given
+        timezone.
+
+    Example
+    -------
+    >>> day_start(20171015, 'America/Sao_Paulo')  # 00:00 was skipped
+    1508036400
+    """
+    start = tz_aware_dateint_to_timestamp(dateint, timezone_name, 'earlier')
+    if _local_dateint(start, timezone_name) != dateint:
+        # the earlier instant is one of the previous day, before the gap
+        start = tz_aware_dateint_to_timestamp(dateint, timezone_name, 'later')
+    return start
+
+
+class RolloverSchedule:
+    """The next local day rollovers of a set of timezones, in a single heap.
+
+    Every timezone added to the schedule has a single entry in the heap, for
+    the start of its next local day; the next rollover of all timezones is
+    thus found in constant time, and rescheduling a timezone takes time
+    logarithmic in the number of timezones.
+
+    Arguments
+    ---------
+    clock : utilitime.clock.Clock, optional
+        The clock providing the current time. Defaults to the clock in use
+        when the time is read; see utilitime.clock.set_clock.
+    """
+
+    def __init__(self, clock=None):
+        self._clock = clock
+        self._heap = []
+        # the timestamp and dateint of the next rollover of each timezone;
+        # heap entries not matching these are stale, and skipped when popped
+        self._next = {}
+
+    def time(self):
+        """Returns the current time of the clock of the schedule."""
+        return (self._clock or get_clock()).time()
+
+    def __len__(self):
+        return len(self._next)
+
+    def __contains__(self, timezone_name):
+        return timezone_name in self._next
+
+    def _schedule(self, timezone_name, dateint):
+        timestamp = day_start(dateint, timezone_name)
+        self._next[timezone_name] = (timestamp, dateint)
+        heapq.heappush(self._heap, (timestamp, dateint, timezone_name))
+
+    def add(self, timezone_name):
+        """Adds the given timezone to the schedule, if not already in it."""
+        if timezone_name in self._next:
+            return
+        now = self.time()
+        dateint = shift_dateint(_local_dateint(now, timezone_name), 1)
+        if day_start(dateint, timezone_name) <= now:
+            # a backward transition repeated the midnight that started today
+            dateint = shift_dateint(dateint, 1)
+        self._schedule(timezone_name, dateint)
+
+    def discard(self, timezone_name):
+        """Removes the given timezone from the schedule, if it is in it."""
+        self._next.pop(timezone_name, None)
+        if len(self._heap) > 2 * len(self._next) + 64:
+            # drop stale entries, so that the heap does not grow unbounded
+            self._heap = [
+                entry for entry in self._heap
+                if self._next.get(entry[2]) == entry[:2]]
+            heapq.heapify(self._heap)
+
+    def next_rollover(self):
+        """Returns the timestamp of the next rollover, or None if the schedule
+        is empty."""
+        heap = self._heap
+        while heap and self._next.get(heap[0][2]) != heap[0][:2]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def pop_due(self, now=None):
+        """Returns the rollovers due by the given time, rescheduling their
+        timezones for the following rollover.
+
+        Arguments
+        ---------
+        now : int or float, optional
+            An epoch timestamp. Defaults to the current time of the clock.
+
+        Returns
+        -------
+        list of tuple
+            A (timezone_name, dateint) tuple for each due rollover, in the
+            order of their times, where dateint is the local day started.
+            Timezones missing several rollovers have a tuple for each.
+        """
+        if now is None:
+            now = self.time()
+        due = []
+        while True:
+            next_rollover = self.next_rollover()
+            if next_rollover is None or next_rollover > now:
+                return due
+            _, dateint, timezone_name = heapq.heappop(self._heap)
+            due.append((timezone_name, dateint))
+            self._schedule(timezone_name, shift_dateint(dateint, 1))
+
+
+class _BaseRolloverNotifier:
+
+    def __init__(self, clock, max_wait):
+        self._schedule = RolloverSchedule(clock)
+        self._max_wait = max_wait
+        # the callbacks subscribed to each timezone, and the futures of the
+        # asyncio tasks awaiting its next rollover
+        self._callbacks = {}
+        self._waiters = {}
+
+    def _subscribe(self, timezone_name, callback):
+        self._callbacks.setdefault(timezone_name, []).append(callback)
+        self._schedule.add(timezone_name)
+
+    def _unsubscribe(self, timezone_name, callback):
+        callbacks = self._callbacks.get(timezone_name, [])
+        try:
+            callbacks.remove(callback)
+        except ValueError:
+            raise KeyError('{!r} is not subscribed to {!r}.'.format(
+                callback, timezone_name)) from None
+        if not callbacks:
+            del self._callbacks[timezone_name]
+            if not self._waiters.get(timezone_name):
+                self._schedule.discard(timezone_name)
+
+    def _timeout(self):
+        """Returns the number of seconds to sleep until the next rollover."""
+        next_rollover = self._schedule.next_rollover()
+        if next_rollover is None:
+            return self._max_wait
+        return max(0, min(
+            next_rollover - self._schedule.time(), self._max_wait))
+
+    def _calls(self, due):
+        """Returns the callback calls of the given due rollovers."""
+        return [
+            (callback, timezone_name, dateint)
+            for timezone_name, dateint in due
+            for callback in list(self._callbacks.get(timezone_name, ()))
+        ]
+
+
+def _call_all(calls):
+    for callback, timezone_name, dateint in calls:
+        try:
+            callback(timezone_name, dateint)
+        except Exception:  # pylint: disable=W0703
+            _LOGGER.exception(
+                'Rollover callback %r failed for %s on %s.', callback,
+                timezone_name, dateint)
+
+
+class RolloverNotifier(_BaseRolloverNotifier):
+    """Calls callbacks when the local day changes, from a background thread.
+
+    A single thread sleeps until the next rollover of all subscribed
+    timezones, calls the callbacks subscribed to the timezones rolling over,
+    and sleeps again; callbacks are called with the timezone name and the
+    dateint of the local day started, and should return quickly. Exceptions
+    raised by callbacks are logged, and do not stop the notifier.
+
+    Arguments
+    ---------
+    clock : utilitime.clock.Clock, optional
+        The clock providing the current time. Defaults to the clock in use;
+        see utilitime.clock.set_clock.
+    max_wait : float, default 60
+        The longest number of seconds to sleep before rechecking the clock,
+        so that jumps of the wall clock are noticed.
+
+    Example
+    -------
+    >>> with RolloverNotifier() as notifier:
+    ...     notifier.subscribe('Asia/Tokyo', rotate_log_files)
+    ...     serve_forever()
+    """
+
+    def __init__(self, clock=None, max_wait=DEFAULT_MAX_WAIT):
+        super().__init__(clock, max_wait)
+        self._condition = threading.Condition()
+        self._thread = None
+        self._stopped = False
+
+    def subscribe(self, timezone_name, callback):
+        """Calls the given callback on every rollover in the given timezone.
+
+        Arguments
+        ---------
+        timezone_name : str
+            The name of a timezone; e.g. 'Asia/Jerusalem'.
+        callback : callable
+            Called with the timezone name and the dateint of the local day
+            started, on every rollover.
+        """
+        with self._condition:
+            self._subscribe(timezone_name, callback)
+            self._condition.notify()
+
+    def unsubscribe(self, timezone_name, callback):
+        """Stops calling the given callback on rollovers in the given
+        timezone. Raises a KeyError if it is not subscribed to it."""
+        with self._condition:
+            self._unsubscribe(timezone_name, callback)
+            self._condition.notify()
+
+    def start(self):
+        """Starts the notifier thread."""
+        with self._condition:
+            if self._thread is not None:
+                raise RuntimeError('The notifier was already started.')
+            self._thread = threading.Thread(
+                target=self._run, name='utilitime-rollover', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """Stops the notifier thread, waiting up to timeout seconds for it to
+        finish."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _run(self):
+        with self._condition:
+            while not self._stopped:
+                calls = self._calls(self._schedule.pop_due())
+                if calls:
+                    self._condition.release()
+                    try:
+                        _call_all(calls)
+                    finally:
+                        self._condition.acquire()
+                    continue
+                self._condition.wait(self._timeout())
+
+
+class AsyncRolloverNotifier(_BaseRolloverNotifier):
+    """Notifies asyncio tasks and callbacks when the local day changes.
+
+    A single timer of the event loop is set for the next rollover of all
+    timezones subscribed to or waited on; when it fires, the callbacks
+    subscribed to the timezones rolling over are called, and the tasks
+    awaiting their rollover are woken up. All methods must be called from
+    the thread running the event loop.
+
+    Arguments
+    ---------
+    clock : utilitime.clock.Clock, optional
+        The clock providing the current time. Defaults to the clock in use;
+        see utilitime.clock.set_clock.
+    max_wait : float, default 60
+        The longest number of seconds to sleep before rechecking the clock,
+        so that jumps of the wall clock are noticed.
+
+    Example
+    -------
+    >>> async with AsyncRolloverNotifier() as notifier:
+    ...     while True:
+    ...         dateint = await notifier.wait('Asia/Tokyo')
+    ...         await flush_daily_aggregates(dateint)
+    """
+
+    def __init__(self, clock=None, max_wait=DEFAULT_MAX_WAIT):
+        super().__init__(clock, max_wait)
+        self._loop = None
+        self._timer = None
+
+    def subscribe(self, timezone_name, callback):
+        """Calls the given callback on every rollover in the given timezone.
+
+        Arguments
+        ---------
+        timezone_name : str
+            The name of a timezone; e.g. 'Asia/Jerusalem'.
+        callback : callable
+            Called from the event loop with the timezone name and the dateint
+            of the local day started, on every rollover.
+        """
+        self._subscribe(timezone_name, callback)
+        self._arm()
+
+    def unsubscribe(self, timezone_name, callback):
+        """Stops calling the given callback on rollovers in the given
+        timezone. Raises a KeyError if it is not subscribed to it."""
+        self._unsubscribe(timezone_name, callback)
+        self._arm()
+
+    async def wait(self, timezone_name):
+        """Waits for the next rollover in the given timezone.
+
+        Arguments
+        ---------
+        timezone_name : str
+            The name of a timezone; e.g. 'Asia/Jerusalem'.
+
+        Returns
+        -------
+        int
+            The dateint of the local day started.
+        """
+        if self._loop is None:
+            raise RuntimeError('The notifier was not started.')
+        future = self._loop.create_future()
+        self._waiters.setdefault(timezone_name, []).append(future)
+        self._schedule.add(timezone_name)
+        self._arm()
+        return await future
+
+    def start(self):
+        """Starts the notifier on the running event loop."""
+        if self._loop is not None:
+            raise RuntimeError('The notifier was already started.')
+        # imported here, as importing asyncio takes longer than utilitime
+        import asyncio  # pylint: disable=C0415
+        self._loop = asyncio.get_running_loop()
+        self._arm()
+
+    def stop(self):
+        """Stops the notifier, cancelling the tasks awaiting rollovers."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for futures in self._waiters.values():
+            for future in futures:
+                future.cancel()
+        self._waiters.clear()
+        self._loop = None
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.stop()
+
+    def _arm(self):
+        if self._loop is None:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = self._loop.call_later(self._timeout(), self._fire)
+
+    def _fire(self):
+        self._timer = None
+        due = self._schedule.pop_due()
+        if due:
+            _call_all(self._calls(due))
+            for timezone_name, dateint in due:
+                for future in self._waiters.pop(timezone_name, ()):
+                    if not future.done():
+                        future.set_result(dateint)
+                if timezone_name not in self._callbacks:
+                    self._schedule.discard(timezone_name)
+        self._arm()
@@ -2,6 +2,7 @@
 
 from .time import (
     decompose_seconds_in_day,
+    decompose_seconds_in_days,
     seconds_in_day_to_time,
     minutes_in_day_to_time,
 )
@@ -3,8 +3,17 @@
 from datetime import time
 
 from ..constants import (
+    MINUTES_IN_DAY,
     SECONDS_IN_DAY,
 )
+from .._optional import import_numpy
+
+# the time object of every minute of the day, shared by all calls
+_MINUTE_TIMES = tuple(
+    time(*divmod(minute, 60)) for minute in range(MINUTES_IN_DAY))
+# the time object of every second of the day, allocated on first use and
+# filled as seconds are converted, so that each is only built once
+_SECOND_TIMES = []
 
 
 def decompose_seconds_in_day(seconds):
@@ -24,19 +33,20 @@ def decompose_seconds_in_day(seconds):
     second : int
         The second component of the given time of day.
     """
-    if seconds > SECONDS_IN_DAY:
+    if seconds >= SECONDS_IN_DAY:
         seconds = seconds - SECONDS_IN_DAY
     if seconds < 0:
         raise ValueError("seconds param must be non-negative!")
-    hour = int(seconds / 3600)
-    leftover = seconds - hour * 3600
-    minute = int(leftover / 60)
-    second = leftover - minute * 60
+    hour, leftover = divmod(seconds, 3600)
+    minute, second = divmod(leftover, 60)
     return hour, minute, second
 
 
 def seconds_in_day_to_time(seconds):
-    """Decomposes atime of day into hour, minute and seconds components.
+    """Decomposes a time of day into hour, minute and seconds components.
+
+    Time objects are immutable, so the same object is returned for all calls
+    with the same time of day, rather than building a new one on every call.
 
     Arguments
     ---------
@@ -53,16 +63,28 @@ def seconds_in_day_to_time(seconds):
     >>> seconds_in_day_to_time(23430)
     datetime.time(6, 30, 30)
     """
+    if seconds >= 0:
+        try:
+            time_of_day = _SECOND_TIMES[seconds]
+        except (IndexError, TypeError):
+            time_of_day = None
+        if time_of_day is not None:
+            return time_of_day
+    hour, minute, second = decompose_seconds_in_day(seconds)
     try:
-        return time(*decompose_seconds_in_day(seconds))
+        time_of_day = time(hour, minute, second)
     except ValueError:
-        print("Seconds = {}".format(seconds))
-        print("H = {}, M={}, S={}".format(*decompose_seconds_in_day(seconds)))
-        raise
+        raise ValueError(
+            "{} seconds is not a time of day; got H={}, M={}, S={}.".format(
+                seconds, hour, minute, second)) from None
+    if not _SECOND_TIMES:
+        _SECOND_TIMES.extend([None] * SECONDS_IN_DAY)
+    _SECOND_TIMES[hour * 3600 + minute * 60 + second] = time_of_day
+    return time_of_day
 
 
 def minutes_in_day_to_time(minutes):
-    """Decomposes atime of day into hour, minute and seconds components.
+    """Decomposes a time of day into hour, minute and seconds components.
 
     Arguments
     ---------
@@ -77,6 +99,50 @@ def minutes_in_day_to_time(minutes):
     Example
     -------
     >>> minutes_in_day_to_time(390)
-    datetime.time(6, 30, 00)
+    datetime.time(6, 30)
+    """
+    if minutes >= 0:
+        try:
+            return _MINUTE_TIMES[minutes]
+        except (IndexError, TypeError):
+            pass
+    return seconds_in_day_to_time(minutes * 60)
+
+
+# === array-aware functions ===
+
+def decompose_seconds_in_days(seconds):
+    """Decomposes the given seconds in day into hour, minute and second arrays.
+
+    Arguments
+    ---------
+    seconds : array-like of int
+        A numeric array of times of day, by the number of seconds passed since
+        midnight; e.g. numpy.array([23430, 86399]).
+
+    Returns
+    -------
+    hours : numpy.ndarray
+        The hour components of the given times of day.
+    minutes : numpy.ndarray
+        The minute components of the given times of day.
+    seconds : numpy.ndarray
+        The second components of the given times of day.
+
+    Example
+    -------
+    >>> decompose_seconds_in_days(np.array([23430, 86399]))
+    (array([ 6, 23]), array([30, 59]), array([30, 59]))
     """
-    return seconds_in_day_to_time(minutes*60)
+    np = import_numpy()
+    arr = np.asarray(seconds)
+    if arr.dtype.kind not in 'iuf':
+        raise TypeError(
+            'Seconds in day arrays must be of a numeric dtype; got {}.'.format(
+                arr.dtype))
+    if (arr < 0).any():
+        raise ValueError("seconds param must be non-negative!")
+    arr = arr - SECONDS_IN_DAY * (arr >= SECONDS_IN_DAY)
+    hours, leftover = np.divmod(arr, 3600)
+    minutes, seconds = np.divmod(leftover, 60)
+    return hours, minutes, seconds
@@ -2,11 +2,19 @@
 
 from .timestamp import (
     timestamp_to_local_time,
+    timestamp_to_local_datetime,
     timestamp_to_local_time_str,
+    timestamps_to_local_time_strs,
+    use_local_time_str_cache,
+    local_time_str_cache_info,
     get_timestamp,
     timestamp_to_datetime,
     tz_aware_dt_from_timestamp_and_tz,
     timestamp_to_dateint,
+    timestamps_to_dateints,
+    tz_aware_timestamps_to_dateints,
+    timestamps_to_local_times,
+    timestamps_to_local_dateints,
 )
 try:
     del timestamp
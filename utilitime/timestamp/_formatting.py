@@ -0,0 +1,308 @@
+"""Compiled formatters for Babel-style (LDML) datetime patterns.
+
+Patterns are compiled once into a function building the formatted string
+directly from the integer fields of a datetime object, using a single
+%-formatting operation. Output matches that of Babel's format_datetime with
+the en_US locale, which Delorean uses by default, for the supported pattern
+fields; patterns using any other field are not compiled.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+from math import floor
+
+from ..constants import (
+    MONTHS,
+    WEEKDAYS,
+)
+
+# named Babel formats are locale-dependent patterns, not patterns themselves
+_NAMED_FORMATS = frozenset(['short', 'medium', 'long', 'full'])
+
+_NAMESPACE = {
+    '_MONTHS': [''] + MONTHS,
+    '_MONTH_ABBRS': [''] + [month[:3] for month in MONTHS],
+    '_MONTH_LETTERS': [''] + [month[0] for month in MONTHS],
+    '_WEEKDAYS': WEEKDAYS,
+    '_WEEKDAY_ABBRS': [day[:3] for day in WEEKDAYS],
+    '_WEEKDAY_LETTERS': [day[0] for day in WEEKDAYS],
+}
+
+_NUMERIC_FIELDS = {
+    'y': 'dt.year',
+    'd': 'dt.day',
+    'D': 'dt.timetuple().tm_yday',
+    'H': 'dt.hour',
+    'h': '(dt.hour % 12 or 12)',
+    'K': 'dt.hour % 12',
+    'k': '(dt.hour or 24)',
+    'm': 'dt.minute',
+    's': 'dt.second',
+    'A': '(((dt.hour * 60 + dt.minute) * 60 + dt.second) * 1000'
+         ' + dt.microsecond // 1000)',
+}
+
+_NAME_FIELDS = {
+    'M': ('dt.month', '_MONTH_ABBRS', '_MONTHS', '_MONTH_LETTERS'),
+    'L': ('dt.month', '_MONTH_ABBRS', '_MONTHS', '_MONTH_LETTERS'),
+    'E': ('dt.weekday()', '_WEEKDAY_ABBRS', '_WEEKDAYS', '_WEEKDAY_LETTERS'),
+}
+
+
+def _field_format(char, num):
+    """Returns the %-format and expression of a pattern field, or None if the
+    field is not supported."""
+    if char == 'y' and num == 2:
+        return '%02d', 'dt.year % 100'
+    if char in _NUMERIC_FIELDS:
+        return '%0{}d'.format(num), _NUMERIC_FIELDS[char]
+    if char in _NAME_FIELDS:
+        value, abbrs, names, letters = _NAME_FIELDS[char]
+        if char != 'E' and num <= 2:
+            return '%0{}d'.format(num), value
+        if num <= 3:
+            return '%s', '{}[{}]'.format(abbrs, value)
+        if num == 4:
+            return '%s', '{}[{}]'.format(names, value)
+        if num == 5:
+            return '%s', '{}[{}]'.format(letters, value)
+        return None
+    if char == 'S':
+        # rounded, rather than truncated, exactly like Babel does
+        return '%0{}d'.format(num), (
+            'round(dt.microsecond / 1000000, {0}) * 10 ** {0}'.format(num))
+    if char == 'a' and num <= 3:
+        return '%s', "('AM' if dt.hour < 12 else 'PM')"
+    return None
+
+
+def _parse_pattern(pattern):
+    """Yields the (literal, None) and (field_char, field_length) tokens of the
+    given LDML pattern."""
+    ix = 0
+    while ix < len(pattern):
+        char = pattern[ix]
+        if char == "'":
+            if pattern.startswith("'", ix + 1):
+                yield "'", None
+                ix += 2
+                continue
+            # quoted literal text, in which '' is an escaped quote
+            ix += 1
+            literal = []
+            while True:
+                end = pattern.find("'", ix)
+                if end == -1:
+                    raise ValueError(
+                        'Unterminated quote in pattern {!r}.'.format(pattern))
+                literal.append(pattern[ix:end])
+                ix = end + 1
+                if not pattern.startswith("'", ix):
+                    break
+                literal.append("'")
+                ix += 1
+            yield ''.join(literal), None
+        elif char.isalpha() and char.isascii():
+            end = ix
+            while end < len(pattern) and pattern[end] == char:
+                end += 1
+            yield char, end - ix
+            ix = end
+        else:
+            yield char, None
+            ix += 1
+
+
+@lru_cache(maxsize=256)
+def compile_pattern(pattern):
+    """Compiles the given Babel-style pattern into a formatter function.
+
+    Arguments
+    ---------
+    pattern : str
+        An LDML datetime pattern; e.g. 'yyyy-MM-dd HH:mm:ss'.
+
+    Returns
+    -------
+    callable or None
+        A function taking a datetime object and returning it formatted by the
+        given pattern, or None if the pattern uses unsupported fields.
+
+    Example
+    -------
+    >>> compile_pattern('yyyy-MM-dd HH:mm')(datetime(2017, 3, 5, 14, 7))
+    '2017-03-05 14:07'
+    """
+    if pattern in _NAMED_FORMATS:
+        return None
+    format_parts = []
+    expressions = []
+    try:
+        tokens = list(_parse_pattern(pattern))
+    except ValueError:
+        return None
+    for token, num in tokens:
+        if num is None:
+            format_parts.append(token.replace('%', '%%'))
+            continue
+        field_format = _field_format(token, num)
+        if field_format is None:
+            return None
+        format_parts.append(field_format[0])
+        expressions.append(field_format[1])
+    source = 'lambda dt: {!r} % ({})'.format(
+        ''.join(format_parts), ''.join(
+            expression + ', ' for expression in expressions))
+    return eval(source, dict(_NAMESPACE))  # pylint: disable=W0123
+
+
+# sub-second fields, as expressions of the microsecond of the formatted time
+# and of the millisecond in day at which its second starts
+_SUBSECOND_FIELDS = {
+    'S': 'round(us / 1000000, {0}) * 10 ** {0}',
+    'A': 'ms0 + us // 1000',
+}
+
+
+@lru_cache(maxsize=256)
+def compile_split_pattern(pattern):
+    """Compiles the given pattern into per-second and sub-second formatters.
+
+    Arguments
+    ---------
+    pattern : str
+        An LDML datetime pattern; e.g. 'yyyy-MM-dd HH:mm:ss.SSS'.
+
+    Returns
+    -------
+    tuple or None
+        None if the pattern uses unsupported fields. Otherwise, if the pattern
+        has no sub-second fields, a (formatter, None) tuple, where formatter
+        is the one returned by compile_pattern. If it does, a
+        (second_formatter, subsecond_formatter) tuple: second_formatter takes
+        a datetime object and returns a template string, in which all fields
+        but the sub-second ones are formatted; subsecond_formatter takes such
+        a template, a microsecond and the millisecond in day at which the
+        second starts, and returns the fully formatted string.
+    """
+    formatter = compile_pattern(pattern)
+    if formatter is None:
+        return None
+    tokens = list(_parse_pattern(pattern))
+    if not any(token in _SUBSECOND_FIELDS for token, num in tokens if num):
+        return formatter, None
+    second_parts = []
+    second_expressions = []
+    subsecond_expressions = []
+    for token, num in tokens:
+        if num is None:
+            second_parts.append(token.replace('%', '%%%%'))
+            continue
+        field_format, expression = _field_format(token, num)
+        if token in _SUBSECOND_FIELDS:
+            second_parts.append(field_format.replace('%', '%%'))
+            subsecond_expressions.append(
+                _SUBSECOND_FIELDS[token].format(num))
+        else:
+            second_parts.append(field_format)
+            second_expressions.append(expression)
+    second_formatter = eval(  # pylint: disable=W0123
+        'lambda dt: {!r} % ({})'.format(''.join(second_parts), ''.join(
+            expression + ', ' for expression in second_expressions)),
+        dict(_NAMESPACE))
+    subsecond_formatter = eval(  # pylint: disable=W0123
+        'lambda template, us, ms0: template % ({})'.format(''.join(
+            expression + ', ' for expression in subsecond_expressions)))
+    return second_formatter, subsecond_formatter
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'currsize'])
+
+
+class LastSecondCache:
+    """A cache of the last formatted second, per timezone and pattern.
+
+    Like the time caches of logging formatters, this makes formatting bursts
+    of timestamps falling within the same second nearly free: the string of
+    the last second formatted with each timezone and pattern is kept, and is
+    either returned as is, or - for patterns with sub-second fields - has
+    just its sub-second fields formatted into it.
+
+    Hit and miss counters are updated without locking, and so are only
+    approximate when the cache is used from several threads.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def cache_info(self):
+        """Returns the hits, misses and current size of the cache."""
+        return CacheInfo(self.hits, self.misses, len(self._entries))
+
+    def clear(self):
+        """Clears the cache and its counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def format(self, timestamp, timezone_name, pattern, split_formatters,
+               to_local_datetime):
+        """Returns the given timestamp formatted in the given timezone.
+
+        Arguments
+        ---------
+        timestamp : int or float
+            The timestamp to format.
+        timezone_name : str
+            The name of the timezone of the formatted local time.
+        pattern : str
+            The LDML pattern to format by.
+        split_formatters : tuple
+            The formatters returned by compile_split_pattern for the pattern.
+        to_local_datetime : callable
+            A function taking a timestamp and a timezone name and returning
+            the corresponding timezone-aware datetime object.
+
+        Returns
+        -------
+        str
+            The formatted local time.
+        """
+        key = (timezone_name, pattern)
+        if timestamp.__class__ is int:
+            second = timestamp
+            microsecond = 0
+        else:
+            second = floor(timestamp)
+            microsecond = round((timestamp - second) * 1000000)
+            if microsecond == 1000000:
+                # rounds up to the next second; rare enough not to cache
+                dtime = to_local_datetime(timestamp, timezone_name)
+                return _format_split(dtime, split_formatters)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == second:
+            self.hits += 1
+            if entry[2] is None:
+                return entry[1]
+            return entry[2](entry[1], microsecond, entry[3])
+        self.misses += 1
+        dtime = to_local_datetime(timestamp, timezone_name)
+        formatter, subsecond_formatter = split_formatters
+        if subsecond_formatter is None:
+            formatted = formatter(dtime)
+            self._entries[key] = (second, formatted, None, None)
+            return formatted
+        template = formatter(dtime)
+        ms0 = ((dtime.hour * 60 + dtime.minute) * 60 + dtime.second) * 1000
+        self._entries[key] = (second, template, subsecond_formatter, ms0)
+        return subsecond_formatter(template, dtime.microsecond, ms0)
+
+
+def _format_split(dtime, split_formatters):
+    formatter, subsecond_formatter = split_formatters
+    if subsecond_formatter is None:
+        return formatter(dtime)
+    ms0 = ((dtime.hour * 60 + dtime.minute) * 60 + dtime.second) * 1000
+    return subsecond_formatter(formatter(dtime), dtime.microsecond, ms0)
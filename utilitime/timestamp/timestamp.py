@@ -1,17 +1,46 @@
 """Timestamp-related utility functions."""
 
 from datetime import datetime
-import calendar
+from functools import lru_cache
 
-import pytz
-from delorean import Delorean
-
-from ..datetime import datetime_to_dateint
+from ..timezone import (
+    get_timezone,
+    get_timezone_backend,
+    get_transition_table,
+)
+from ._formatting import (
+    compile_pattern,
+    compile_split_pattern,
+    LastSecondCache,
+)
+from ..constants import (
+    SECONDS_IN_MINUTE,
+    SECONDS_IN_HOUR,
+    SECONDS_IN_DAY,
+)
+from .._optional import (
+    import_numpy,
+    import_delorean,
+)
+from .._civil import (
+    MIN_DATEINT_ORDINAL,
+    MAX_DATEINT_ORDINAL,
+    checked_ordinal_to_dateint,
+    dateint_overflow_error,
+    days_from_civil,
+    days_in_month,
+    ordinals_to_dateints,
+)
 
 
 def timestamp_to_local_time(timestamp, timezone_name):
     """Convert epoch timestamp to a localized Delorean datetime object.
 
+    Delorean is an optional dependency, installed with the delorean extra,
+    and is imported on the first call of this function only. Use
+    timestamp_to_local_datetime to get a timezone-aware datetime object
+    without the cost of creating Delorean objects.
+
     Arguments
     ---------
     timestamp : int
@@ -24,14 +53,93 @@ def timestamp_to_local_time(timestamp, timezone_name):
     delorean.Delorean
         A localized Delorean datetime object.
     """
+    return _timestamp_to_local_time(timestamp, timezone_name)
+
+
+def _timestamp_to_delorean(timestamp, timezone_name):
+    delorean = import_delorean()
     # first convert timestamp to UTC
     utc_time = datetime.utcfromtimestamp(float(timestamp))
-    delo = Delorean(utc_time, timezone='UTC')
+    delo = delorean.Delorean(utc_time, timezone='UTC')
     # shift d according to input timezone
     localized_d = delo.shift(timezone_name)
     return localized_d
 
 
+# utilitime.memoization.use_memoization rebinds this to a memoized version,
+# returning copies of memoized Delorean objects, as these are mutable
+_timestamp_to_local_time = _timestamp_to_delorean
+
+
+def timestamp_to_local_datetime(timestamp, timezone_name):
+    """Convert epoch timestamp to a localized timezone-aware datetime object.
+
+    Arguments
+    ---------
+    timestamp : int
+        The timestamp to convert.
+    timezone_name : str
+        The name of the timezone of the desired local time.
+
+    Returns
+    -------
+    datetime.datetime
+        A timezone-aware datetime object in the given timezone. Its tzinfo
+        is the timezone object of the timezone backend in use; see
+        utilitime.timezone.set_timezone_backend.
+
+    Example
+    -------
+    >>> dtime = timestamp_to_local_datetime(1506984924, 'Asia/Jerusalem')
+    >>> dtime.isoformat()
+    '2017-10-03T01:55:24+03:00'
+    >>> dtime.tzinfo  # with the default, zoneinfo backend
+    zoneinfo.ZoneInfo(key='Asia/Jerusalem')
+    """
+    if get_timezone_backend().native_fromutc:
+        return datetime.fromtimestamp(timestamp, get_timezone(timezone_name))
+    return get_transition_table(timezone_name).local_datetime(timestamp)
+
+
+_LAST_SECOND_CACHE = None
+
+
+def use_local_time_str_cache(enabled=True):
+    """Sets whether formatted local times are memoized per second.
+
+    When enabled, the string of the last second formatted by
+    timestamp_to_local_time_str for each timezone and pattern is cached, so
+    that formatting further timestamps in the same second - common in bursty
+    event streams - only formats their sub-second fields, if any, into it.
+    Patterns that fall back to Delorean are not cached.
+
+    Arguments
+    ---------
+    enabled : bool, default True
+        Whether to use the cache. Disabling it discards its content.
+    """
+    global _LAST_SECOND_CACHE  # pylint: disable=W0603
+    if not enabled:
+        _LAST_SECOND_CACHE = None
+    elif _LAST_SECOND_CACHE is None:
+        _LAST_SECOND_CACHE = LastSecondCache()
+
+
+def local_time_str_cache_info():
+    """Returns the statistics of the per-second local time string cache.
+
+    Returns
+    -------
+    CacheInfo or None
+        A named tuple of the hits, misses and currsize - the number of cached
+        timezone and pattern pairs - of the cache, or None if the cache is not
+        in use.
+    """
+    if _LAST_SECOND_CACHE is None:
+        return None
+    return _LAST_SECOND_CACHE.cache_info()
+
+
 def timestamp_to_local_time_str(
         timestamp, timezone_name, fmt="yyyy-MM-dd HH:mm:ss"):
     """Convert epoch timestamp to a localized datetime string.
@@ -43,24 +151,101 @@ def timestamp_to_local_time_str(
     timezone_name : datetime.timezone
         The timezone of the desired local time.
     fmt : str
-        The format of the output string.
+        The format of the output string, as a Babel-style pattern. Patterns
+        are compiled into cached formatters, unless they use fields other than
+        years, months, days, weekdays, hours, minutes, seconds, fractional
+        seconds and AM/PM markers, in which case Delorean - installed with
+        the delorean extra - is used.
 
     Returns
     -------
     str
         The localized datetime string.
     """
-    localized_d = timestamp_to_local_time(timestamp, timezone_name)
-    localized_datetime_str = localized_d.format_datetime(fmt)
-    return localized_datetime_str
+    if _LAST_SECOND_CACHE is not None:
+        split_formatters = compile_split_pattern(fmt)
+        if split_formatters is not None:
+            return _LAST_SECOND_CACHE.format(
+                timestamp, timezone_name, fmt, split_formatters,
+                timestamp_to_local_datetime)
+    formatter = compile_pattern(fmt)
+    if formatter is None:
+        localized_d = timestamp_to_local_time(timestamp, timezone_name)
+        return localized_d.format_datetime(fmt)
+    return formatter(timestamp_to_local_datetime(timestamp, timezone_name))
+
 
+def timestamps_to_local_time_strs(
+        timestamps, timezone_name, fmt="yyyy-MM-dd HH:mm:ss"):
+    """Convert epoch timestamps to localized datetime strings.
 
-def get_timestamp(timezone_name, year, month, day, hour=0, minute=0):
-    """Epoch timestamp from timezone, year, month, day, hour and minute."""
-    tz = pytz.timezone(timezone_name)
-    tz_datetime = tz.localize(datetime(year, month, day, hour, minute))
-    timestamp = calendar.timegm(tz_datetime.utctimetuple())
-    return timestamp
+    Arguments
+    ---------
+    timestamps : iterable of int
+        The timestamps to convert; e.g. a list or a numpy array.
+    timezone_name : str
+        The name of the timezone of the desired local time.
+    fmt : str
+        The format of the output strings, as a Babel-style pattern. See
+        timestamp_to_local_time_str for details.
+
+    Returns
+    -------
+    list of str
+        The localized datetime strings, in the order of the given timestamps.
+    """
+    formatter = compile_pattern(fmt)
+    if formatter is None or _LAST_SECOND_CACHE is not None:
+        return [
+            timestamp_to_local_time_str(timestamp, timezone_name, fmt)
+            for timestamp in timestamps
+        ]
+    if hasattr(timestamps, 'tolist'):
+        timestamps = timestamps.tolist()
+    if get_timezone_backend().native_fromutc:
+        tz = get_timezone(timezone_name)
+        fromtimestamp = datetime.fromtimestamp
+        return [
+            formatter(fromtimestamp(timestamp, tz))
+            for timestamp in timestamps]
+    local_datetime = get_transition_table(timezone_name).local_datetime
+    return [formatter(local_datetime(timestamp)) for timestamp in timestamps]
+
+
+def get_timestamp(timezone_name, year, month, day, hour=0, minute=0,
+                  dst_policy='standard'):
+    """Epoch timestamp from timezone, year, month, day, hour and minute.
+
+    Arguments
+    ---------
+    timezone_name : str
+        The name of the timezone of the given local time.
+    year, month, day, hour, minute : int
+        The components of the local time.
+    dst_policy : str, default 'standard'
+        How to resolve local times which do not exist or are ambiguous due to
+        DST transitions; one of 'standard', 'dst', 'earlier', 'later' and
+        'raise'. The default, 'standard', resolves them like pytz's localize
+        does by default. See utilitime.timezone.TransitionTable for details.
+
+    Returns
+    -------
+    int
+        The UTC timestamp of the given local time.
+
+    Example
+    -------
+    >>> get_timestamp('Asia/Jerusalem', 2017, 10, 3, 1, 55)
+    1506984900
+    """
+    if not (1 <= month <= 12 and 1 <= day <= days_in_month(year, month)
+            and 0 <= hour < 24 and 0 <= minute < 60):
+        raise ValueError('Invalid local time {}-{}-{} {}:{}.'.format(
+            year, month, day, hour, minute))
+    local_time = days_from_civil(year, month, day) * SECONDS_IN_DAY \
+        + hour * SECONDS_IN_HOUR + minute * SECONDS_IN_MINUTE
+    return get_transition_table(timezone_name).local_to_utc(
+        local_time, dst_policy)
 
 
 def timestamp_to_datetime(timestamp):
@@ -81,7 +266,9 @@ def timestamp_to_datetime(timestamp):
 
 def tz_aware_dt_from_timestamp_and_tz(timestamp, timezone_name):
     """Creates a timezone-aware datetime object from given timestamp and
-    timezone."""
+    timezone, given either as a tzinfo object or by name."""
+    if isinstance(timezone_name, str):
+        return timestamp_to_local_datetime(timestamp, timezone_name)
     return datetime.fromtimestamp(timestamp, timezone_name)
 
 
@@ -99,16 +286,235 @@ def timestamp_to_dateint(timestamp):
         An integer object decipting the calendaric day - e.g. 20161225 -
         corresponding to the given timestamp.
     """
-    return datetime_to_dateint(timestamp_to_datetime(timestamp))
+    return _efficient_timestamp_to_dateint(timestamp)
+
+
+# timestamps usually cluster around a limited number of days, so the day
+# conversions are memoized; 4096 days cover over a decade of distinct days
+_ordinal_to_dateint = lru_cache(maxsize=4096)(checked_ordinal_to_dateint)
+
+
+def _efficient_timestamp_to_dateint(timestamp):
+    """Converts a UTC timestamp to a dateint using integer arithmetic only.
+
+    Raises an OverflowError for timestamps of days before 1000-01-01 or after
+    9999-12-31, which have no valid, 8-digit dateint.
+    """
+    return _ordinal_to_dateint(int(timestamp // SECONDS_IN_DAY))
+
+
+_UNIT_TICKS_IN_DAY = {
+    's': SECONDS_IN_DAY,
+    'ms': SECONDS_IN_DAY * 10 ** 3,
+    'us': SECONDS_IN_DAY * 10 ** 6,
+    'ns': SECONDS_IN_DAY * 10 ** 9,
+}
+
+
+def timestamps_to_dateints(timestamps, unit='s'):
+    """Converts an array of UTC timestamps to the dateints of their days.
+
+    Arguments
+    ---------
+    timestamps : array-like
+        An array of UTC timestamps; either numbers in the given unit, or
+        numpy datetime64 values of any unit, which are interpreted as UTC.
+    unit : str, default 's'
+        The unit of numeric timestamps; one of 's', 'ms', 'us' and 'ns'.
+        Ignored for datetime64 arrays.
+
+    Returns
+    -------
+    numpy.ndarray
+        An int32 array of the dateints - e.g. 20161225 - corresponding to the
+        given timestamps.
+
+    Example
+    -------
+    >>> timestamps_to_dateints(np.array([0, 1506984924]))
+    array([19700101, 20171002], dtype=int32)
+    >>> timestamps_to_dateints(np.array([1506984924000]), unit='ms')
+    array([20171002], dtype=int32)
+    """
+    np = import_numpy()
+    timestamps = np.asarray(timestamps)
+    if timestamps.dtype.kind == 'M':
+        if np.isnat(timestamps).any():
+            raise ValueError('Cannot convert NaT values to dateints.')
+        days = timestamps.astype('datetime64[D]').astype(np.int64)
+    else:
+        days = np.floor_divide(
+            timestamps, _ticks_in_day(unit)).astype(np.int64)
+    return _ordinals_to_dateints(days)
+
+
+def tz_aware_timestamps_to_dateints(
+        timestamps, timezones, categories=None, unit='s'):
+    """Converts UTC timestamps to the local dateints of per-row timezones.
+
+    Rows are grouped by timezone with a single stable sort; each group is
+    then converted at once by the transition table of its timezone, and the
+    results are scattered back to the original row order.
+
+    Arguments
+    ---------
+    timestamps : array-like
+        A one-dimensional array of UTC timestamps, in the given unit.
+    timezones : array-like
+        A parallel array giving the timezone of each row; either timezone
+        names or, if categories is given, integer codes indexing it. A pandas
+        Categorical of timezone names can also be given as is.
+    categories : sequence of str, optional
+        The timezone names the codes given in timezones stand for.
+    unit : str, default 's'
+        The unit of the timestamps; one of 's', 'ms', 'us' and 'ns'.
+
+    Returns
+    -------
+    numpy.ndarray
+        An int32 array of the local dateint - e.g. 20161225 - of each row.
+
+    Example
+    -------
+    >>> tz_aware_timestamps_to_dateints(
+    ...     np.array([1506984924, 1506984924]), ['Asia/Jerusalem', 'UTC'])
+    array([20171003, 20171002], dtype=int32)
+    >>> tz_aware_timestamps_to_dateints(
+    ...     np.array([1506984924, 1506984924]), np.array([1, 0]),
+    ...     categories=['Asia/Jerusalem', 'UTC'])
+    array([20171002, 20171003], dtype=int32)
+    """
+    np = import_numpy()
+    timestamps = np.asarray(timestamps)
+    if categories is None and hasattr(timezones, 'categories'):
+        categories, timezones = timezones.categories, timezones.codes
+    if categories is None:
+        categories, codes = np.unique(
+            np.asarray(timezones), return_inverse=True)
+    else:
+        codes = np.asarray(timezones)
+        if codes.dtype.kind not in 'iu':
+            raise TypeError('Timezone codes must be integers, not {}.'.format(
+                codes.dtype))
+        if codes.size and not 0 <= codes.min() <= codes.max() < len(
+                categories):
+            raise ValueError(
+                'Timezone codes must index the {} given categories.'.format(
+                    len(categories)))
+    codes = codes.reshape(-1)
+    if timestamps.ndim != 1 or codes.size != timestamps.size:
+        raise ValueError(
+            'Timestamps and timezones must be parallel one-dimensional '
+            'arrays.')
+    ticks_in_day = _ticks_in_day(unit)
+    ticks_in_second = ticks_in_day // SECONDS_IN_DAY
+    local_times = np.empty_like(timestamps, dtype=np.result_type(
+        timestamps, np.int64))
+    order = np.argsort(codes, kind='stable')
+    group_ends = np.cumsum(np.bincount(codes, minlength=len(categories)))
+    group_start = 0
+    for code, group_end in enumerate(group_ends.tolist()):
+        if group_end > group_start:
+            rows = order[group_start:group_end]
+            table = get_transition_table(str(categories[code]))
+            local_times[rows] = table.utc_to_local_times(
+                timestamps[rows], ticks_in_second)
+            group_start = group_end
+    return _ordinals_to_dateints(
+        np.floor_divide(local_times, ticks_in_day).astype(np.int64))
+
+
+def _ticks_in_day(unit):
+    try:
+        return _UNIT_TICKS_IN_DAY[unit]
+    except KeyError:
+        raise ValueError(
+            'Unsupported timestamp unit {!r}; use one of {}.'.format(
+                unit, sorted(_UNIT_TICKS_IN_DAY))) from None
 
 
-_LEAP_YEAR_SINCE_EPOCH = [1972, 1976, 1980, 1984, 1988, 1992, 1996, 2000, 2004,
-                          2008, 2012, 2016]
+def timestamps_to_local_times(timestamps, timezone_name, unit='s'):
+    """Converts an array of UTC timestamps to local wall-clock times.
+
+    This is the array counterpart of localize_datetime and
+    timestamp_to_local_datetime, converting whole arrays without creating
+    any datetime objects.
+
+    Arguments
+    ---------
+    timestamps : array-like
+        An array of UTC timestamps, in the given unit.
+    timezone_name : str
+        The name of the timezone of the desired local times.
+    unit : str, default 's'
+        The unit of the timestamps; one of 's', 'ms', 'us' and 'ns'.
+
+    Returns
+    -------
+    numpy.ndarray
+        The local wall-clock times of the given timestamps, in the same unit
+        since the epoch of the local wall clock; i.e. the timestamps of the
+        local times as if they were UTC times.
 
-_AVG_SEC_IN_YEAR = 365 * 24 * 60 * 60 + 5 * 60 * 60 + 48 * 60 + 45
+    Example
+    -------
+    >>> timestamps_to_local_times(np.array([1506984924]), 'Asia/Jerusalem')
+    array([1506995724])
+    """
+    return get_transition_table(timezone_name).utc_to_local_times(
+        timestamps, _ticks_in_day(unit) // SECONDS_IN_DAY)
+
+
+def timestamps_to_local_dateints(timestamps, timezone_name, unit='s'):
+    """Converts an array of UTC timestamps to local dateints and times of day.
+
+    Arguments
+    ---------
+    timestamps : array-like
+        An array of UTC timestamps, in the given unit.
+    timezone_name : str
+        The name of the timezone of the desired local times.
+    unit : str, default 's'
+        The unit of the timestamps; one of 's', 'ms', 'us' and 'ns'.
+
+    Returns
+    -------
+    dateints : numpy.ndarray
+        An int32 array of the local dateints - e.g. 20161225 - of the given
+        timestamps.
+    seconds_in_day : numpy.ndarray
+        An int32 array of the whole seconds elapsed since local midnight at
+        each of the given timestamps, by the local wall clock.
+
+    Example
+    -------
+    >>> timestamps_to_local_dateints(
+    ...     np.array([1506984924]), 'Asia/Jerusalem')
+    (array([20171003], dtype=int32), array([6924], dtype=int32))
+    """
+    np = import_numpy()
+    ticks_in_day = _ticks_in_day(unit)
+    local_times = timestamps_to_local_times(timestamps, timezone_name, unit)
+    days, ticks = np.divmod(local_times, ticks_in_day)
+    seconds_in_day = ticks // (ticks_in_day // SECONDS_IN_DAY)
+    return (_ordinals_to_dateints(days.astype(np.int64)),
+            seconds_in_day.astype(np.int32))
 
-# from ..constants import (SECONDS_IN_COMMON_YEAR, SECONDS_IN_LEAP_YEAR)
 
-def _efficient_timestamp_to_dateint():
-    #todo: use above constants
-    pass
+def _ordinals_to_dateints(days):
+    """Converts an array of day ordinals to an int32 array of dateints."""
+    np = import_numpy()
+    if days.size == 0:
+        return days.astype(np.int32)
+    first, last = days.min(), days.max()
+    if first < MIN_DATEINT_ORDINAL:
+        raise dateint_overflow_error(first)
+    if last > MAX_DATEINT_ORDINAL:
+        raise dateint_overflow_error(last)
+    # large arrays typically span few days, so converting each day in the
+    # span once and then gathering is much cheaper than converting each item
+    if last - first < days.size // 4:
+        dateints = ordinals_to_dateints(
+            np.arange(first, last + 1, dtype=np.int64)).astype(np.int32)
+        return dateints[days - first]
+    return ordinals_to_dateints(days).astype(np.int32)
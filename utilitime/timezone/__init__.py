@@ -0,0 +1,25 @@
+"""Timezone-related utility functions."""
+
+from .timezone import (
+    get_timezone,
+    get_timezone_backend,
+    set_timezone_backend,
+)
+from .backends import (
+    TimezoneBackend,
+    PytzBackend,
+    ZoneInfoBackend,
+)
+from .transitions import (
+    DST_POLICIES,
+    NonExistentTimeError,
+    AmbiguousTimeError,
+    TransitionTable,
+    get_transition_table,
+)
+try:
+    del timezone
+    del backends
+    del transitions
+except NameError: # pragma: no cover
+    pass
@@ -0,0 +1,98 @@
+"""Timezone backends, providing tzinfo objects by timezone name."""
+
+import abc
+
+
+class TimezoneBackend(abc.ABC):
+    """The base class of timezone backends.
+
+    A backend provides the tzinfo objects utilitime functions use for each
+    timezone name; all conversions then go through the transition tables
+    compiled from these objects, so results do not depend on the backend
+    within the range of years both cover. Backends whose tzinfo objects
+    convert UTC times to local ones faster than transition tables do - as
+    the C implementation of zoneinfo does - set native_fromutc, so that such
+    conversions use the tzinfo objects directly.
+    """
+
+    name = None
+    native_fromutc = False
+
+    @abc.abstractmethod
+    def timezone(self, timezone_name):
+        """Returns the tzinfo object of the timezone with the given name.
+
+        Arguments
+        ---------
+        timezone_name : str
+            The name of the timezone; e.g. 'Asia/Jerusalem'.
+
+        Returns
+        -------
+        datetime.tzinfo
+            The corresponding tzinfo object.
+
+        Raises
+        ------
+        KeyError
+            If no timezone of the given name is known.
+        """
+
+    def __repr__(self):
+        return '<{} timezone backend>'.format(self.name)
+
+
+class PytzBackend(TimezoneBackend):
+    """A timezone backend providing pytz timezones."""
+
+    name = 'pytz'
+
+    def __init__(self):
+        import pytz
+        self._pytz_timezone = pytz.timezone
+
+    def timezone(self, timezone_name):
+        return self._pytz_timezone(timezone_name)
+
+
+class ZoneInfoBackend(TimezoneBackend):
+    """A timezone backend providing zoneinfo timezones.
+
+    zoneinfo is part of the standard library from Python 3.9, and reads the
+    system's tz database, or that of the tzdata package. Timezones missing
+    from both are looked up in pytz, if it is installed.
+    """
+
+    name = 'zoneinfo'
+    native_fromutc = True
+
+    def __init__(self):
+        import zoneinfo
+        self._zoneinfo = zoneinfo.ZoneInfo
+        self._not_found_error = zoneinfo.ZoneInfoNotFoundError
+        self._fallback = None
+
+    def timezone(self, timezone_name):
+        try:
+            return self._zoneinfo(timezone_name)
+        except self._not_found_error as error:
+            if self._fallback is None:
+                try:
+                    self._fallback = PytzBackend()
+                except ImportError:  # pragma: no cover
+                    raise error from None
+            return self._fallback.timezone(timezone_name)
+
+
+BACKENDS = {
+    backend.name: backend for backend in (ZoneInfoBackend, PytzBackend)
+}
+
+
+def default_backend():
+    """Returns the zoneinfo backend, or the pytz one if zoneinfo is missing.
+    """
+    try:
+        return ZoneInfoBackend()
+    except ImportError:  # pragma: no cover
+        return PytzBackend()
@@ -0,0 +1,73 @@
+"""Timezone-related utility functions."""
+
+from functools import lru_cache
+
+from .backends import (
+    BACKENDS,
+    TimezoneBackend,
+    default_backend,
+)
+
+# set on first use, so that importing utilitime does not import zoneinfo
+_BACKEND = None
+
+
+def get_timezone_backend():
+    """Returns the timezone backend in use.
+
+    Returns
+    -------
+    TimezoneBackend
+        The backend providing the tzinfo objects of timezones by name.
+    """
+    global _BACKEND  # pylint: disable=W0603
+    if _BACKEND is None:
+        _BACKEND = default_backend()
+    return _BACKEND
+
+
+def set_timezone_backend(backend):
+    """Sets the timezone backend used by all utilitime functions.
+
+    The zoneinfo backend is used by default, with pytz as a fallback where
+    zoneinfo is unavailable. Setting a backend clears all caches of timezone
+    objects and of their compiled transition tables.
+
+    Arguments
+    ---------
+    backend : str or TimezoneBackend
+        Either 'zoneinfo', 'pytz' or a TimezoneBackend object.
+    """
+    global _BACKEND  # pylint: disable=W0603
+    if not isinstance(backend, TimezoneBackend):
+        try:
+            backend = BACKENDS[backend]()
+        except KeyError:
+            raise ValueError(
+                'Unknown timezone backend {!r}; use one of {}.'.format(
+                    backend, ', '.join(BACKENDS))) from None
+    _BACKEND = backend
+    get_timezone.cache_clear()
+    from .transitions import get_transition_table
+    get_transition_table.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def get_timezone(timezone_name):
+    """Returns the tzinfo object of the timezone with the given name.
+
+    Timezone objects are provided by the timezone backend in use, and are
+    cached, so repeated lookups of the same timezone cost a single dictionary
+    lookup.
+
+    Arguments
+    ---------
+    timezone_name : str
+        The name of the timezone; e.g. 'Asia/Jerusalem'.
+
+    Returns
+    -------
+    datetime.tzinfo
+        The corresponding tzinfo object.
+    """
+    return get_timezone_backend().timezone(timezone_name)
@@ -0,0 +1,479 @@
+"""Compiled UTC offset transition tables of timezones.
+
+A transition table holds the sorted UTC instants at which the UTC offset of a
+timezone changes, together with the offset and DST flag in effect from each
+of them on. Converting a UTC timestamp to local time is then a bisection and
+an addition, and converting local time back to UTC is a bisection over the
+local wall-clock starts of the same intervals, plus a subtraction.
+"""
+
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+from .timezone import get_timezone
+from .._optional import import_numpy
+
+_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+
+# UTC instants preceding and following any timestamp, bounding the first and
+# last offset intervals
+_BIG_BANG = -2 ** 63
+_BIG_CRUNCH = 2 ** 63
+
+DST_POLICIES = ('standard', 'dst', 'earlier', 'later', 'raise')
+
+
+class NonExistentTimeError(ValueError):
+    """Raised for local times skipped by a forward offset transition, when
+    the 'raise' DST policy is used."""
+
+
+class AmbiguousTimeError(ValueError):
+    """Raised for local times repeated by a backward offset transition, when
+    the 'raise' DST policy is used."""
+
+
+class TransitionTable:
+    """The UTC offset transitions of a timezone.
+
+    Local times which do not exist, falling in the gap skipped by a forward
+    transition, or which are ambiguous, falling in the overlap repeated by a
+    backward transition, are resolved by an explicit DST policy:
+
+    - 'standard' (the default) resolves overlaps to the non-DST offset and
+      gaps to the offset in effect before the transition, exactly like
+      pytz's localize with is_dst=False.
+    - 'dst' resolves overlaps to the DST offset and gaps to the offset in
+      effect after the transition, like pytz's localize with is_dst=True.
+    - 'earlier' and 'later' resolve both to the earlier and later of the two
+      corresponding UTC instants, respectively.
+    - 'raise' raises a NonExistentTimeError or an AmbiguousTimeError.
+
+    Where both or neither of the offsets of an overlap are DST ones, the
+    'standard' and 'dst' policies resolve it like 'later' and 'earlier',
+    respectively, just like pytz does.
+
+    Arguments
+    ---------
+    instants : sequence of int
+        The sorted UTC timestamps at which each offset interval starts. The
+        first one is treated as starting at the dawn of time.
+    offsets : sequence of int
+        The UTC offset, in seconds, in effect in each interval.
+    dst_flags : sequence of bool
+        Whether each interval observes daylight saving time.
+    tzinfos : sequence of datetime.tzinfo
+        The tzinfo object to attach to local datetime objects of each
+        interval.
+    """
+
+    def __init__(self, instants, offsets, dst_flags, tzinfos):
+        self.instants = [_BIG_BANG] + list(instants)[1:]
+        self.offsets = list(offsets)
+        self.dst_flags = list(dst_flags)
+        self.tzinfos = list(tzinfos)
+        if not len(self.instants) == len(self.offsets) == len(
+                self.dst_flags) == len(self.tzinfos) > 0:
+            raise ValueError(
+                'A transition table must have the same positive number of '
+                'instants, offsets, DST flags and tzinfo objects.')
+        self._local_starts = [
+            instant + offset
+            for instant, offset in zip(self.instants, self.offsets)]
+        self._local_epochs = [
+            _EPOCH.replace(tzinfo=tzinfo) + timedelta(seconds=offset)
+            for offset, tzinfo in zip(self.offsets, self.tzinfos)]
+        # local times repeated by a backward transition are told apart by
+        # their fold attribute when both intervals share a tzinfo object, as
+        # with zoneinfo; the repeated ones precede these UTC instants
+        self._fold_ends = [_BIG_BANG] + [
+            self.instants[ix] + max(
+                self.offsets[ix - 1] - self.offsets[ix], 0)
+            if self.tzinfos[ix] is self.tzinfos[ix - 1] else self.instants[ix]
+            for ix in range(1, len(self.instants))]
+        # numpy arrays of transition instants and offsets, per tick unit
+        self._arrays = {}
+        # the start, end and offset of the last offset interval looked up
+        self._last_interval = (0, 0, 0)
+
+    @classmethod
+    def from_tzinfo(cls, tz):
+        """Compiles the transition table of the given tzinfo object.
+
+        The transitions of pytz timezones are read off their internal
+        tables. Those of any other tzinfo object - such as a zoneinfo one -
+        are found by probing its offsets over the years 1850-2099, outside of
+        which the first and last offsets found are assumed to hold.
+
+        Arguments
+        ---------
+        tz : datetime.tzinfo
+            A pytz or zoneinfo timezone, or any other tzinfo object.
+
+        Returns
+        -------
+        TransitionTable
+            The transition table of the given timezone.
+        """
+        # pylint: disable=W0212
+        try:
+            transition_times = tz._utc_transition_times
+            transition_info = tz._transition_info
+        except AttributeError:
+            offset = tz.utcoffset(None)
+            if offset is None:
+                instants, offsets, dst_flags = _probe_transitions(tz)
+                return cls(instants, offsets, dst_flags, [tz] * len(offsets))
+            dst = tz.dst(None)
+            return cls(
+                [_BIG_BANG], [offset // _SECOND], [bool(dst)], [tz])
+        return cls(
+            [(time - _EPOCH) // _SECOND for time in transition_times],
+            [info[0] // _SECOND for info in transition_info],
+            [bool(info[1]) for info in transition_info],
+            [tz._tzinfos[info] for info in transition_info],
+        )
+
+    def __len__(self):
+        return len(self.instants)
+
+    def __repr__(self):
+        return '<{} of {} offset intervals>'.format(
+            type(self).__name__, len(self))
+
+    def utc_offset(self, timestamp):
+        """Returns the UTC offset, in seconds, in effect at the given time.
+
+        The offset interval of the last lookup is cached, so that looking up
+        further times before the next transition of the timezone - such as
+        the current time, in repeated lookups - skips the bisection.
+
+        Arguments
+        ---------
+        timestamp : int or float
+            A UTC timestamp.
+
+        Returns
+        -------
+        int
+            The UTC offset in effect at the given instant, in seconds.
+        """
+        start, end, offset = self._last_interval
+        if start <= timestamp < end:
+            return offset
+        start, end, offset = self.offset_interval(timestamp)
+        self._last_interval = (start, end, offset)
+        return offset
+
+    def offset_interval(self, timestamp):
+        """Returns the offset interval the given timestamp falls in.
+
+        Arguments
+        ---------
+        timestamp : int or float
+            A UTC timestamp.
+
+        Returns
+        -------
+        start : int
+            The UTC timestamp of the transition starting the interval.
+        end : int
+            The UTC timestamp of the next transition, ending the interval.
+        offset : int
+            The UTC offset in effect throughout the interval, in seconds.
+        """
+        ix = bisect_right(self.instants, timestamp) - 1
+        if ix + 1 < len(self.instants):
+            return self.instants[ix], self.instants[ix + 1], self.offsets[ix]
+        return self.instants[ix], _BIG_CRUNCH, self.offsets[ix]
+
+    def utc_to_local(self, timestamp):
+        """Returns the local wall-clock time of the given UTC timestamp.
+
+        Arguments
+        ---------
+        timestamp : int or float
+            A UTC timestamp.
+
+        Returns
+        -------
+        int or float
+            The local time at the given instant, in seconds since the epoch
+            of the local wall clock; i.e. the timestamp of the local time as
+            if it was a UTC time.
+        """
+        return timestamp + self.offsets[
+            bisect_right(self.instants, timestamp) - 1]
+
+    def local_datetime(self, timestamp):
+        """Returns a timezone-aware datetime object of the given timestamp.
+
+        Arguments
+        ---------
+        timestamp : int or float
+            A UTC timestamp.
+
+        Returns
+        -------
+        datetime.datetime
+            The local time at the given instant, aware of the timezone.
+        """
+        ix = bisect_right(self.instants, timestamp) - 1
+        local = self._local_epochs[ix] + timedelta(seconds=timestamp)
+        if timestamp < self._fold_ends[ix]:
+            return local.replace(fold=1)
+        return local
+
+    def _arrays_in_ticks(self, ticks_in_second):
+        try:
+            return self._arrays[ticks_in_second]
+        except KeyError:
+            np = import_numpy()
+            # the dawn of time is left out, so that searching for timestamps
+            # directly yields the indices of their offset intervals
+            arrays = (
+                np.array(self.instants[1:], dtype=np.int64) * ticks_in_second,
+                np.array(self.offsets, dtype=np.int64) * ticks_in_second,
+            )
+            self._arrays[ticks_in_second] = arrays
+            return arrays
+
+    def utc_to_local_times(self, timestamps, ticks_in_second=1):
+        """Returns the local wall-clock times of an array of UTC timestamps.
+
+        Offset intervals are found with numpy.searchsorted, limited to the
+        transitions within the range of the given timestamps; arrays spanning
+        no transition or a single one - the common case for a day or a month
+        of events - are converted without any search.
+
+        Arguments
+        ---------
+        timestamps : numpy.ndarray
+            An array of UTC timestamps.
+        ticks_in_second : int, default 1
+            The number of timestamp units in a second; e.g. 1000 for
+            timestamps in milliseconds.
+
+        Returns
+        -------
+        numpy.ndarray
+            The local time at each of the given instants, in the same unit
+            since the epoch of the local wall clock.
+        """
+        np = import_numpy()
+        timestamps = np.asarray(timestamps)
+        instants, offsets = self._arrays_in_ticks(ticks_in_second)
+        if timestamps.size == 0 or instants.size == 0:
+            return timestamps + offsets[0]
+        first = np.searchsorted(instants, timestamps.min(), 'right')
+        last = np.searchsorted(instants, timestamps.max(), 'right')
+        if first == last:
+            return timestamps + offsets[first]
+        if last == first + 1:
+            return timestamps + np.where(
+                timestamps < instants[first], offsets[first], offsets[last])
+        return timestamps + offsets[first + np.searchsorted(
+            instants[first:last], timestamps, 'right')]
+
+    def localize_utc_datetime(self, datetime_obj):
+        """Returns the local time of the given UTC-aligned datetime object.
+
+        Arguments
+        ---------
+        datetime_obj : datetime.datetime
+            A naive datetime object decipting a specific point in time,
+            aligned by UTC.
+
+        Returns
+        -------
+        datetime.datetime
+            The local time at the given point in time, aware of the timezone.
+        """
+        timestamp = (datetime_obj - _EPOCH) // _SECOND
+        ix = bisect_right(self.instants, timestamp) - 1
+        return (datetime_obj + timedelta(seconds=self.offsets[ix])).replace(
+            tzinfo=self.tzinfos[ix], fold=int(timestamp < self._fold_ends[ix]))
+
+    def local_to_utc(self, local_time, dst_policy='standard'):
+        """Returns the UTC timestamp of the given local wall-clock time.
+
+        Arguments
+        ---------
+        local_time : int or float
+            A local time, in seconds since the epoch of the local wall clock.
+        dst_policy : str, default 'standard'
+            How to resolve non-existent and ambiguous local times; one of
+            'standard', 'dst', 'earlier', 'later' and 'raise'. See the class
+            documentation for details.
+
+        Returns
+        -------
+        int or float
+            The UTC timestamp corresponding to the given local time.
+        """
+        ix = bisect_right(self._local_starts, local_time) - 1
+        instants = self.instants
+        offsets = self.offsets
+        timestamp = local_time - offsets[ix]
+        if ix + 1 < len(instants) and timestamp >= instants[ix + 1]:
+            return self._resolve_gap(local_time, ix, dst_policy)
+        if ix and local_time - offsets[ix - 1] < instants[ix]:
+            return self._resolve_overlap(local_time, ix, dst_policy)
+        if dst_policy not in DST_POLICIES:
+            _raise_unknown_policy(dst_policy)
+        return timestamp
+
+    def local_to_utc_times(self, local_times, dst_policy='standard'):
+        """Returns the UTC timestamps of an array of local wall-clock times.
+
+        Arguments
+        ---------
+        local_times : numpy.ndarray
+            An integer array of local times, in seconds since the epoch of
+            the local wall clock.
+        dst_policy : str, default 'standard'
+            How to resolve non-existent and ambiguous local times; one of
+            'standard', 'dst', 'earlier', 'later' and 'raise'. See the class
+            documentation for details.
+
+        Returns
+        -------
+        numpy.ndarray
+            An int64 array of the UTC timestamps of the given local times.
+        """
+        np = import_numpy()
+        if dst_policy not in DST_POLICIES:
+            _raise_unknown_policy(dst_policy)
+        local_times = np.asarray(local_times, dtype=np.int64)
+        instants, offsets = self._arrays_in_ticks(1)
+        local_starts = instants + offsets[1:]
+        ixs = np.searchsorted(local_starts, local_times, 'right')
+        timestamps = local_times - offsets[ixs]
+        # local times skipped or repeated by the transition after or before
+        # their interval are rare, and are resolved one by one
+        next_instants = np.append(instants, np.iinfo(np.int64).max)[ixs]
+        prev_offsets = offsets[np.maximum(ixs - 1, 0)]
+        prev_instants = np.insert(instants, 0, np.iinfo(np.int64).min)[ixs]
+        unclear = (timestamps >= next_instants) | (
+            (ixs > 0) & (local_times - prev_offsets < prev_instants))
+        for ix in np.flatnonzero(unclear).tolist():
+            timestamps[ix] = self.local_to_utc(
+                int(local_times[ix]), dst_policy)
+        return timestamps
+
+    def _resolve_gap(self, local_time, ix, dst_policy):
+        # the local time is skipped by the transition from interval ix to
+        # interval ix + 1, so no offset maps it back into its own interval
+        before = local_time - self.offsets[ix]
+        after = local_time - self.offsets[ix + 1]
+        if dst_policy == 'standard':
+            return before
+        if dst_policy == 'dst':
+            return after
+        if dst_policy == 'earlier':
+            return min(before, after)
+        if dst_policy == 'later':
+            return max(before, after)
+        if dst_policy == 'raise':
+            raise NonExistentTimeError(
+                'Local time {!r} does not exist, falling in a gap skipped '
+                'by an offset transition.'.format(local_time))
+        return _raise_unknown_policy(dst_policy)
+
+    def _resolve_overlap(self, local_time, ix, dst_policy):
+        # the local time is repeated by the transition from interval ix - 1
+        # to interval ix, and maps back into both
+        earlier = local_time - self.offsets[ix - 1]
+        later = local_time - self.offsets[ix]
+        if dst_policy in ('standard', 'dst'):
+            want_dst = dst_policy == 'dst'
+            earlier_dst = self.dst_flags[ix - 1]
+            if earlier_dst != self.dst_flags[ix]:
+                return earlier if earlier_dst == want_dst else later
+            return earlier if want_dst else later
+        if dst_policy == 'earlier':
+            return earlier
+        if dst_policy == 'later':
+            return later
+        if dst_policy == 'raise':
+            raise AmbiguousTimeError(
+                'Local time {!r} is ambiguous, falling in an overlap repeated '
+                'by an offset transition.'.format(local_time))
+        return _raise_unknown_policy(dst_policy)
+
+
+# the range and step of probing tzinfo objects for their transitions; the
+# transitions of the tz database are always over six days apart
+_PROBE_START = datetime(1850, 1, 1)
+_PROBE_END = datetime(2100, 1, 1)
+_PROBE_STEP = timedelta(days=3)
+
+
+def _probe_transitions(tz):
+    """Returns the instants, offsets and DST flags of the offset intervals of
+    the given tzinfo object, found by probing its UTC offsets."""
+    utcoffset = tz.utcoffset
+    # naive datetime objects are probed, as local times, since this is much
+    # faster than converting UTC times; each transition is then seen at the
+    # end of the gap or overlap it makes, where the later offset starts to
+    # apply to all local times
+    local = _PROBE_START
+    offset = utcoffset(local)
+    instants = [_BIG_BANG]
+    offsets = [offset // _SECOND]
+    dst_flags = [bool(tz.dst(local))]
+    step_seconds = _PROBE_STEP // _SECOND
+    while local < _PROBE_END:
+        probe = local + _PROBE_STEP
+        if utcoffset(probe) == offset:
+            local = probe
+            continue
+        # the first second in (local, probe] with a new offset
+        low, high = 0, step_seconds
+        while high - low > 1:
+            mid = (low + high) // 2
+            if utcoffset(local + timedelta(seconds=mid)) == offset:
+                low = mid
+            else:
+                high = mid
+        local += timedelta(seconds=high)
+        new_offset = utcoffset(local)
+        instants.append(
+            (local - _EPOCH - max(offset, new_offset)) // _SECOND)
+        offsets.append(new_offset // _SECOND)
+        dst_flags.append(bool(tz.dst(local)))
+        offset = new_offset
+    return instants, offsets, dst_flags
+
+
+def _raise_unknown_policy(dst_policy):
+    raise ValueError('Unknown DST policy {!r}; use one of {}.'.format(
+        dst_policy, ', '.join(DST_POLICIES)))
+
+
+@lru_cache(maxsize=None)
+def get_transition_table(timezone_name):
+    """Returns the compiled transition table of the given timezone.
+
+    Tables are compiled on first use and cached, so repeated conversions in
+    the same timezone cost a dictionary lookup and a bisection.
+
+    Arguments
+    ---------
+    timezone_name : str
+        The name of the timezone; e.g. 'Asia/Jerusalem'.
+
+    Returns
+    -------
+    TransitionTable
+        The transition table of the given timezone.
+
+    Example
+    -------
+    >>> table = get_transition_table('Asia/Jerusalem')
+    >>> table.utc_offset(1506984924)
+    10800
+    """
+    return TransitionTable.from_tzinfo(get_timezone(timezone_name))
@@ -1,7 +1,6 @@
 """Weekday-related utility functions."""
 
-from decore import lazy_property
-
+from .._lazy import lazy_property
 from ..constants import (
     WEEKDAYS,
 )